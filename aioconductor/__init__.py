@@ -1,13 +1,34 @@
 from .conductor import Conductor
-from .component import Component
+from .component import Component, Reference
 from .logging import (
     LoggingPolicy,
     SimpleLoggingPolicy,
     ModuleLoggingPolicy,
     ComponentLoggingPolicy,
+    QueueLoggingPolicy,
 )
-from .config import Config, ConfigPolicy, SimpleConfigPolicy
-from .exc import ComponentError, CircularDependencyError
+from .config import (
+    Config,
+    ConfigPolicy,
+    SimpleConfigPolicy,
+    LayeredConfigPolicy,
+    environ_config,
+)
+from .graph import Graph
+from .scheduler import Scheduler, SimpleScheduler, BoundedScheduler
+from .instrument import Event, Instrument
+from .profiler import Profiler
+from .health import Health, Phase, Probe
+from .metrics import Metrics, Histogram, Exporter
+from .lazy import Lazy
+from .pool import Pool
+from .scope import Scope, ScopeContext
+from .tasks import TaskGroup
+from .watchdog import Watchdog, Monitor
+from .snapshot import SnapshotStore
+from .supervisor import Supervisor, Strategy
+from .loop import LoopFactory, default_loop_factory, uvloop_factory, auto_loop_factory
+from .exc import ComponentError, CircularDependencyError, SetupError
 
 
 __version__ = "0.2"
@@ -16,13 +37,45 @@ __license__ = "BSD"
 __all__ = [
     "Conductor",
     "Component",
+    "Reference",
     "ComponentError",
     "CircularDependencyError",
+    "SetupError",
     "LoggingPolicy",
     "SimpleLoggingPolicy",
     "ModuleLoggingPolicy",
     "ComponentLoggingPolicy",
+    "QueueLoggingPolicy",
     "Config",
     "ConfigPolicy",
     "SimpleConfigPolicy",
+    "LayeredConfigPolicy",
+    "environ_config",
+    "Graph",
+    "Scheduler",
+    "SimpleScheduler",
+    "BoundedScheduler",
+    "Event",
+    "Instrument",
+    "Profiler",
+    "Health",
+    "Phase",
+    "Probe",
+    "Metrics",
+    "Histogram",
+    "Exporter",
+    "Lazy",
+    "Pool",
+    "Scope",
+    "ScopeContext",
+    "TaskGroup",
+    "Watchdog",
+    "Monitor",
+    "SnapshotStore",
+    "Supervisor",
+    "Strategy",
+    "LoopFactory",
+    "default_loop_factory",
+    "uvloop_factory",
+    "auto_loop_factory",
 ]
@@ -0,0 +1,230 @@
+"""
+Static analysis of dependency graph
+
+Imports application modules, builds dependency graph of component classes
+without constructing nor setting up any component, and prints
+its topological levels, critical path, maximum parallelism width,
+and circular dependencies (strongly connected components).
+
+Usage::
+
+    python -m aioconductor myapp.components [myapp.api:Api ...] [--format dot]
+
+Target can be a module, or an attribute of module given as ``module:name``.
+Attribute can be a component class, a list of them, or a conductor,
+components added to conductor are analyzed with its patches applied.
+Module is searched for conductors, if there is no one,
+all component classes defined in the module are analyzed.
+
+Exit code is 1, when circular dependencies are found.
+
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import typing as t
+
+from .component import Component
+from .conductor import Conductor
+from .graph import Graph, strongly_connected
+from .pool import Pool
+
+
+ComponentClass = t.Type[Component]
+
+
+class Analysis:
+    """Results of dependency graph analysis"""
+
+    components: t.List[ComponentClass]
+    dependencies: t.Dict[ComponentClass, t.Dict[str, ComponentClass]]
+    cycles: t.List[t.List[ComponentClass]]
+    graph: t.Optional[Graph[ComponentClass]]
+
+    def __init__(
+        self,
+        roots: t.Iterable[ComponentClass],
+        patches: t.Optional[t.Mapping[ComponentClass, ComponentClass]] = None,
+    ) -> None:
+        patches = patches or {}
+        self.dependencies = {}
+
+        def resolve(component_class: ComponentClass) -> t.Dict[str, ComponentClass]:
+            try:
+                return self.dependencies[component_class]
+            except KeyError:
+                dependencies = {
+                    name: patches.get(dependency, dependency)
+                    for name, dependency in component_class.__depends_on__.items()
+                }
+                self.dependencies[component_class] = dependencies
+                return dependencies
+
+        roots = [patches.get(root, root) for root in roots]
+        components = strongly_connected(roots, resolve)
+        self.components = [c for component in components for c in component]
+        self.cycles = [
+            component
+            for component in components
+            if len(component) > 1 or component[0] in resolve(component[0]).values()
+        ]
+        self.graph = None if self.cycles else Graph(roots, resolve)
+
+    @property
+    def critical_path(self) -> t.List[ComponentClass]:
+        """The longest chain of dependents in setup order"""
+        if not self.graph:
+            return []
+        height = self.graph.height
+        node = max(self.graph.order, key=height.__getitem__)
+        path = [node]
+        while height[node] > 1:
+            node = next(
+                dependent
+                for dependent in self.graph.dependents[node]
+                if height[dependent] == height[node] - 1
+            )
+            path.append(node)
+        return path
+
+    @property
+    def width(self) -> int:
+        """Maximum number of components, which can be set up concurrently"""
+        if self.graph is None:
+            return 0
+        return max((len(level) for level in self.graph.levels), default=0)
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "components": [name(c) for c in self.components],
+            "dependencies": {
+                name(c): {attr: name(d) for attr, d in dependencies.items()}
+                for c, dependencies in self.dependencies.items()
+            },
+            "levels": [
+                [name(c) for c in level]
+                for level in (self.graph.levels if self.graph else [])
+            ],
+            "critical_path": [name(c) for c in self.critical_path],
+            "width": self.width,
+            "cycles": [[name(c) for c in cycle] for cycle in self.cycles],
+        }
+
+    def as_text(self) -> str:
+        lines = [f"Components: {len(self.components)}"]
+        if self.cycles:
+            lines.append(f"Circular dependencies: {len(self.cycles)}")
+            for cycle in self.cycles:
+                lines.append(f"    {', '.join(name(c) for c in cycle)}")
+            return "\n".join(lines)
+        assert self.graph is not None
+        path = self.critical_path
+        lines.append(f"Levels: {len(self.graph.levels)}")
+        lines.append(f"Critical path: {len(path)}")
+        lines.extend(f"    {name(c)}" for c in path)
+        lines.append(f"Max parallelism: {self.width}")
+        for number, level in enumerate(self.graph.levels):
+            lines.append(f"Level {number}: {', '.join(name(c) for c in level)}")
+        return "\n".join(lines)
+
+    def as_dot(self) -> str:
+        lines = ["digraph aioconductor {", "    rankdir=BT;"]
+        for component_class in self.components:
+            style = " [style=dashed]" if component_class.__lazy__ else ""
+            lines.append(f'    "{name(component_class)}"{style};')
+        for component_class, dependencies in self.dependencies.items():
+            for attr, dependency in dependencies.items():
+                lines.append(
+                    f'    "{name(component_class)}" -> "{name(dependency)}"'
+                    f' [label="{attr}"];'
+                )
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def name(component_class: ComponentClass) -> str:
+    return f"{component_class.__module__}.{component_class.__qualname__}"
+
+
+def load(
+    targets: t.Iterable[str],
+) -> t.Tuple[t.List[ComponentClass], t.Dict[ComponentClass, ComponentClass]]:
+    """Returns root component classes and patches found by targets"""
+    roots: t.List[ComponentClass] = []
+    patches: t.Dict[ComponentClass, ComponentClass] = {}
+    for target in targets:
+        module_name, _, attr = target.partition(":")
+        module = importlib.import_module(module_name)
+        if attr:
+            objects = [getattr(module, attr)]
+        else:
+            objects = [o for o in vars(module).values() if isinstance(o, Conductor)]
+            if not objects:
+                objects = [
+                    o
+                    for o in vars(module).values()
+                    if isinstance(o, type)
+                    and issubclass(o, Component)
+                    and o.__module__ == module.__name__
+                ]
+        for obj in objects:
+            if isinstance(obj, Conductor):
+                roots.extend(
+                    dict.fromkeys(
+                        component.__class__
+                        for component in obj.components.values()
+                        if not isinstance(component, Pool)
+                    )
+                )
+                patches.update(obj.patches)
+            elif isinstance(obj, type) and issubclass(obj, Component):
+                roots.append(obj)
+            elif isinstance(obj, (list, tuple)) and all(
+                isinstance(o, type) and issubclass(o, Component) for o in obj
+            ):
+                roots.extend(obj)
+            else:
+                raise TypeError(f"{target} is neither component class nor conductor")
+    return roots, patches
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aioconductor",
+        description="Analyzes dependency graph of components",
+    )
+    parser.add_argument(
+        "targets",
+        nargs="+",
+        metavar="module[:name]",
+        help="module, component class, or conductor to analyze",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("text", "json", "dot"),
+        default="text",
+        help="output format (default: text)",
+    )
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    analysis = Analysis(*load(args.targets))
+    if args.format == "json":
+        output = json.dumps(analysis.as_dict(), indent=2)
+    elif args.format == "dot":
+        output = analysis.as_dot()
+    else:
+        output = analysis.as_text()
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 1 if analysis.cycles else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
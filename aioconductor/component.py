@@ -1,37 +1,168 @@
 import asyncio
 import logging
 import typing as t
+from concurrent.futures import Executor
+
+from .instrument import Event, Instrument
+from .tasks import TaskGroup
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from .config import Config
+    from .scheduler import Scheduler
+    from .snapshot import SnapshotStore
+
+
+R = t.TypeVar("R")
+FailureHandler = t.Callable[["Component", BaseException], None]
+
+
+class State:
+    """
+    Internal state of component
+
+    Events are created only when somebody has to wait for them,
+    list of dependents holding the component is created on first acquisition.
+
+    """
+
+    __slots__ = (
+        "active",
+        "holders",
+        "depends_on",
+        "on_failure",
+        "_activated",
+        "_released",
+    )
+
+    active: bool
+    holders: t.Optional[t.List["Component"]]
+    depends_on: t.Tuple["Component", ...]
+    on_failure: t.Optional[FailureHandler]
+
+    _activated: t.Optional[asyncio.Event]
+    _released: t.Optional[asyncio.Event]
+
+    def __init__(self) -> None:
+        self.active = False
+        self.holders = None
+        self.depends_on = ()
+        self.on_failure = None
+        self._activated = None
+        self._released = None
+
+    def activate(self) -> None:
+        self.active = True
+        if self._activated is not None:
+            self._activated.set()
+
+    def deactivate(self) -> None:
+        self.active = False
+        if self._activated is not None:
+            self._activated.clear()
+
+    async def wait_active(self) -> None:
+        if not self.active:
+            if self._activated is None:
+                self._activated = asyncio.Event()
+            await self._activated.wait()
+
+    @property
+    def refs(self) -> int:
+        return len(self.holders) if self.holders is not None else 0
+
+    def acquire(self, component: "Component") -> None:
+        if self.holders is None:
+            self.holders = [component]
+        else:
+            self.holders.append(component)
+        if self._released is not None:
+            self._released.clear()
+
+    def release(self, component: "Component") -> None:
+        if self.holders is not None and component in self.holders:
+            self.holders.remove(component)
+        if not self.refs and self._released is not None:
+            self._released.set()
+
+    async def wait_released(self) -> None:
+        if self.refs:
+            if self._released is None:
+                self._released = asyncio.Event()
+            await self._released.wait()
+
+
+class Reference:
+    """
+    Reference to keyed instance or to pool of keyed instances of component
+
+    It is created by :meth:`Component.instance` or :meth:`Component.pool`
+    and assigned to attribute annotated as dependency.
+
+    """
+
+    __slots__ = ("component_class", "key", "keys")
+
+    component_class: t.Type["Component"]
+    key: t.Hashable
+    keys: t.Optional[t.Tuple[t.Hashable, ...]]
+
+    def __init__(
+        self,
+        component_class: t.Type["Component"],
+        key: t.Hashable = None,
+        keys: t.Optional[t.Iterable[t.Hashable]] = None,
+    ) -> None:
+        self.component_class = component_class
+        self.key = key
+        self.keys = None if keys is None else tuple(keys)
+
+    def __repr__(self) -> str:
+        name = f"{self.component_class.__module__}.{self.component_class.__name__}"
+        if self.keys is None:
+            return f"<Reference {name}({self.key!r})>"
+        return f"<Reference {name}{list(self.keys)!r}>"
 
 
 class Component:
+    __slots__ = ("config", "logger", "loop", "executor", "key", "_state", "_tasks")
+
     __depends_on__: t.ClassVar[t.Dict[str, t.Type["Component"]]] = {}
+    __references__: t.ClassVar[t.Dict[str, Reference]] = {}
+    __tags__: t.ClassVar[t.Tuple[str, ...]] = ()
+    __parent_only__: t.ClassVar[bool] = False
+    __lazy__: t.ClassVar[bool] = False
+    __shutdown_timeout__: t.ClassVar[t.Optional[float]] = None
+    __shutdown_last__: t.ClassVar[bool] = False
+    __snapshot__: t.ClassVar[bool] = False
+    __scoped__: t.ClassVar[bool] = False
 
     config: "Config"
     logger: logging.Logger
     loop: asyncio.AbstractEventLoop
+    executor: t.Optional[Executor]
+    key: t.Hashable
 
-    _active: asyncio.Event
-    _released: asyncio.Event
-
-    required_by: t.Set["Component"]
-    depends_on: t.Set["Component"]
+    _state: State
+    _tasks: t.Optional[TaskGroup]
 
     def __init_subclass__(cls) -> None:
         cls.__depends_on__ = {}
+        cls.__references__ = {}
         for base in reversed(cls.__mro__):
             try:
                 annotations = base.__dict__["__annotations__"]
             except KeyError:
-                pass
-            else:
-                cls.__depends_on__.update(
-                    (attr, class_)
-                    for attr, class_ in annotations.items()
-                    if isinstance(class_, type) and issubclass(class_, Component)
-                )
+                continue
+            for attr in annotations:
+                value = base.__dict__.get(attr)
+                if isinstance(value, Reference):
+                    cls.__depends_on__[attr] = value.component_class
+                    cls.__references__[attr] = value
+                    continue
+                class_ = annotations[attr]
+                if isinstance(class_, type) and issubclass(class_, Component):
+                    cls.__depends_on__[attr] = class_
+                    cls.__references__.pop(attr, None)
 
     def __init__(
         self,
@@ -42,60 +173,307 @@ class Component:
         self.config = config
         self.logger = logger
         self.loop = loop
+        self.executor = None
+        self.key = None
 
-        self._active = asyncio.Event()
-        self._released = asyncio.Event()
-        self._released.set()
-
-        self.required_by = set()
-        self.depends_on = set()
+        self._state = State()
+        self._tasks = None
 
     def __repr__(self):
-        return f"<{self.__class__.__module__}.{self.__class__.__name__}()>"
+        key = "" if self.key is None else repr(self.key)
+        return f"<{self.__class__.__module__}.{self.__class__.__name__}({key})>"
+
+    @classmethod
+    def instance(cls, key: t.Hashable) -> t.Any:
+        """
+        Returns reference to instance of the component with the given key
+
+        ..  code-block:: python
+
+            class Users(Component):
+                shard: Redis = Redis.instance(3)
+
+        """
+        return Reference(cls, key)
+
+    @classmethod
+    def pool(cls, keys: t.Iterable[t.Hashable]) -> t.Any:
+        """
+        Returns reference to pool of instances of the component with the given keys
+
+        The pool is injected as a mapping of keys to instances, see :class:`Pool`.
+
+        ..  code-block:: python
+
+            class Users(Component):
+                shards: t.Mapping[int, Redis] = Redis.pool(range(32))
+
+        """
+        return Reference(cls, keys=keys)
+
+    @property
+    def task_group(self) -> TaskGroup:
+        """Group of background tasks of the component, see :meth:`spawn`"""
+        if self._tasks is None:
+            self._tasks = TaskGroup(self.loop, self.fail)
+        return self._tasks
+
+    def spawn(
+        self,
+        coro: t.Coroutine[t.Any, t.Any, t.Any],
+        name: t.Optional[str] = None,
+    ) -> "asyncio.Task[t.Any]":
+        """
+        Spawns background task bound to lifetime of the component
+
+        The task is cancelled and awaited on shutdown before ``on_shutdown``
+        hook, so there is no need to track it.  Failure of the task
+        is reported by :meth:`fail`.
+
+        ..  code-block:: python
+
+            async def on_setup(self) -> None:
+                self.spawn(self.poll(), name="poller")
+
+        """
+        return self.task_group.spawn(coro, name)
+
+    @property
+    def depends_on(self) -> t.Tuple["Component", ...]:
+        """Dependencies acquired by active component"""
+        return self._state.depends_on
 
     async def _acquire(self, component: "Component") -> None:
-        await self._active.wait()
-        self.required_by.add(component)
-        self._released.clear()
+        state = self._state
+        if not state.active:
+            await state.wait_active()
+        state.acquire(component)
 
-    async def _release(self, component: "Component") -> None:
-        self.required_by.remove(component)
-        if not self.required_by:
-            self._released.set()
+    def _release(self, component: "Component") -> None:
+        self._state.release(component)
 
-    async def _setup(self, depends_on: t.Dict[str, "Component"]) -> None:
-        if depends_on:
-            self.logger.info("%r: Acquiring dependencies...", self)
-            aws = []
-            for name, component in depends_on.items():
-                setattr(self, name, component)
-                self.depends_on.add(component)
-                aws.append(component._acquire(self))
-            await asyncio.gather(*aws)
-        self.logger.info("%r: Setting up...", self)
-        await self.on_setup()
-        self._active.set()
+    async def _setup(
+        self,
+        depends_on: t.Dict[str, "Component"],
+        scheduler: t.Optional["Scheduler"] = None,
+        instruments: t.Sequence[Instrument] = (),
+        executor: t.Optional[Executor] = None,
+        snapshots: t.Optional["SnapshotStore"] = None,
+        on_failure: t.Optional[FailureHandler] = None,
+    ) -> None:
+        state = self._state
+        self.executor = executor
+        state.on_failure = on_failure
+        self._notify(instruments, Event.ACQUIRING)
+        dependencies = tuple(depends_on.values())
+        acquired = 0
+        try:
+            if dependencies:
+                self.logger.info("%r: Acquiring dependencies...", self)
+                for name, component in depends_on.items():
+                    self._inject(name, component)
+                # Acquisition completes when all dependencies are active,
+                # so there is no need to spawn a task per each one.
+                for component in dependencies:
+                    await component._acquire(self)
+                    acquired += 1
+                state.depends_on = dependencies
+            self.logger.info("%r: Setting up...", self)
+            if scheduler is None:
+                self._notify(instruments, Event.SETTING_UP)
+                await self._run_setup_hooks(snapshots)
+            else:
+                async with scheduler.setup(self):
+                    self._notify(instruments, Event.SETTING_UP)
+                    await self._run_setup_hooks(snapshots)
+        except BaseException:
+            # Failed setup can be retried, so dependencies are released
+            if self._tasks is not None:
+                await self._tasks.cancel()
+            for component in dependencies[:acquired]:
+                component._release(self)
+            state.depends_on = ()
+            raise
+        state.activate()
+        self._notify(instruments, Event.ACTIVE)
         self.logger.info("%r: Active", self)
 
-    async def _shutdown(self) -> None:
-        if self.required_by:
+    async def _shutdown(
+        self,
+        scheduler: t.Optional["Scheduler"] = None,
+        instruments: t.Sequence[Instrument] = (),
+        deadline: t.Optional[float] = None,
+    ) -> bool:
+        state = self._state
+        in_time = True
+        self._notify(instruments, Event.RELEASING)
+        if state.refs:
             self.logger.info("%r: Waiting for release...", self)
-            await self._released.wait()
+            try:
+                await _wait_for(state.wait_released(), self._remains(deadline))
+            except asyncio.TimeoutError:
+                in_time = False
+                self.logger.error(
+                    "%r: Release is timed out, still required by %s",
+                    self,
+                    ", ".join(repr(component) for component in state.holders or ()),
+                )
         self.logger.info("%r: Shutting down...", self)
+        timeout = self.__shutdown_timeout__
+        if timeout is None:
+            timeout = self._remains(deadline)
         try:
-            await self.on_shutdown()
+            await _wait_for(self._on_shutdown(scheduler, instruments), timeout)
+        except asyncio.TimeoutError:
+            in_time = False
+            self.logger.error("%r: Shutdown is timed out and cancelled", self)
         except Exception:  # pragma: no cover
             self.logger.exception("%r: Unexpected error during shutdown", self)
-        if self.depends_on:
-            await asyncio.gather(
-                *(component._release(self) for component in self.depends_on)
-            )
-            self.depends_on.clear()
-        self._active.clear()
+        for component in state.depends_on:
+            component._release(self)
+        state.depends_on = ()
+        state.on_failure = None
+        state.deactivate()
+        self.executor = None
+        self._notify(instruments, Event.INACTIVE)
         self.logger.info("%r: Inactive", self)
+        return in_time
+
+    async def _run_setup_hooks(self, snapshots: t.Optional["SnapshotStore"]) -> None:
+        if not self.__snapshot__:
+            snapshots = None
+        restored = snapshots is not None and await self._restore(snapshots)
+        if self.__class__.on_setup_blocking is not Component.on_setup_blocking:
+            await self.run_blocking(self.on_setup_blocking)
+        await self.on_setup()
+        if snapshots is not None and not restored:
+            try:
+                data = self.dump_snapshot()
+                await self.loop.run_in_executor(None, snapshots.save, self, data)
+            except Exception:
+                self.logger.exception("%r: Snapshot is not saved", self)
+
+    async def _restore(self, snapshots: "SnapshotStore") -> bool:
+        # Reading and validation of snapshot file are offloaded as well as saving
+        try:
+            data = await self.loop.run_in_executor(None, snapshots.load, self)
+        except Exception:
+            self.logger.exception("%r: Snapshot is not restored", self)
+            return False
+        if data is None:
+            return False
+        try:
+            self.load_snapshot(data)
+        except Exception:
+            self.logger.exception("%r: Snapshot is not restored", self)
+            await self.loop.run_in_executor(None, snapshots.discard, self)
+            return False
+        self.logger.info("%r: Restored from snapshot", self)
+        return True
+
+    async def _on_shutdown(
+        self,
+        scheduler: t.Optional["Scheduler"],
+        instruments: t.Sequence[Instrument],
+    ) -> None:
+        if scheduler is None:
+            self._notify(instruments, Event.SHUTTING_DOWN)
+            await self._run_shutdown_hooks()
+        else:
+            async with scheduler.shutdown(self):
+                self._notify(instruments, Event.SHUTTING_DOWN)
+                await self._run_shutdown_hooks()
+
+    async def _run_shutdown_hooks(self) -> None:
+        if self._tasks is not None:
+            await self._tasks.cancel()
+        await self.on_shutdown()
+        if self.__class__.on_shutdown_blocking is not Component.on_shutdown_blocking:
+            await self.run_blocking(self.on_shutdown_blocking)
+
+    def _inject(self, name: str, component: "Component") -> None:
+        setattr(self, name, component)
+
+    def _remains(self, deadline: t.Optional[float]) -> t.Optional[float]:
+        if deadline is None:
+            return None
+        return max(deadline - self.loop.time(), 0.0)
+
+    def _notify(self, instruments: t.Sequence[Instrument], event: Event) -> None:
+        for instrument in instruments:
+            instrument(self, event)
 
     async def on_setup(self) -> None:
         """ This method should be implemented by child class """
 
     async def on_shutdown(self) -> None:
         """ This method should be implemented by child class """
+
+    def on_setup_blocking(self) -> None:
+        """
+        This method can be implemented by child class to do blocking work
+
+        It is called in executor of conductor before ``on_setup``.
+
+        """
+
+    def on_shutdown_blocking(self) -> None:
+        """
+        This method can be implemented by child class to do blocking work
+
+        It is called in executor of conductor after ``on_shutdown``.
+
+        """
+
+    def fail(self, error: BaseException) -> None:
+        """
+        Reports failure of active component
+
+        Supervised conductor restarts the component and its dependents,
+        see :class:`Supervisor`.
+
+        """
+        self.logger.error("%r: Failed", self, exc_info=error)
+        if self._state.on_failure is not None:
+            self._state.on_failure(self, error)
+
+    def dump_snapshot(self) -> bytes:
+        """
+        This method should be implemented by child class marked by ``__snapshot__``
+
+        It is called after the first setup and returns data,
+        which is derived from config and expensive to build.
+
+        """
+        raise NotImplementedError
+
+    def load_snapshot(self, data: memoryview) -> None:
+        """
+        This method should be implemented by child class marked by ``__snapshot__``
+
+        It is called before setup with data returned by ``dump_snapshot``
+        on the previous start, and should raise error if data is not valid.
+        Data is memory mapped, so it can be used without copying.
+
+        """
+        raise NotImplementedError
+
+    async def run_blocking(self, func: t.Callable[..., R], *args: t.Any) -> R:
+        """
+        Runs function in executor of conductor
+
+        Executor of conductor is a thread pool by default.
+        If it is a process pool, the function and its arguments
+        should be picklable, so it cannot be a method of component.
+
+        """
+        return await self.loop.run_in_executor(self.executor, func, *args)
+
+
+async def _wait_for(aw: t.Awaitable[t.Any], timeout: t.Optional[float]) -> None:
+    # Unlike ``asyncio.wait_for`` it does not wrap awaitable into a task,
+    # when there is no timeout.
+    if timeout is None:
+        await aw
+    else:
+        await asyncio.wait_for(aw, timeout)
@@ -1,9 +1,12 @@
 import asyncio
+import os
 import signal
 import typing as t
+from types import MappingProxyType
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from warnings import warn
 
-from .component import Component
+from .component import Component, Reference
 from .config import Config, ConfigPolicy, SimpleConfigPolicy
 from .logging import (
     Logger,
@@ -12,20 +15,55 @@ from .logging import (
     ModuleLoggingPolicy,
     get_logger,
 )
-from .exc import CircularDependencyError
+from .graph import Graph
+from .scheduler import Scheduler, SimpleScheduler
+from .instrument import Instrument
+from .health import Health
+from .lazy import Lazy
+from .pool import Pool, PoolKey
+from .scope import Scope
+from .snapshot import SnapshotStore
+from .exc import ComponentError, SetupError
+from .supervisor import Supervisor
+from .loop import LoopFactory, default_loop_factory, current_loop, close_loop
 
 
 T = t.TypeVar("T", bound=Component)
+ExecutorFactory = t.Callable[[t.Optional[int]], Executor]
+
+_POOL_CONFIG: Config = MappingProxyType({})
 
 
 class Conductor:
     config_policy: ConfigPolicy
     logging_policy: LoggingPolicy
+    scheduler: Scheduler
+    instruments: t.List[Instrument]
+    shutdown_timeout: t.Optional[float]
+    drain_delay: float
+    health: Health
     logger: Logger
     loop: asyncio.AbstractEventLoop
+    loop_factory: LoopFactory
+    executor_factory: ExecutorFactory
+    executor_workers: t.Optional[int]
+    executor: t.Optional[Executor]
+    snapshots: t.Optional[SnapshotStore]
+    supervisor: t.Optional[Supervisor]
 
     patches: t.Dict[t.Type[Component], t.Type[Component]]
-    components: t.Dict[t.Type[Component], Component]
+    components: t.Dict[t.Any, Component]
+
+    _graph: t.Optional[Graph[Component]]
+    _setups: t.Dict[Component, asyncio.Future]
+    _added: t.Set[t.Any]
+    _owns_loop: bool
+    _process_executor: bool
+    _shared: t.Set[Component]
+    _restarts: t.Set["asyncio.Task[None]"]
+    _restarting: t.Set[Component]
+    _scopes: t.Dict[t.Tuple[t.Type[Component], ...], Scope]
+    _reloading: t.Optional["asyncio.Task[None]"]
 
     def __init__(
         self,
@@ -33,8 +71,43 @@ class Conductor:
         logging_policy: t.Optional[LoggingPolicy] = None,
         config: t.Optional[Config] = None,
         logger: t.Optional[Logger] = None,
-        loop: asyncio.AbstractEventLoop = None,
+        loop: t.Optional[asyncio.AbstractEventLoop] = None,
+        scheduler: t.Optional[Scheduler] = None,
+        instruments: t.Optional[t.Sequence[Instrument]] = None,
+        shutdown_timeout: t.Optional[float] = None,
+        loop_factory: t.Optional[LoopFactory] = None,
+        executor_factory: t.Optional[ExecutorFactory] = None,
+        executor_workers: t.Optional[int] = None,
+        snapshots: t.Optional[SnapshotStore] = None,
+        supervisor: t.Optional[Supervisor] = None,
+        drain_delay: float = 0.0,
     ) -> None:
+        """
+        Conductor uses the given ``loop``, or the running one,
+        or the current one set by ``asyncio.set_event_loop``,
+        or creates its own by ``loop_factory`` (``asyncio.new_event_loop``
+        by default, see also :func:`auto_loop_factory`, which prefers uvloop).
+        Its own loop is closed, when ``run`` or ``serve`` is done,
+        and the next call creates new one.
+
+        Blocking hooks of components are run in executor, which is created
+        on setup by ``executor_factory(executor_workers)``
+        (``ThreadPoolExecutor`` by default) and disposed on shutdown.
+        Blocking hooks change component, so they cannot be run in other process:
+        component with blocking hooks cannot be added, if executor factory
+        is ``ProcessPoolExecutor``.
+
+        Components marked by ``__snapshot__`` attribute are restored
+        from ``snapshots`` store, see :class:`SnapshotStore`.
+
+        Failed components are restarted by ``supervisor``,
+        see :class:`Supervisor`.
+
+        On SIGINT or SIGTERM ``serve`` turns readiness off (see :class:`Health`)
+        and keeps serving for ``drain_delay`` seconds before shutdown,
+        so that load balancers can notice it.
+
+        """
         if config is not None:
             warn(
                 "Parameter ``config`` is deprecated, "
@@ -56,10 +129,39 @@ class Conductor:
                 logging_policy = ModuleLoggingPolicy()
         self.config_policy = config_policy
         self.logging_policy = logging_policy
+        self.scheduler = scheduler or SimpleScheduler()
+        self.instruments = list(instruments or ())
+        self.shutdown_timeout = shutdown_timeout
+        self.drain_delay = drain_delay
+        self.health = Health()
         self.logger = logger or get_logger("aioconductor")
-        self.loop = loop or asyncio.get_event_loop()
+        self.loop_factory = loop_factory or default_loop_factory
+        self._owns_loop = False
+        if loop is None:
+            loop = current_loop()
+        if loop is None:
+            loop = self.loop_factory()
+            asyncio.set_event_loop(loop)
+            self._owns_loop = True
+        self.loop = loop
+        self.executor_factory = executor_factory or ThreadPoolExecutor
+        self._process_executor = isinstance(self.executor_factory, type) and issubclass(
+            self.executor_factory, ProcessPoolExecutor
+        )
+        self.executor_workers = executor_workers
+        self.executor = None
+        self.snapshots = snapshots
+        self.supervisor = supervisor
         self.patches = {}
         self.components = {}
+        self._graph = None
+        self._setups = {}
+        self._added = set()
+        self._shared = set()
+        self._restarts = set()
+        self._restarting = set()
+        self._scopes = {}
+        self._reloading = None
 
     def patch(
         self,
@@ -67,62 +169,541 @@ class Conductor:
         patch_class: t.Type[Component],
     ) -> None:
         self.patches[component_class] = patch_class
+        self._graph = None
+        self._scopes.clear()
+
+    def add(self, component_class: t.Type[T], key: t.Hashable = None) -> T:
+        """
+        Adds component to be set up
+
+        If ``key`` is given, the instance of component with the key is added,
+        so that the conductor can hold many instances of the same class,
+        see :meth:`Component.instance` and :meth:`Component.pool`.
+
+        Lazy component is not constructed here,
+        its proxy is returned instead, see :class:`Lazy`.
 
-    def add(self, component_class: t.Type[T]) -> T:
+        """
         actual_class = self.patches.get(component_class, component_class)
+        if (
+            key is None
+            and actual_class.__lazy__
+            and actual_class not in self.components
+        ):
+            return t.cast(T, Lazy(self, actual_class))
+        self._added.add(_ident(actual_class, key))
+        return t.cast(T, self._get(actual_class, key))
+
+    def _get(self, component_class: t.Type[T], key: t.Hashable = None) -> T:
+        ident = _ident(component_class, key)
         try:
-            component = self.components[actual_class]
+            component = self.components[ident]
         except KeyError:
-            self.components[actual_class] = component = actual_class(
-                config=self.config_policy(actual_class),
-                logger=self.logging_policy(actual_class),
-                loop=self.loop,
+            component = self._create(component_class, key)
+            self.components[ident] = component
+            if not isinstance(component, Pool):
+                self.health.add(component)
+            self._graph = None
+        return t.cast(T, component)
+
+    def _create(self, component_class: t.Type[T], key: t.Hashable = None) -> T:
+        if self._process_executor and _has_blocking_hooks(component_class):
+            name = f"{component_class.__module__}.{component_class.__qualname__}"
+            raise ComponentError(
+                f"{name}: Blocking hooks cannot be run in process pool executor"
             )
+        if component_class is Pool:
+            # Pool is internal node of graph, so policies are not asked for it
+            config, logger = _POOL_CONFIG, self.logger
+        else:
+            config = self._config(component_class, key)
+            logger = self.logging_policy(component_class)
+        component = component_class(config=config, logger=logger, loop=self.loop)
+        component.key = key
+        return component
+
+    def _config(self, component_class: t.Type[Component], key: t.Hashable) -> Config:
+        if key is None:
+            return self.config_policy(component_class)
+        return self.config_policy(component_class, key)
+
+    @property
+    def graph(self) -> Graph[Component]:
+        """
+        Dependency graph of added components
+
+        The graph is cached and rebuilt only when new component is added
+        or patch is applied.
+
+        """
+        if self._graph is None:
+            self._graph = Graph(tuple(self.components.values()), self._resolve)
+        return self._graph
+
+    def _resolve(self, component: Component) -> t.Dict[str, Component]:
+        dependencies: t.Dict[str, Component] = {}
+        if isinstance(component, Pool):
+            component_class, keys = t.cast(PoolKey, component.key)
+            for key in keys:
+                dependencies[repr(key)] = self._get(component_class, key)
+            return dependencies
+        references = component.__references__
+        for name, dependency_class in component.__depends_on__.items():
+            actual_class = self.patches.get(dependency_class, dependency_class)
+            dependency = self._dependency(actual_class, references.get(name))
+            if dependency is not None:
+                dependencies[name] = dependency
+        return dependencies
+
+    def _dependency(
+        self,
+        component_class: t.Type[Component],
+        reference: t.Optional[Reference],
+        create: bool = True,
+    ) -> t.Optional[Component]:
+        if reference is not None:
+            if reference.keys is None:
+                target, key = component_class, reference.key
+            else:
+                target, key = Pool, (component_class, reference.keys)
+        elif component_class.__lazy__ and component_class not in self.components:
+            return None
+        else:
+            target, key = component_class, None
+        if create:
+            return self._get(target, key)
+        component = self.components.get(_ident(target, key))
+        if component is None:
+            name = f"{component_class.__module__}.{component_class.__qualname__}"
+            raise ComponentError(f"{name}: Component is not added to conductor")
+        return component
+
+    def scope(self, *component_classes: t.Type[Component]) -> Scope:
+        """
+        Returns scope of the given components, see :class:`Scope`
+
+        Scope is compiled once and cached, until patch is applied
+        or component is deactivated.
+
+        """
+        try:
+            return self._scopes[component_classes]
+        except KeyError:
+            scope = self._scopes[component_classes] = Scope(self, component_classes)
+            return scope
+
+    async def activate(self, component_class: t.Type[T], key: t.Hashable = None) -> T:
+        """
+        Sets up component with missing dependencies and returns it
+
+        The method can be used on running conductor,
+        components, which are already active, are not touched.
+
+        """
+        actual_class = self.patches.get(component_class, component_class)
+        self._added.add(_ident(actual_class, key))
+        component = self._get(actual_class, key)
+        await self._setup_components(self.graph.closure([component]))
         return t.cast(T, component)
 
-    async def setup(self) -> None:
-        scheduled: t.Set[Component] = set()
-        aws: t.List[t.Awaitable] = []
-
-        def schedule_setup(component: T, chain: t.Tuple[Component, ...] = ()) -> T:
-            if component in scheduled:
-                return component
-            chain += (component,)
-            depends_on = {}
-            for name, dependency_class in component.__depends_on__.items():
-                dependency = self.add(dependency_class)
-                if dependency in chain:
-                    raise CircularDependencyError(*chain, dependency)
-                depends_on[name] = schedule_setup(dependency, chain)
-            aws.append(component._setup(depends_on))
-            scheduled.add(component)
-            return component
+    async def deactivate(
+        self,
+        component_class: t.Type[Component],
+        key: t.Hashable = None,
+    ) -> None:
+        """
+        Shuts down and removes component, and then its unused dependencies
+
+        The method can be used on running conductor.
+        The component is shut down as soon as it is released by its dependents,
+        so they should be deactivated first.
+        Its dependencies are shut down and removed too,
+        unless they are added explicitly or still required by other components.
 
+        """
+        actual_class = self.patches.get(component_class, component_class)
+        ident = _ident(actual_class, key)
+        try:
+            component = self.components[ident]
+        except KeyError:
+            return
+        self._added.discard(ident)
+        self._scopes.clear()
+        graph = self.graph
+        removed = {component}
+        components = [component]
+        while components:
+            await self._shutdown_components(c for c in components if c in self._setups)
+            for component in components:
+                self.components.pop(_ident_of(component), None)
+                self.health.discard(component)
+            self._graph = None
+            candidates = {
+                dependency
+                for component in components
+                for dependency in graph.dependencies[component].values()
+            }
+            components = [
+                dependency
+                for dependency in candidates
+                if self.components.get(_ident_of(dependency)) is dependency
+                and _ident_of(dependency) not in self._added
+                and not dependency._state.refs
+                and removed.issuperset(graph.dependents[dependency])
+            ]
+            removed.update(components)
+
+    async def setup(self) -> None:
+        self.health.draining = False
         self.logger.info("Setting up components...")
-        for component in tuple(self.components.values()):
-            schedule_setup(component)
-        await asyncio.gather(*aws)
+        await self._setup_components(self.graph.order)
         self.logger.info("All components are active")
 
     async def shutdown(self) -> None:
+        await self._cancel_restarts()
         self.logger.info("Shutting down components...")
-        await asyncio.gather(
-            *(component._shutdown() for component in self.components.values())
+        await self._shutdown_components(
+            c for c in reversed(self.graph.order) if c in self._setups
         )
+        await self._shutdown_executor()
         self.logger.info("All components are inactive")
+        await self.logging_policy.flush()
+
+    async def reload(self) -> t.List[Component]:
+        """
+        Reloads config and restarts components, which config is changed
+
+        Config policy is refreshed (see :meth:`ConfigPolicy.refresh`)
+        and config of each component is re-evaluated.  Active components
+        with changed config are restarted together with their dependents
+        in dependency order, the rest ones are kept intact.
+        Returns restarted components.
+
+        """
+        self.logger.info("Reloading config...")
+        self.config_policy.refresh()
+        self._scopes.clear()
+        graph = self.graph
+        changed: t.Dict[Component, Config] = {}
+        for component in graph.order:
+            # Parent-only components are not reloaded in worker process
+            if isinstance(component, Pool) or component in self._shared:
+                continue
+            config = self._config(component.__class__, component.key)
+            if config != component.config:
+                changed[component] = config
+        affected = [c for c in graph.dependent_closure(changed) if c in self._setups]
+        self._restarting.update(affected)
+        try:
+            await self._shutdown_components(reversed(affected))
+            for component, config in changed.items():
+                component.config = config
+            await self._setup_components(affected)
+        finally:
+            self._restarting.difference_update(affected)
+        self.logger.info(
+            "Config is reloaded, restarted components: %s",
+            ", ".join(repr(component) for component in affected) or "none",
+        )
+        return affected
+
+    def _on_reload(self) -> None:
+        if self.health.draining:
+            return
+        if self._reloading is not None:
+            self.logger.warning("Reload is already in progress")
+            return
+        reloading = self._reloading = self.loop.create_task(self._reload())
+        self._restarts.add(reloading)
+        reloading.add_done_callback(self._restarts.discard)
+
+    async def _reload(self) -> None:
+        try:
+            await self.reload()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.exception("Reload failed, stopping...")
+            self._drain()
+        finally:
+            self._reloading = None
+
+    async def _cancel_restarts(self) -> None:
+        restarts = tuple(self._restarts)
+        for restart in restarts:
+            restart.cancel()
+        await asyncio.gather(*restarts, return_exceptions=True)
+
+    async def _setup_components(self, components: t.Iterable[Component]) -> None:
+        graph = self.graph
+        self.scheduler.prepare(graph)
+        instruments = self._instruments()
+        if self.executor is None:
+            self.executor = self.executor_factory(self.executor_workers)
+        components = tuple(components)
+        started: t.Dict[Component, asyncio.Future] = {}
+        # Setups of components blocking the longest chains of dependents
+        # are started first, so that they take free slots of scheduler.
+        for component in sorted(components, key=lambda c: -graph.height[c]):
+            if component not in self._setups:
+                depends_on = graph.dependencies[component]
+                self._inject_lazy(component, depends_on)
+                setup = self._setups[component] = self.loop.create_task(
+                    self._setup_component(component, depends_on, instruments)
+                )
+                started[component] = setup
+        aws = {component: self._setups[component] for component in components}
+        if not aws:
+            return
+        try:
+            await asyncio.wait(aws.values(), return_when=asyncio.FIRST_EXCEPTION)
+        except asyncio.CancelledError:
+            await self._cancel_setups(started)
+            raise
+        errors = _errors(aws)
+        if errors:
+            # Setup fails fast: the rest pending setups are cancelled,
+            # and the components, which are already active, are shut down.
+            await self._cancel_setups(started)
+            errors.update(_errors(aws))
+            await self._shutdown_components(
+                c for c in reversed(graph.order) if c in started and c in self._setups
+            )
+            raise SetupError(errors, self._chains(errors, aws)) from next(
+                iter(errors.values())
+            )
+
+    async def _cancel_setups(self, setups: t.Dict[Component, asyncio.Future]) -> None:
+        for setup in setups.values():
+            setup.cancel()
+        await asyncio.gather(*setups.values(), return_exceptions=True)
+        for component in setups:
+            if not component._state.active:
+                self._setups.pop(component, None)
+
+    def _chains(
+        self,
+        errors: t.Dict[Component, BaseException],
+        components: t.Container[Component],
+    ) -> t.Dict[Component, t.Tuple[Component, ...]]:
+        dependents = self.graph.dependents
+        chains = {}
+        for component in errors:
+            chain = [component]
+            while True:
+                candidates = [c for c in dependents[chain[-1]] if c in components]
+                if not candidates:
+                    break
+                chain.append(candidates[0])
+            chains[component] = tuple(reversed(chain))
+        return chains
+
+    async def _setup_component(
+        self,
+        component: Component,
+        depends_on: t.Dict[str, Component],
+        instruments: t.Sequence[Instrument],
+    ) -> None:
+        supervisor = self.supervisor
+        on_failure = self._on_failure if supervisor is not None else None
+        while True:
+            try:
+                await component._setup(
+                    depends_on,
+                    self.scheduler,
+                    instruments,
+                    self.executor,
+                    self.snapshots,
+                    on_failure,
+                )
+                return
+            except asyncio.CancelledError:  # pragma: no cover
+                raise  # It is subclass of Exception in Python < 3.8
+            except Exception:
+                delay = None if supervisor is None else supervisor.restart(component)
+                if delay is None:
+                    raise
+                self.logger.warning(
+                    "%r: Setup failed, retrying in %.3fs...",
+                    component,
+                    delay,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+
+    def _on_failure(self, component: Component, error: BaseException) -> None:
+        if (
+            self.health.draining
+            or component not in self._setups
+            or component in self._restarting
+        ):
+            return
+        supervisor = t.cast(Supervisor, self.supervisor)
+        # Components, which are not set up here (e.g. parent-only ones
+        # in worker process), are left intact, as on reload.
+        affected = [
+            c for c in supervisor.affected(self.graph, component) if c in self._setups
+        ]
+        self._restarting.update(affected)
+        restart = self.loop.create_task(self._restart(component, affected))
+        self._restarts.add(restart)
+        restart.add_done_callback(self._restarts.discard)
+
+    async def _restart(self, component: Component, affected: t.List[Component]) -> None:
+        supervisor = t.cast(Supervisor, self.supervisor)
+        try:
+            delay = supervisor.restart(component)
+            if delay is None:
+                self.logger.error(
+                    "%r: Restart intensity is exceeded, stopping...", component
+                )
+                self._drain()
+                return
+            self.logger.warning("%r: Restarting in %.3fs...", component, delay)
+            await self._shutdown_components(
+                c for c in reversed(affected) if c in self._setups
+            )
+            await asyncio.sleep(delay)
+            await self._setup_components(affected)
+            self.logger.info("%r: Restarted", component)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.exception("%r: Restart failed, stopping...", component)
+            self._drain()
+        finally:
+            self._restarting.difference_update(affected)
+
+    def _inject_lazy(
+        self,
+        component: Component,
+        depends_on: t.Dict[str, Component],
+    ) -> None:
+        for name, dependency_class in component.__depends_on__.items():
+            if name not in depends_on:
+                actual_class = self.patches.get(dependency_class, dependency_class)
+                setattr(component, name, Lazy(self, actual_class, component, name))
+
+    async def _shutdown_components(self, components: t.Iterable[Component]) -> None:
+        graph = self.graph
+        self.scheduler.prepare(graph)
+        deadline = None
+        if self.shutdown_timeout is not None:
+            deadline = self.loop.time() + self.shutdown_timeout
+        components = tuple(components)
+        for component in components:
+            self._setups.pop(component, None)
+        # Components marked by ``__shutdown_last__`` attribute and their dependencies
+        # are shut down after the rest ones, e.g. probe reports until the end.
+        marked = [c for c in components if c.__shutdown_last__]
+        last = set(graph.closure(marked)) if marked else set()
+        batches = (
+            [c for c in components if c not in last],
+            [c for c in components if c in last],
+        )
+        shutdowns = self.loop.create_task(self._shutdown_batches(batches, deadline))
+        try:
+            overdue = await asyncio.shield(shutdowns)
+        except asyncio.CancelledError:
+            # Started shutdown is completed anyway,
+            # otherwise dependencies would wait for release forever.
+            await shutdowns
+            raise
+        if overdue:
+            self.logger.error(
+                "Shutdown is timed out for: %s",
+                ", ".join(repr(component) for component in overdue),
+            )
+
+    async def _shutdown_batches(
+        self,
+        batches: t.Iterable[t.List[Component]],
+        deadline: t.Optional[float],
+    ) -> t.List[Component]:
+        instruments = self._instruments()
+        overdue: t.List[Component] = []
+        for batch in batches:
+            in_time = await asyncio.gather(
+                *(
+                    component._shutdown(self.scheduler, instruments, deadline)
+                    for component in batch
+                )
+            )
+            overdue.extend(c for c, ok in zip(batch, in_time) if not ok)
+        return overdue
+
+    async def _shutdown_executor(self) -> None:
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            await self.loop.run_in_executor(None, executor.shutdown)
+
+    def _instruments(self) -> t.List[Instrument]:
+        return [self.health, *self.instruments]
+
+    def _drain(self) -> None:
+        # The second signal stops the loop immediately
+        if self.drain_delay and not self.health.draining:
+            self.health.draining = True
+            self.logger.info("Draining for %.3fs...", self.drain_delay)
+            self.loop.call_later(self.drain_delay, self.loop.stop)
+            return
+        self.health.draining = True
+        self.loop.stop()
 
     def run(self, aw: t.Awaitable) -> None:
-        self.loop.run_until_complete(self.setup())
+        self._open_loop()
         try:
-            self.loop.run_until_complete(aw)
+            self.loop.run_until_complete(self.setup())
+            try:
+                self.loop.run_until_complete(aw)
+            finally:
+                self.loop.run_until_complete(self.shutdown())
         finally:
-            self.loop.run_until_complete(self.shutdown())
+            self._close_loop()
+
+    def _open_loop(self) -> None:
+        # Own loop is closed after run or serve, so the next one creates new loop
+        if self._owns_loop and self.loop.is_closed():
+            self.loop = self.loop_factory()
+            asyncio.set_event_loop(self.loop)
+            for component in self.components.values():
+                component.loop = self.loop
+                if component._tasks is not None:
+                    component._tasks.loop = self.loop
+
+    def _close_loop(self) -> None:
+        if self._owns_loop and not self.loop.is_closed():
+            close_loop(self.loop)
+            # Closed loop should not be left current
+            asyncio.set_event_loop(None)
 
-    def serve(self) -> None:
+    def serve(self, workers: t.Optional[int] = None) -> None:
+        """
+        Sets up components and serves until SIGINT or SIGTERM is received
+
+        On SIGHUP config is reloaded, and components,
+        which config is changed, are restarted, see :meth:`reload`.
+
+        If ``workers`` is given, the process forks into the number of workers.
+        Components marked by ``__parent_only__`` attribute
+        and their dependencies are set up once in the parent process before fork.
+        Each worker runs its own event loop with its own instances
+        of the rest components.  On SIGINT or SIGTERM the parent process sends
+        SIGTERM to all workers, waits for them to shut down,
+        and then shuts down parent-only components.
+        SIGHUP is forwarded to workers, so parent-only components
+        are not reloaded.
+
+        """
+        self._open_loop()
+        if workers is not None:
+            self._serve_workers(workers)
+            return
         try:
             self.loop.run_until_complete(self.setup())
-            self.loop.add_signal_handler(signal.SIGINT, self.loop.stop)
-            self.loop.add_signal_handler(signal.SIGTERM, self.loop.stop)
+            self.loop.add_signal_handler(signal.SIGINT, self._drain)
+            self.loop.add_signal_handler(signal.SIGTERM, self._drain)
+            self.loop.add_signal_handler(signal.SIGHUP, self._on_reload)
             self.logger.info("Serving...")
             self.loop.run_forever()
         except KeyboardInterrupt:  # pragma: no cover
@@ -130,4 +711,174 @@ class Conductor:
         finally:
             self.loop.remove_signal_handler(signal.SIGINT)
             self.loop.remove_signal_handler(signal.SIGTERM)
-            self.loop.run_until_complete(self.shutdown())
+            self.loop.remove_signal_handler(signal.SIGHUP)
+            try:
+                self.loop.run_until_complete(self.shutdown())
+            finally:
+                self._close_loop()
+
+    def _serve_workers(self, workers: int) -> None:
+        graph = self.graph
+        shared: t.Set[Component] = set()
+        for component in reversed(graph.order):
+            if component.__parent_only__ or component in shared:
+                shared.add(component)
+                shared.update(graph.dependencies[component].values())
+        signals = {signal.SIGINT, signal.SIGTERM, signal.SIGHUP}
+        pids: t.Set[int] = set()
+
+        def terminate(signum: int, frame: t.Any) -> None:
+            self.health.draining = True
+            self.logger.info("Terminating workers...")
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:  # pragma: no cover
+                    pass  # The worker has just been reaped
+
+        def reload(signum: int, frame: t.Any) -> None:
+            self.logger.info("Reloading workers...")
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGHUP)
+                except ProcessLookupError:  # pragma: no cover
+                    pass
+
+        handlers = {}
+        try:
+            self.logger.info("Setting up parent-only components...")
+            self.loop.run_until_complete(
+                self._setup_components(c for c in graph.order if c in shared)
+            )
+            mask = signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+            try:
+                for _ in range(workers):
+                    pid = os.fork()
+                    if pid == 0:  # pragma: no cover
+                        code = 1
+                        try:
+                            self._serve_worker(shared, mask)
+                            code = 0
+                        except BaseException:
+                            self.logger.exception("Worker %s failed", os.getpid())
+                        finally:
+                            # Writer threads of logging policy are killed by _exit
+                            self._flush_logs()
+                            os._exit(code)
+                    pids.add(pid)
+                    self.logger.info("Worker %s is started", pid)
+                for signum in signals:
+                    handlers[signum] = signal.signal(
+                        signum, reload if signum == signal.SIGHUP else terminate
+                    )
+            except BaseException:  # pragma: no cover
+                terminate(signal.SIGTERM, None)
+                raise
+            finally:
+                signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+        finally:
+            while pids:
+                pid, status = os.waitpid(-1, 0)
+                pids.discard(pid)
+                if status:
+                    self.logger.error("Worker %s exited with status %s", pid, status)
+                else:
+                    self.logger.info("Worker %s exited", pid)
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+            self.logger.info("Shutting down parent-only components...")
+            try:
+                self.loop.run_until_complete(
+                    self._shutdown_components(
+                        c
+                        for c in reversed(graph.order)
+                        if c in shared and c in self._setups
+                    )
+                )
+                self.loop.run_until_complete(self._shutdown_executor())
+                self.loop.run_until_complete(self.logging_policy.flush())
+            finally:
+                self._close_loop()
+
+    def _serve_worker(self, shared: t.Set[Component], mask: t.Set[int]) -> None:
+        # SIGINT is sent by terminal to the whole process group,
+        # so it is ignored here, the parent process will send SIGTERM anyway.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        # The parent loop is abandoned, but not closed,
+        # since its selector is shared with the parent process.
+        self.loop = self.loop_factory()
+        self._owns_loop = True
+        asyncio.set_event_loop(self.loop)
+        # Threads of the parent executor do not survive fork
+        self.executor = None
+        self._scopes.clear()
+        # Shared components are set up and shut down by the parent process,
+        # so they are neither reloaded nor supervised here.
+        self._shared = shared
+        for component in shared:
+            self._setups.pop(component, None)
+        for ident, component in tuple(self.components.items()):
+            if component not in shared:
+                self.health.discard(component)
+                component = self._create(component.__class__, component.key)
+                self.components[ident] = component
+                if not isinstance(component, Pool):
+                    self.health.add(component)
+        self._graph = None
+        own = [c for c in self.graph.order if c not in shared]
+        try:
+            self.loop.run_until_complete(self._setup_components(own))
+            self.loop.add_signal_handler(signal.SIGTERM, self._drain)
+            self.loop.add_signal_handler(signal.SIGHUP, self._on_reload)
+            signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+            self.logger.info("Serving...")
+            self.loop.run_forever()
+        finally:
+            # Signals are blocked until they are ignored, since removal of handler
+            # resets it to default one, which would kill the worker.
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM, signal.SIGHUP})
+            self.loop.remove_signal_handler(signal.SIGTERM)
+            self.loop.remove_signal_handler(signal.SIGHUP)
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            try:
+                self.loop.run_until_complete(self._cancel_restarts())
+                self.loop.run_until_complete(self._shutdown_components(reversed(own)))
+                self.loop.run_until_complete(self._shutdown_executor())
+                self.loop.run_until_complete(self.logging_policy.flush())
+            finally:
+                self._close_loop()
+
+    def _flush_logs(self) -> None:  # pragma: no cover
+        # Own loop of worker is closed at this point
+        loop = self.loop_factory()
+        try:
+            loop.run_until_complete(self.logging_policy.flush())
+        finally:
+            loop.close()
+
+
+def _errors(
+    setups: t.Dict[Component, asyncio.Future],
+) -> t.Dict[Component, BaseException]:
+    return {
+        component: t.cast(BaseException, setup.exception())
+        for component, setup in setups.items()
+        if setup.done() and not setup.cancelled() and setup.exception() is not None
+    }
+
+
+def _has_blocking_hooks(component_class: t.Type[Component]) -> bool:
+    return (
+        component_class.on_setup_blocking is not Component.on_setup_blocking
+        or component_class.on_shutdown_blocking is not Component.on_shutdown_blocking
+    )
+
+
+def _ident(component_class: t.Type[Component], key: t.Hashable) -> t.Any:
+    return component_class if key is None else (component_class, key)
+
+
+def _ident_of(component: Component) -> t.Any:
+    return _ident(component.__class__, component.key)
@@ -1,7 +1,10 @@
+import os
 import typing as t
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 
 from .component import Component
+from .naming import camelcase_to_underscore
 
 
 Config = t.Mapping[str, t.Any]
@@ -9,8 +12,26 @@ Config = t.Mapping[str, t.Any]
 
 class ConfigPolicy(ABC):
     @abstractmethod
-    def __call__(self, component_class: t.Type[Component]) -> Config:
-        """Returns config for a component"""
+    def __call__(
+        self,
+        component_class: t.Type[Component],
+        key: t.Hashable = None,
+    ) -> Config:
+        """
+        Returns config for a component
+
+        Argument ``key`` is passed for keyed instance of component only.
+
+        """
+
+    def refresh(self) -> None:
+        """
+        Re-reads sources of config
+
+        It is called by :meth:`Conductor.reload` before configs
+        of components are re-evaluated.  Does nothing by default.
+
+        """
 
 
 class SimpleConfigPolicy(ConfigPolicy):
@@ -20,5 +41,176 @@ class SimpleConfigPolicy(ConfigPolicy):
     def __init__(self, config: Config) -> None:
         self._config = config
 
-    def __call__(self, component_class: t.Type[Component]) -> Config:
+    def __call__(
+        self,
+        component_class: t.Type[Component],
+        key: t.Hashable = None,
+    ) -> Config:
         return self._config
+
+
+Listener = t.Callable[[Config], t.Any]
+Loader = t.Callable[[], t.Iterable[Config]]
+
+
+class LayeredConfigPolicy(ConfigPolicy):
+    """
+    Config policy, which merges layers and gives each component its own section
+
+    Layers are merged in the given order, so that later ones override former,
+    e.g. ``LayeredConfigPolicy(defaults, file, env, overrides)``.
+    Nested mappings are merged deeply.  Section of component is looked up
+    by its class name converted by :func:`camelcase_to_underscore`,
+    i.e. the same one used by :class:`ComponentLoggingPolicy`.
+    Sections are resolved once per class and returned as read-only mappings.
+
+    Keyed instance of component gets the section of its class merged
+    with the subsection of ``instances`` named by its key converted to string,
+    e.g. ``{"redis": {"host": "db", "instances": {"3": {"db": 3}}}}``.
+
+    Method :meth:`reload` replaces layers and calls listeners subscribed
+    to the classes, which sections have been changed.
+    If ``loader`` is given, layers are loaded by it on creation
+    (unless given explicitly) and reloaded by :meth:`refresh`, e.g. on SIGHUP:
+
+    ..  code-block:: python
+
+        policy = LayeredConfigPolicy(
+            loader=lambda: (defaults, read_file(path), environ_config("APP")),
+        )
+
+    """
+
+    loader: t.Optional[Loader]
+
+    _layers: t.Tuple[Config, ...]
+    _merged: t.Optional[Config]
+    _sections: t.Dict[t.Tuple[t.Type[Component], t.Hashable], Config]
+    _listeners: t.Dict[t.Tuple[t.Type[Component], t.Hashable], t.List[Listener]]
+
+    def __init__(self, *layers: Config, loader: t.Optional[Loader] = None) -> None:
+        if loader is not None and not layers:
+            layers = tuple(loader())
+        self.loader = loader
+        self._layers = layers
+        self._merged = None
+        self._sections = {}
+        self._listeners = {}
+
+    def __call__(
+        self,
+        component_class: t.Type[Component],
+        key: t.Hashable = None,
+    ) -> Config:
+        try:
+            return self._sections[component_class, key]
+        except KeyError:
+            section = self._resolve(component_class, key)
+            self._sections[component_class, key] = section
+            return section
+
+    def subscribe(
+        self,
+        component_class: t.Type[Component],
+        listener: Listener,
+        key: t.Hashable = None,
+    ) -> None:
+        """Calls ``listener`` with new section of component when it is changed"""
+        self._listeners.setdefault((component_class, key), []).append(listener)
+
+    def unsubscribe(
+        self,
+        component_class: t.Type[Component],
+        listener: Listener,
+        key: t.Hashable = None,
+    ) -> None:
+        listeners = self._listeners.get((component_class, key), [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def reload(self, *layers: Config) -> None:
+        """Replaces layers and notifies listeners of changed sections"""
+        self._layers = layers
+        self._merged = None
+        previous = self._sections
+        self._sections = {}
+        for ident, listeners in tuple(self._listeners.items()):
+            section = self(*ident)
+            if previous.get(ident) != section:
+                for listener in tuple(listeners):
+                    listener(section)
+
+    def refresh(self) -> None:
+        """Reloads layers by ``loader``, if it is given"""
+        if self.loader is not None:
+            self.reload(*self.loader())
+
+    def _resolve(self, component_class: t.Type[Component], key: t.Hashable) -> Config:
+        if self._merged is None:
+            self._merged = _merge(self._layers)
+        section = self._merged.get(camelcase_to_underscore(component_class.__name__))
+        if not isinstance(section, t.Mapping):
+            return _EMPTY
+        if key is None:
+            return section
+        instances = section.get("instances")
+        instance = instances.get(str(key)) if isinstance(instances, t.Mapping) else None
+        shared = {name: value for name, value in section.items() if name != "instances"}
+        if isinstance(instance, t.Mapping):
+            return _merge((shared, instance))
+        return MappingProxyType(shared)
+
+
+_EMPTY: Config = MappingProxyType({})
+
+
+def _merge(layers: t.Sequence[Config]) -> Config:
+    merged: t.Dict[str, t.Any] = {}
+    for layer in layers:
+        for key, value in layer.items():
+            current = merged.get(key)
+            if isinstance(value, t.Mapping):
+                if isinstance(current, t.Mapping):
+                    value = _merge((current, value))
+                else:
+                    value = _merge((value,))
+            merged[key] = value
+    return MappingProxyType(merged)
+
+
+def environ_config(
+    prefix: str,
+    environ: t.Optional[t.Mapping[str, str]] = None,
+    separator: str = "__",
+) -> Config:
+    """
+    Returns config layer built from environment variables
+
+    Variable names are split by ``separator`` into keys of nested mappings,
+    e.g. ``APP__DB_CONNECTION__DSN`` with prefix ``APP``
+    becomes ``{"db_connection": {"dsn": ...}}``.  Values are kept as strings.
+    Raises ``ValueError`` if a variable sets a value of a key,
+    which is a section of another one, e.g. ``APP__DB`` and ``APP__DB__HOST``.
+
+    """
+    if environ is None:
+        environ = os.environ
+    config: t.Dict[str, t.Any] = {}
+    sources: t.Dict[t.Tuple[str, ...], str] = {}
+    head = prefix + separator
+    for name, value in environ.items():
+        if not name.startswith(head):
+            continue
+        parts = tuple(name[len(head) :].lower().split(separator))
+        layer = config
+        for i, part in enumerate(parts):
+            source = sources.setdefault(parts[: i + 1], name)
+            current = layer.get(part)
+            is_section = i < len(parts) - 1
+            if current is not None and isinstance(current, dict) != is_section:
+                raise ValueError(f"Variable {name} conflicts with {source}")
+            if is_section:
+                layer = layer.setdefault(part, {})
+            else:
+                layer[part] = value
+    return config
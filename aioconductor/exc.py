@@ -1,3 +1,9 @@
+import typing as t
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .component import Component
+
+
 class ComponentError(Exception):
     """Base class for component errors"""
 
@@ -12,3 +18,35 @@ class CircularDependencyError(ComponentError):
     Arguments tuple of the exception contains whole chain of interdependent components.
 
     """
+
+
+class SetupError(ComponentError):
+    """
+    Setup Error
+
+    The exception is raised, when setup of some components fails.
+    Before it is raised, pending setups are cancelled,
+    and components, which have been already set up, are shut down.
+
+    Attribute ``errors`` maps each failed component to its exception,
+    attribute ``chains`` maps it to the chain of dependencies,
+    which leads to the component from one of the components being set up.
+    The first error is also the cause of the exception.
+
+    """
+
+    errors: t.Dict["Component", BaseException]
+    chains: t.Dict["Component", t.Tuple["Component", ...]]
+
+    def __init__(
+        self,
+        errors: t.Dict["Component", BaseException],
+        chains: t.Dict["Component", t.Tuple["Component", ...]],
+    ) -> None:
+        lines = ["Setup failed"]
+        for component, error in errors.items():
+            chain = " -> ".join(repr(c) for c in chains[component])
+            lines.append(f"{chain}: {error!r}")
+        super().__init__("\n    ".join(lines))
+        self.errors = errors
+        self.chains = chains
@@ -0,0 +1,189 @@
+import typing as t
+
+from .exc import CircularDependencyError
+
+
+N = t.TypeVar("N")
+
+
+class Graph(t.Generic[N]):
+    """
+    Dependency Graph
+
+    The graph is built once from the given root nodes.
+    Function ``resolve`` is called exactly once per node
+    and should return mapping of attribute names to dependency nodes.
+
+    Attribute ``height`` contains length of the longest chain of dependents
+    starting from the node (the node itself is included),
+    i.e. length of the critical path, which the node is blocking.
+
+    The graph is walked iteratively, so its depth is not limited by recursion.
+    Circular dependency raises :class:`CircularDependencyError`,
+    which arguments contain the whole chain of interdependent nodes.
+
+    """
+
+    dependencies: t.Dict[N, t.Dict[str, N]]
+    dependents: t.Dict[N, t.List[N]]
+    order: t.List[N]
+    levels: t.List[t.List[N]]
+    level: t.Dict[N, int]
+    height: t.Dict[N, int]
+
+    def __init__(
+        self,
+        roots: t.Iterable[N],
+        resolve: t.Callable[[N], t.Mapping[str, N]],
+    ) -> None:
+        self.dependencies = {}
+        self.dependents = {}
+        self.order = []
+        self.levels = []
+        self.level = {}
+        self.height = {}
+
+        for root in roots:
+            if root in self.level:
+                continue
+            path = [root]
+            on_path = {root}
+            stack = [self._walk(root, resolve)]
+            while stack:
+                node = path[-1]
+                for dependency in stack[-1]:
+                    if dependency in on_path:
+                        raise CircularDependencyError(*path, dependency)
+                    if dependency not in self.level:
+                        path.append(dependency)
+                        on_path.add(dependency)
+                        stack.append(self._walk(dependency, resolve))
+                        break
+                else:
+                    stack.pop()
+                    path.pop()
+                    on_path.remove(node)
+                    self._visit(node)
+
+        for node in reversed(self.order):
+            height = 0
+            for dependent in self.dependents[node]:
+                height = max(height, self.height[dependent])
+            self.height[node] = height + 1
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __iter__(self) -> t.Iterator[N]:
+        return iter(self.order)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.level
+
+    def closure(self, nodes: t.Iterable[N]) -> t.List[N]:
+        """Returns given nodes with all their dependencies in topological order"""
+        closure: t.List[N] = []
+        visited = set()
+        for node in nodes:
+            if node in visited:
+                continue
+            visited.add(node)
+            stack = [(node, iter(self.dependencies[node].values()))]
+            while stack:
+                current, dependencies = stack[-1]
+                for dependency in dependencies:
+                    if dependency not in visited:
+                        visited.add(dependency)
+                        stack.append(
+                            (dependency, iter(self.dependencies[dependency].values()))
+                        )
+                        break
+                else:
+                    stack.pop()
+                    closure.append(current)
+        return closure
+
+    def dependent_closure(self, nodes: t.Iterable[N]) -> t.List[N]:
+        """Returns given nodes with all their dependents in topological order"""
+        closure = set()
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            if node not in closure:
+                closure.add(node)
+                stack.extend(self.dependents[node])
+        return [node for node in self.order if node in closure]
+
+    def _walk(
+        self,
+        node: N,
+        resolve: t.Callable[[N], t.Mapping[str, N]],
+    ) -> t.Iterator[N]:
+        self.dependencies[node] = dependencies = dict(resolve(node))
+        return iter(dependencies.values())
+
+    def _visit(self, node: N) -> None:
+        level = 0
+        for dependency in self.dependencies[node].values():
+            level = max(level, self.level[dependency] + 1)
+            self.dependents[dependency].append(node)
+        self.dependents[node] = []
+        if level == len(self.levels):
+            self.levels.append([])
+        self.levels[level].append(node)
+        self.level[node] = level
+        self.order.append(node)
+
+
+def strongly_connected(
+    roots: t.Iterable[N],
+    resolve: t.Callable[[N], t.Mapping[str, N]],
+) -> t.List[t.List[N]]:
+    """
+    Returns strongly connected components of graph
+
+    Unlike :class:`Graph` it does not fail on circular dependencies,
+    so it can be used to find all of them at once.
+    Components are returned in topological order, dependencies first.
+    Function ``resolve`` is called exactly once per node.
+
+    """
+    index: t.Dict[N, int] = {}
+    low: t.Dict[N, int] = {}
+    stack: t.List[N] = []
+    on_stack: t.Set[N] = set()
+    result: t.List[t.List[N]] = []
+
+    def enter(node: N) -> t.Tuple[N, t.Iterator[N]]:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        return node, iter(tuple(resolve(node).values()))
+
+    for root in roots:
+        if root in index:
+            continue
+        work = [enter(root)]
+        while work:
+            node, iterator = work[-1]
+            for dependency in iterator:
+                if dependency not in index:
+                    work.append(enter(dependency))
+                    break
+                if dependency in on_stack:
+                    low[node] = min(low[node], index[dependency])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    result.append(component)
+    return result
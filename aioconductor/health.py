@@ -0,0 +1,148 @@
+import json
+import typing as t
+from enum import Enum
+
+from .component import Component
+from .instrument import Event, Instrument
+from .server import HTTPComponent, Response
+
+
+class Phase(str, Enum):
+    """Lifecycle phases of component reported by :class:`Health`"""
+
+    PENDING = "pending"
+    SETTING_UP = "setting_up"
+    ACTIVE = "active"
+    DRAINING = "draining"
+    INACTIVE = "inactive"
+
+
+PHASES = {
+    Event.ACQUIRING: Phase.SETTING_UP,
+    Event.SETTING_UP: Phase.SETTING_UP,
+    Event.ACTIVE: Phase.ACTIVE,
+    Event.RELEASING: Phase.DRAINING,
+    Event.SHUTTING_DOWN: Phase.DRAINING,
+    Event.INACTIVE: Phase.INACTIVE,
+}
+
+
+class Health(Instrument):
+    """
+    Health of components
+
+    Conductor keeps its own instance in ``health`` attribute.
+    It tracks phases of components and counts components per phase,
+    so that aggregate state is available without walking the graph.
+
+    Conductor is ready, when all its components are active
+    and it is not draining.  It starts draining as soon as
+    ``Conductor.serve`` receives SIGINT or SIGTERM,
+    which is ``drain_delay`` seconds before shutdown of components.
+
+    """
+
+    phases: t.Dict[Component, Phase]
+    counts: t.Dict[Phase, int]
+    draining: bool
+
+    def __init__(self) -> None:
+        self.phases = {}
+        self.counts = dict.fromkeys(Phase, 0)
+        self.draining = False
+
+    def __call__(self, component: Component, event: Event) -> None:
+        phase = PHASES[event]
+        previous = self.phases.get(component)
+        if previous is not phase:
+            if previous is not None:
+                self.counts[previous] -= 1
+            self.counts[phase] += 1
+            self.phases[component] = phase
+
+    @property
+    def ready(self) -> bool:
+        return not self.draining and self.counts[Phase.ACTIVE] == len(self.phases)
+
+    def add(self, component: Component) -> None:
+        """Starts tracking of component, which is pending setup"""
+        if component not in self.phases:
+            self.phases[component] = Phase.PENDING
+            self.counts[Phase.PENDING] += 1
+
+    def discard(self, component: Component) -> None:
+        """Stops tracking of component"""
+        phase = self.phases.pop(component, None)
+        if phase is not None:
+            self.counts[phase] -= 1
+
+    def status(self, components: bool = True) -> t.Dict[str, t.Any]:
+        """Returns aggregate state, and state of each component if requested"""
+        status: t.Dict[str, t.Any] = {
+            "ready": self.ready,
+            "draining": self.draining,
+            "counts": {phase.value: count for phase, count in self.counts.items()},
+        }
+        if components:
+            status["components"] = {
+                repr(component): phase.value for component, phase in self.phases.items()
+            }
+        return status
+
+    def probe(
+        self,
+        host: str = "127.0.0.1",
+        port: t.Optional[int] = None,
+        path: t.Optional[str] = None,
+    ) -> t.Type["Probe"]:
+        """
+        Returns probe component class bound to this instance
+
+        The probe listens on Unix socket, if ``path`` is given,
+        and on TCP ``host`` and ``port`` otherwise.
+
+        """
+        attrs = {
+            "__module__": Probe.__module__,
+            "__health__": self,
+            "__address__": (host, port, path),
+        }
+        return t.cast(t.Type[Probe], type("Probe", (Probe,), attrs))
+
+
+class Probe(HTTPComponent):
+    """
+    Lightweight HTTP probe
+
+    Serves ``GET /live``, ``GET /ready`` (503 when not ready),
+    and ``GET /status`` with state of each component in JSON.
+    It should be created by :meth:`Health.probe`, e.g.:
+
+    ..  code-block:: python
+
+        conductor.add(conductor.health.probe(port=8081))
+
+    The probe is shut down after the rest components.
+
+    """
+
+    __health__: t.ClassVar[t.Optional[Health]] = None
+    __shutdown_last__ = True
+
+    def respond(self, target: str) -> Response:
+        health = self.__health__
+        if health is None:
+            return _json(500, b"Internal Server Error", {"error": "unbound probe"})
+        if target == "/live":
+            return _json(200, b"OK", {"alive": True})
+        if target == "/ready":
+            if health.ready:
+                return _json(200, b"OK", health.status(components=False))
+            return _json(503, b"Service Unavailable", health.status(components=False))
+        if target == "/status":
+            return _json(200, b"OK", health.status())
+        return _json(404, b"Not Found", {"error": "not found"})
+
+
+def _json(code: int, reason: bytes, body: t.Any) -> Response:
+    return code, reason, b"application/json", json.dumps(body).encode()
@@ -0,0 +1,41 @@
+import typing as t
+from abc import ABC, abstractmethod
+from enum import Enum
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .component import Component
+
+
+class Event(str, Enum):
+    """
+    Lifecycle events of component
+
+    Events follow each other in the order of declaration:
+
+    *   ``ACQUIRING`` — component starts waiting for its dependencies;
+    *   ``SETTING_UP`` — dependencies are active, ``on_setup`` is started;
+    *   ``ACTIVE`` — ``on_setup`` is done, component is active;
+    *   ``RELEASING`` — component starts waiting for release by its dependents;
+    *   ``SHUTTING_DOWN`` — component is released, ``on_shutdown`` is started;
+    *   ``INACTIVE`` — ``on_shutdown`` is done, dependencies are released.
+
+    """
+
+    ACQUIRING = "acquiring"
+    SETTING_UP = "setting_up"
+    ACTIVE = "active"
+    RELEASING = "releasing"
+    SHUTTING_DOWN = "shutting_down"
+    INACTIVE = "inactive"
+
+
+class Instrument(ABC):
+    @abstractmethod
+    def __call__(self, component: "Component", event: Event) -> None:
+        """
+        Handles lifecycle event of component
+
+        The method is called synchronously within the event loop,
+        so it should be as cheap as possible.
+
+        """
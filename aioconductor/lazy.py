@@ -0,0 +1,74 @@
+import asyncio
+import typing as t
+
+from .component import Component
+from .exc import ComponentError
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .conductor import Conductor
+
+
+class Lazy:
+    """
+    Proxy of lazy component
+
+    The proxy is injected instead of component, which class is marked
+    by ``__lazy__`` attribute, and which is not active yet.
+    The component is constructed and set up (with its dependencies)
+    on the first await of the proxy itself, or on the first call
+    of its coroutine method through the proxy.
+    Then the proxy replaces itself on the owner by the actual component,
+    so further access costs nothing.
+
+    Access to other attributes of inactive component raises
+    :class:`ComponentError`.
+
+    """
+
+    __slots__ = ("_conductor", "_class", "_owner", "_name")
+
+    def __init__(
+        self,
+        conductor: "Conductor",
+        component_class: t.Type[Component],
+        owner: t.Optional[Component] = None,
+        name: t.Optional[str] = None,
+    ) -> None:
+        self._conductor = conductor
+        self._class = component_class
+        self._owner = owner
+        self._name = name
+
+    def __repr__(self) -> str:
+        return f"<Lazy {self._class.__module__}.{self._class.__name__}>"
+
+    def __await__(self) -> t.Generator[t.Any, None, Component]:
+        return self._activate().__await__()
+
+    def __getattr__(self, name: str) -> t.Any:
+        component = self._conductor.components.get(self._class)
+        if component is not None and component._state.active:
+            if self._owner is not None:
+                self._bind(component)
+            return getattr(component, name)
+        if asyncio.iscoroutinefunction(getattr(self._class, name, None)):
+
+            async def method(*args: t.Any, **kwargs: t.Any) -> t.Any:
+                component = await self._activate()
+                return await getattr(component, name)(*args, **kwargs)
+
+            return method
+        raise ComponentError(f"{self!r}: Component is not active")
+
+    async def _activate(self) -> Component:
+        component = await self._conductor.activate(self._class)
+        if self._owner is not None:
+            self._bind(component)
+        return component
+
+    def _bind(self, component: Component) -> None:
+        owner = t.cast(Component, self._owner)
+        if component not in owner._state.depends_on:
+            owner._state.depends_on += (component,)
+            component._state.acquire(owner)
+        setattr(owner, t.cast(str, self._name), component)
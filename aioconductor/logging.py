@@ -1,6 +1,11 @@
+import asyncio
+import os
+import queue
+import threading
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
-from logging import Logger, getLogger as get_logger
+from logging import Handler, Logger, LogRecord, getLogger as get_logger
 
 from .component import Component
 from .naming import camelcase_to_underscore
@@ -11,6 +16,9 @@ class LoggingPolicy(ABC):
     def __call__(self, component_class: t.Type[Component]) -> Logger:
         """Returns logger for a component"""
 
+    async def flush(self) -> None:
+        """Waits until all records are written"""
+
 
 class SimpleLoggingPolicy(LoggingPolicy):
     def __init__(self, logger: Logger):
@@ -26,8 +34,180 @@ class ModuleLoggingPolicy(LoggingPolicy):
 
 
 class ComponentLoggingPolicy(LoggingPolicy):
+    """
+    Logging policy, which gives each component its own logger
+
+    Loggers are cached per class, classes are referenced weakly,
+    so that dynamically created ones are not kept alive by the cache.
+
+    """
+
+    _loggers: "weakref.WeakKeyDictionary[t.Type[Component], Logger]"
+
+    def __init__(self) -> None:
+        self._loggers = weakref.WeakKeyDictionary()
+
+    def __call__(self, component_class: t.Type[Component]) -> Logger:
+        try:
+            return self._loggers[component_class]
+        except KeyError:
+            logger = get_logger(
+                f"{component_class.__module__}."
+                f"{camelcase_to_underscore(component_class.__name__)}"
+            )
+            self._loggers[component_class] = logger
+            return logger
+
+
+class QueueLoggingPolicy(LoggingPolicy):
+    """
+    Logging policy, which writes records in background thread
+
+    It wraps another policy (:class:`ModuleLoggingPolicy` by default)
+    and returns loggers, which put records into bounded queue
+    instead of calling handlers on the event loop thread.
+    Writer thread takes records in batches of up to ``batch_size``
+    and passes them to handlers of the loggers returned by the wrapped policy.
+
+    Argument ``overflow`` defines what to do when the queue is full:
+
+    *   ``"drop"`` drops the record;
+    *   ``"block"`` waits for free space;
+    *   ``"sample"`` waits for free space for each ``sample``-th record
+        and drops the rest.
+
+    Number of dropped records is counted in ``dropped`` attribute.
+    Conductor flushes the queue at the end of shutdown.
+
+    """
+
+    OVERFLOWS = ("drop", "block", "sample")
+
+    dropped: int
+
+    _queue: "queue.Queue[t.Optional[t.Tuple[Logger, LogRecord]]]"
+    _thread: t.Optional[threading.Thread]
+    _pid: t.Optional[int]
+
+    def __init__(
+        self,
+        policy: t.Optional[LoggingPolicy] = None,
+        maxsize: int = 10000,
+        overflow: str = "drop",
+        sample: int = 10,
+        batch_size: int = 100,
+    ) -> None:
+        if overflow not in self.OVERFLOWS:
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self._policy = policy or ModuleLoggingPolicy()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._sample = sample
+        self._batch_size = batch_size
+        self._overflowed = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.dropped = 0
+
     def __call__(self, component_class: t.Type[Component]) -> Logger:
-        return get_logger(
-            f"{component_class.__module__}."
-            f"{camelcase_to_underscore(component_class.__name__)}"
-        )
+        target = self._policy(component_class)
+        logger = _QueueLogger(target)
+        logger.addHandler(_QueueHandler(self, target))
+        return logger
+
+    async def flush(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._queue.join)
+
+    def close(self) -> None:
+        """Stops writer thread, writing the rest of records"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None and self._pid == os.getpid():
+                self._queue.put(None)
+                thread.join()
+            self._pid = None
+
+    def put(self, logger: Logger, record: LogRecord) -> None:
+        if self._pid != os.getpid():
+            self._start()
+        item = (logger, record)
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        if self._overflow == "sample":
+            self._overflowed += 1
+            block = self._overflowed % self._sample == 0
+        else:
+            block = self._overflow == "block"
+        if block:
+            self._queue.put(item)
+        else:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        # The thread does not survive fork, so the worker process
+        # starts its own one with a fresh queue.
+        with self._lock:
+            if self._pid == os.getpid():  # pragma: no cover
+                return
+            self._queue = queue.Queue(self._maxsize)
+            self._thread = threading.Thread(
+                target=self._write, name="aioconductor-logging", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _write(self) -> None:
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            try:
+                while len(batch) < self._batch_size:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                else:
+                    logger, record = item
+                    logger.handle(record)
+                q.task_done()
+            if stop:
+                return
+
+
+class _QueueLogger(Logger):
+    # The logger is not registered in logging manager,
+    # so it delegates level checks to the target one.
+
+    def __init__(self, target: Logger) -> None:
+        super().__init__(target.name)
+        self.propagate = False
+        self._target = target
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self._target.isEnabledFor(level)
+
+    def getEffectiveLevel(self) -> int:
+        return self._target.getEffectiveLevel()
+
+
+class _QueueHandler(Handler):
+    def __init__(self, policy: QueueLoggingPolicy, target: Logger) -> None:
+        super().__init__()
+        self._policy = policy
+        self._target = target
+
+    def emit(self, record: LogRecord) -> None:
+        # Message is rendered here, since arguments can be changed
+        # before the record is written.
+        record.msg = record.getMessage()
+        record.args = None
+        self._policy.put(self._target, record)
@@ -0,0 +1,74 @@
+import asyncio
+import typing as t
+
+
+LoopFactory = t.Callable[[], asyncio.AbstractEventLoop]
+
+
+def default_loop_factory() -> asyncio.AbstractEventLoop:
+    """Returns new event loop of the current policy"""
+    return asyncio.new_event_loop()
+
+
+def uvloop_factory() -> asyncio.AbstractEventLoop:
+    """Returns new uvloop event loop, raises ``ImportError`` if it is not installed"""
+    import uvloop  # type: ignore
+
+    return t.cast(asyncio.AbstractEventLoop, uvloop.new_event_loop())
+
+
+def auto_loop_factory() -> asyncio.AbstractEventLoop:
+    """Returns new uvloop event loop if it is installed, or the default one"""
+    try:
+        return uvloop_factory()
+    except ImportError:
+        return default_loop_factory()
+
+
+def running_loop() -> t.Optional[asyncio.AbstractEventLoop]:
+    # Unlike ``asyncio.get_running_loop`` it is available in Python 3.6
+    # and does not raise error, when there is no running loop.
+    return asyncio._get_running_loop()
+
+
+def current_loop() -> t.Optional[asyncio.AbstractEventLoop]:
+    """
+    Returns the running loop, or the one set by ``asyncio.set_event_loop``
+
+    Unlike ``asyncio.get_event_loop`` it does not create new loop,
+    and it does not return closed one.
+
+    """
+    loop = running_loop()
+    if loop is None:
+        # Loop of the current thread is not exposed by public API of the policy
+        local = getattr(asyncio.get_event_loop_policy(), "_local", None)
+        loop = getattr(local, "_loop", None)
+    if loop is None or loop.is_closed():
+        return None
+    return loop
+
+
+def close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Closes event loop the same way as ``asyncio.run`` does
+
+    Cancels the rest tasks, shuts down asynchronous generators
+    and default executor, and then closes the loop.
+
+    """
+    all_tasks = getattr(asyncio, "all_tasks", None)
+    if all_tasks is None:  # pragma: no cover
+        all_tasks = asyncio.Task.all_tasks  # type: ignore  # Python 3.6
+    try:
+        tasks = [task for task in all_tasks(loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        shutdown_default_executor = getattr(loop, "shutdown_default_executor", None)
+        if shutdown_default_executor is not None:  # Python 3.9+
+            loop.run_until_complete(shutdown_default_executor())
+    finally:
+        loop.close()
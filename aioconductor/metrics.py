@@ -0,0 +1,268 @@
+import asyncio
+import bisect
+import typing as t
+
+from .component import Component
+from .instrument import Event, Instrument
+from .server import HTTPComponent, Response
+
+
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets
+
+    Counters are preallocated, so that observation
+    does not allocate anything but the sum.
+
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    buckets: t.Sequence[float]
+    counts: t.List[int]
+    sum: float
+    count: int
+
+    def __init__(self, buckets: t.Sequence[float] = BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str = "") -> t.Iterator[str]:
+        """Yields lines of Prometheus text exposition format"""
+        prefix = f"{labels}," if labels else ""
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}'
+        yield f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}'
+        suffix = f"{{{labels}}}" if labels else ""
+        yield f"{name}_sum{suffix} {self.sum}"
+        yield f"{name}_count{suffix} {self.count}"
+
+
+HISTOGRAMS = (
+    (
+        "aioconductor_waiting_seconds",
+        "Time spent waiting for dependencies and scheduler slot before setup",
+        Event.ACQUIRING,
+        Event.SETTING_UP,
+    ),
+    (
+        "aioconductor_setup_seconds",
+        "Duration of on_setup hook",
+        Event.SETTING_UP,
+        Event.ACTIVE,
+    ),
+    (
+        "aioconductor_releasing_seconds",
+        "Time spent waiting for release by dependents before shutdown",
+        Event.RELEASING,
+        Event.SHUTTING_DOWN,
+    ),
+    (
+        "aioconductor_shutdown_seconds",
+        "Duration of on_shutdown hook",
+        Event.SHUTTING_DOWN,
+        Event.INACTIVE,
+    ),
+)
+
+# Event finishing a phase -> index of its histogram
+ENDS = {end: index for index, (_, _, _, end) in enumerate(HISTOGRAMS)}
+
+
+class Metrics(Instrument):
+    """
+    Lifecycle metrics
+
+    Collects histograms of lifecycle phases per component class,
+    number of dependents holding each active component,
+    and lag of event loop sampled while exporter is active.
+    Metrics are rendered in Prometheus text exposition format
+    and can be exposed by exporter component:
+
+    ..  code-block:: python
+
+        metrics = Metrics()
+        conductor = Conductor(instruments=[metrics])
+        conductor.add(metrics.exporter(port=9100))
+
+    Everything runs within the event loop, so no locks are needed.
+    Histograms are created on the first event of component class,
+    after that observations only update preallocated counters.
+
+    """
+
+    histograms: t.Dict[str, t.Tuple[Histogram, ...]]
+    loop_lag: Histogram
+
+    _labels: t.Dict[t.Type[Component], str]
+    _started: t.Dict[Component, float]
+    _active: t.Dict[Component, None]
+
+    def __init__(self, buckets: t.Sequence[float] = BUCKETS) -> None:
+        self._buckets = buckets
+        self.histograms = {}
+        self.loop_lag = Histogram(buckets)
+        self._labels = {}
+        self._started = {}
+        self._active = {}
+
+    def __call__(self, component: Component, event: Event) -> None:
+        now = component.loop.time()
+        try:
+            index = ENDS[event]
+        except KeyError:
+            self._started[component] = now
+            return
+        histograms = self._histograms(component.__class__)
+        histograms[index].observe(now - self._started.pop(component, now))
+        if event is Event.INACTIVE:
+            self._active.pop(component, None)
+        elif event is Event.ACTIVE:
+            self._active[component] = None
+        else:
+            self._started[component] = now
+
+    def render(self) -> str:
+        """Returns metrics in Prometheus text exposition format"""
+        lines = []
+        for index, (name, description, _, _) in enumerate(HISTOGRAMS):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} histogram")
+            for label, histograms in self.histograms.items():
+                lines.extend(histograms[index].render(name, label))
+        name = "aioconductor_dependents"
+        lines.append(f"# HELP {name} Number of dependents holding active component")
+        lines.append(f"# TYPE {name} gauge")
+        for component in self._active:
+            label = self._instance_label(component)
+            lines.append(f"{name}{{{label}}} {component._state.refs}")
+        tasks = [c for c in self._active if c._tasks is not None]
+        for name, kind, description, attr in (
+            ("aioconductor_tasks", "gauge", "Number of live background tasks", "live"),
+            (
+                "aioconductor_task_cpu_seconds_total",
+                "counter",
+                "CPU time spent in background tasks",
+                "cpu_time",
+            ),
+        ):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for component in tasks:
+                label = self._instance_label(component)
+                value = getattr(component._tasks, attr)
+                lines.append(f"{name}{{{label}}} {value}")
+        name = "aioconductor_loop_lag_seconds"
+        lines.append(f"# HELP {name} Lag of event loop")
+        lines.append(f"# TYPE {name} histogram")
+        lines.extend(self.loop_lag.render(name))
+        lines.append("")
+        return "\n".join(lines)
+
+    def exporter(
+        self,
+        host: str = "127.0.0.1",
+        port: t.Optional[int] = None,
+        path: t.Optional[str] = None,
+        interval: float = 0.1,
+    ) -> t.Type["Exporter"]:
+        """
+        Returns exporter component class bound to this instance
+
+        The exporter listens on Unix socket, if ``path`` is given,
+        and on TCP ``host`` and ``port`` otherwise.
+        Lag of event loop is sampled each ``interval`` seconds.
+
+        """
+        attrs = {
+            "__module__": Exporter.__module__,
+            "__metrics__": self,
+            "__address__": (host, port, path),
+            "__interval__": interval,
+        }
+        return t.cast(t.Type[Exporter], type("Exporter", (Exporter,), attrs))
+
+    def _histograms(
+        self,
+        component_class: t.Type[Component],
+    ) -> t.Tuple[Histogram, ...]:
+        label = self._label(component_class)
+        try:
+            return self.histograms[label]
+        except KeyError:
+            histograms = tuple(Histogram(self._buckets) for _ in HISTOGRAMS)
+            self.histograms[label] = histograms
+            return histograms
+
+    def _label(self, component_class: t.Type[Component]) -> str:
+        try:
+            return self._labels[component_class]
+        except KeyError:
+            label = (
+                f'component="{component_class.__module__}.'
+                f'{component_class.__qualname__}"'
+            )
+            self._labels[component_class] = label
+            return label
+
+    def _instance_label(self, component: Component) -> str:
+        label = self._label(component.__class__)
+        if component.key is None:
+            return label
+        return f'{label},key="{_escape(str(component.key))}"'
+
+
+class Exporter(HTTPComponent):
+    """
+    Exporter of metrics in Prometheus text exposition format
+
+    Serves ``GET /metrics`` and samples lag of event loop while active.
+    It should be created by :meth:`Metrics.exporter`.
+
+    """
+
+    __metrics__: t.ClassVar[t.Optional[Metrics]] = None
+    __interval__: t.ClassVar[float] = 0.1
+
+    sampler: t.Optional["asyncio.Task[None]"] = None
+
+    async def on_setup(self) -> None:
+        await super().on_setup()
+        if self.__metrics__ is not None:
+            self.sampler = self.spawn(self._sample(self.__metrics__), name="sampler")
+
+    async def on_shutdown(self) -> None:
+        # The sampler is already cancelled and awaited with the rest tasks
+        self.sampler = None
+        await super().on_shutdown()
+
+    def respond(self, target: str) -> Response:
+        if self.__metrics__ is not None and target == "/metrics":
+            body = self.__metrics__.render().encode()
+            return 200, b"OK", b"text/plain; version=0.0.4", body
+        return super().respond(target)
+
+    async def _sample(self, metrics: Metrics) -> None:
+        interval = self.__interval__
+        while True:
+            start = self.loop.time()
+            await asyncio.sleep(interval)
+            metrics.loop_lag.observe(max(self.loop.time() - start - interval, 0.0))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,56 @@
+import typing as t
+
+from .component import Component
+from .instrument import Event, Instrument
+
+
+PoolKey = t.Tuple[t.Type[Component], t.Tuple[t.Hashable, ...]]
+
+
+class Pool(Component, t.Mapping[t.Hashable, Component]):
+    """
+    Pool of keyed instances of component
+
+    The pool is created by conductor for each dependency referenced by
+    :meth:`Component.pool`.  It depends on each instance, so the instances
+    are set up concurrently (within limits of scheduler) before the pool,
+    and shut down after it.  The pool is a mapping of keys to instances.
+    It is an internal node of dependency graph, so it is not reported
+    to instruments.
+
+    """
+
+    members: t.Dict[t.Hashable, Component]
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.members = {}
+
+    def __repr__(self) -> str:
+        component_class, keys = t.cast(PoolKey, self.key)
+        return (
+            f"<{self.__class__.__module__}.{self.__class__.__name__}("
+            f"{component_class.__module__}.{component_class.__name__}"
+            f" x {len(keys)})>"
+        )
+
+    def __getitem__(self, key: t.Hashable) -> Component:
+        return self.members[key]
+
+    def __iter__(self) -> t.Iterator[t.Hashable]:
+        return iter(self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __hash__(self) -> int:
+        return object.__hash__(self)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def _inject(self, name: str, component: Component) -> None:
+        self.members[component.key] = component
+
+    def _notify(self, instruments: t.Sequence[Instrument], event: Event) -> None:
+        pass
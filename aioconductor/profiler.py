@@ -0,0 +1,207 @@
+import json
+import os
+import time
+import typing as t
+
+from .component import Component
+from .instrument import Event, Instrument
+
+
+PHASES = (
+    ("waiting", Event.ACQUIRING, Event.SETTING_UP),
+    ("setup", Event.SETTING_UP, Event.ACTIVE),
+    ("releasing", Event.RELEASING, Event.SHUTTING_DOWN),
+    ("shutdown", Event.SHUTTING_DOWN, Event.INACTIVE),
+)
+
+
+class Profiler(Instrument):
+    """
+    Lifecycle Profiler
+
+    Records timestamps of lifecycle events of components,
+    finds critical paths of setup and shutdown,
+    and exports results as a text report or a Chrome trace,
+    which can be opened by ``chrome://tracing`` or https://ui.perfetto.dev
+    The report also includes accounting of background tasks of components.
+
+    ..  code-block:: python
+
+        profiler = Profiler()
+        conductor = Conductor(instruments=[profiler])
+        ...
+        print(profiler.report())
+        profiler.dump("startup.trace.json")
+
+    """
+
+    timestamps: t.Dict[Component, t.Dict[Event, float]]
+    dependencies: t.Dict[Component, t.Tuple[Component, ...]]
+
+    def __init__(self, clock: t.Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.timestamps = {}
+        self.dependencies = {}
+
+    def __call__(self, component: Component, event: Event) -> None:
+        timestamp = self._clock()
+        try:
+            self.timestamps[component][event] = timestamp
+        except KeyError:
+            self.timestamps[component] = {event: timestamp}
+        if event is Event.SETTING_UP:
+            self.dependencies[component] = tuple(component.depends_on)
+
+    def durations(self, component: Component) -> t.Dict[str, float]:
+        """Returns durations of lifecycle phases of the component in seconds"""
+        timestamps = self.timestamps.get(component, {})
+        return {
+            phase: timestamps[end] - timestamps[start]
+            for phase, start, end in PHASES
+            if start in timestamps and end in timestamps
+        }
+
+    def tasks(self) -> t.Dict[Component, t.Dict[str, t.Any]]:
+        """
+        Returns accounting of background tasks of components
+
+        Components are sorted by CPU time spent in their tasks,
+        see :class:`TaskGroup`.
+
+        """
+        stats = {
+            component: component._tasks.stats()
+            for component in self.timestamps
+            if component._tasks is not None
+        }
+        return dict(sorted(stats.items(), key=lambda i: -i[1]["cpu_time"]))
+
+    def critical_path(self, shutdown: bool = False) -> t.List[Component]:
+        """
+        Returns critical path of setup (or shutdown) process
+
+        The path starts from the component, which setup (shutdown) is finished last,
+        and goes back through dependencies (dependents), which are finished last.
+        The path is returned in order of execution.
+
+        """
+        if shutdown:
+            event = Event.INACTIVE
+            predecessors: t.Dict[Component, t.List[Component]] = {}
+            for component, dependencies in self.dependencies.items():
+                for dependency in dependencies:
+                    predecessors.setdefault(dependency, []).append(component)
+        else:
+            event = Event.ACTIVE
+            predecessors = {
+                component: list(dependencies)
+                for component, dependencies in self.dependencies.items()
+            }
+
+        def finished(component: Component) -> float:
+            return self.timestamps[component][event]
+
+        candidates = [c for c in self.timestamps if event in self.timestamps[c]]
+        path = []
+        while candidates:
+            component = max(candidates, key=finished)
+            path.append(component)
+            candidates = [
+                c
+                for c in predecessors.get(component, ())
+                if event in self.timestamps.get(c, {})
+            ]
+        path.reverse()
+        return path
+
+    def report(self) -> str:
+        """Returns text report on critical paths and the slowest components"""
+        lines = []
+        for title, shutdown, start, end, phases in (
+            ("Setup", False, Event.ACQUIRING, Event.ACTIVE, ("waiting", "setup")),
+            (
+                "Shutdown",
+                True,
+                Event.RELEASING,
+                Event.INACTIVE,
+                ("releasing", "shutdown"),
+            ),
+        ):
+            path = self.critical_path(shutdown)
+            if not path:
+                continue
+            total = self.timestamps[path[-1]][end] - min(
+                timestamps[start]
+                for timestamps in self.timestamps.values()
+                if start in timestamps
+            )
+            lines.append(f"{title} critical path: {total * 1000:.3f} ms")
+            for component in path:
+                lines.append(f"    {component!r}{self._format(component, phases)}")
+            lines.append(f"{title} by component:")
+            slowest = sorted(
+                (c for c in self.timestamps if phases[1] in self.durations(c)),
+                key=lambda c: self.durations(c)[phases[1]],
+                reverse=True,
+            )
+            for component in slowest:
+                lines.append(f"    {component!r}{self._format(component, phases)}")
+        tasks = self.tasks()
+        if tasks:
+            lines.append("Tasks by component:")
+            for component, stats in tasks.items():
+                lines.append(
+                    f"    {component!r}  cpu {stats['cpu_time'] * 1000:.3f} ms"
+                    f"  live {stats['live']}  spawned {stats['spawned']}"
+                    f"  failed {stats['failed']}"
+                )
+        return "\n".join(lines)
+
+    def trace(self) -> t.Dict[str, t.Any]:
+        """Returns Chrome trace of lifecycle phases, one thread per component"""
+        origin = min(
+            (min(timestamps.values()) for timestamps in self.timestamps.values()),
+            default=0.0,
+        )
+        pid = os.getpid()
+        events: t.List[t.Dict[str, t.Any]] = []
+        for tid, component in enumerate(self.timestamps, 1):
+            name = repr(component)
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+            timestamps = self.timestamps[component]
+            for phase, start, end in PHASES:
+                if start in timestamps and end in timestamps:
+                    events.append(
+                        {
+                            "name": phase,
+                            "cat": "aioconductor",
+                            "ph": "X",
+                            "ts": (timestamps[start] - origin) * 1e6,
+                            "dur": (timestamps[end] - timestamps[start]) * 1e6,
+                            "pid": pid,
+                            "tid": tid,
+                            "args": {"component": name},
+                        }
+                    )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str) -> None:
+        """Writes Chrome trace into the file"""
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
+
+    def _format(self, component: Component, phases: t.Iterable[str]) -> str:
+        durations = self.durations(component)
+        return "".join(
+            f"  {phase} {durations[phase] * 1000:.3f} ms"
+            for phase in phases
+            if phase in durations
+        )
@@ -0,0 +1,171 @@
+import asyncio
+import heapq
+import itertools
+import typing as t
+from abc import ABC, abstractmethod
+
+from .component import Component
+from .graph import Graph
+
+
+class Slot:
+    """Asynchronous context manager, which holds a slot to run component hook"""
+
+    __slots__ = ()
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        pass
+
+
+class Scheduler(ABC):
+    def prepare(self, graph: Graph[Component]) -> None:
+        """Prepares scheduler to run hooks of components of the graph"""
+
+    @abstractmethod
+    def setup(self, component: Component) -> Slot:
+        """Returns slot to run ``on_setup`` hook of the component"""
+
+    @abstractmethod
+    def shutdown(self, component: Component) -> Slot:
+        """Returns slot to run ``on_shutdown`` hook of the component"""
+
+
+class SimpleScheduler(Scheduler):
+    """Scheduler without any limits"""
+
+    _slot = Slot()
+
+    def setup(self, component: Component) -> Slot:
+        return self._slot
+
+    def shutdown(self, component: Component) -> Slot:
+        return self._slot
+
+
+class PrioritySemaphore:
+    """
+    Semaphore, which wakes up waiters with higher priority first
+
+    Waiters with equal priority are woken up in FIFO order.
+
+    """
+
+    _value: int
+    _waiters: t.List[t.Tuple[int, int, asyncio.Future]]
+
+    def __init__(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("Semaphore value should be positive")
+        self._value = value
+        self._waiters = []
+        self._counter = itertools.count()
+
+    def locked(self) -> bool:
+        return self._value == 0
+
+    async def acquire(self, priority: int = 0) -> None:
+        if self._value and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+class PrioritySlot(Slot):
+    __slots__ = ("_semaphores", "_priority")
+
+    def __init__(
+        self,
+        semaphores: t.Sequence[PrioritySemaphore],
+        priority: int,
+    ) -> None:
+        self._semaphores = semaphores
+        self._priority = priority
+
+    async def __aenter__(self) -> None:
+        acquired: t.List[PrioritySemaphore] = []
+        try:
+            for semaphore in self._semaphores:
+                await semaphore.acquire(self._priority)
+                acquired.append(semaphore)
+        except BaseException:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        for semaphore in reversed(self._semaphores):
+            semaphore.release()
+
+
+class BoundedScheduler(Scheduler):
+    """
+    Scheduler with bounded concurrency
+
+    Argument ``limit`` restricts number of hooks running concurrently.
+    Argument ``tags`` restricts number of concurrently running hooks
+    of components, which share the same tag in ``__tags__`` attribute.
+    For instance, ``tags={"db": 4}`` means that no more than four components
+    tagged by ``"db"`` can open their connection pools at the same time.
+
+    When a slot is contended, it is given to the component with
+    the longest critical path first, i.e. the component blocking
+    the longest chain of dependents on setup.  On shutdown the component
+    with the longest chain of dependencies goes first.
+
+    """
+
+    _global: t.Optional[PrioritySemaphore]
+    _tags: t.Dict[str, PrioritySemaphore]
+    _graph: t.Optional[Graph[Component]]
+
+    def __init__(
+        self,
+        limit: t.Optional[int] = None,
+        tags: t.Optional[t.Mapping[str, int]] = None,
+    ) -> None:
+        self._global = PrioritySemaphore(limit) if limit is not None else None
+        self._tags = {
+            tag: PrioritySemaphore(value) for tag, value in (tags or {}).items()
+        }
+        self._graph = None
+
+    def prepare(self, graph: Graph[Component]) -> None:
+        self._graph = graph
+
+    def setup(self, component: Component) -> Slot:
+        priority = (
+            self._graph.height.get(component, 0) if self._graph is not None else 0
+        )
+        return PrioritySlot(self._semaphores(component), priority)
+
+    def shutdown(self, component: Component) -> Slot:
+        priority = self._graph.level.get(component, 0) if self._graph is not None else 0
+        return PrioritySlot(self._semaphores(component), priority)
+
+    def _semaphores(self, component: Component) -> t.List[PrioritySemaphore]:
+        # Tags go first, so that global slot is held by running hooks only.
+        # Tags are sorted to acquire them in the same order and avoid deadlocks.
+        semaphores = [
+            self._tags[tag] for tag in sorted(component.__tags__) if tag in self._tags
+        ]
+        if self._global is not None:
+            semaphores.append(self._global)
+        return semaphores
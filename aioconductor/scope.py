@@ -0,0 +1,197 @@
+import typing as t
+
+from .component import Component
+from .exc import CircularDependencyError, ComponentError
+from .lazy import Lazy
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .conductor import Conductor
+
+
+T = t.TypeVar("T", bound=Component)
+
+# Class, config, logger, and injections of scoped component.
+# Injection refers either to preceding scoped component by its index,
+# or to component of parent conductor.
+Step = t.Tuple[
+    t.Type[Component],
+    t.Any,
+    t.Any,
+    t.Tuple[t.Tuple[str, t.Union[int, Component, Lazy]], ...],
+]
+
+
+class Scope:
+    """
+    Precompiled plan of scoped components
+
+    Root components of scope and their dependencies, which classes
+    are marked by ``__scoped__`` attribute, are created per scope entry,
+    e.g. per request or per job.  Other dependencies are components
+    of parent conductor.
+    The latter are injected as is, they are neither acquired nor released,
+    so scopes should be exited before shutdown of parent conductor.
+
+    Components of parent conductor should be added to it (explicitly
+    or as dependencies of added ones) before the scope is created,
+    ``ComponentError`` is raised otherwise.
+
+    Scope is created by :meth:`Conductor.scope` once per set of root classes.
+    Config, logger, dependencies and setup order are resolved at that time,
+    so that entry only constructs scoped components, injects dependencies
+    and calls ``on_setup`` hooks one by one, and exit calls ``on_shutdown``
+    hooks in reverse order.  Instruments, scheduler, blocking hooks,
+    and lifecycle logging are not applied to scoped components.
+
+    ..  code-block:: python
+
+        scope = conductor.scope(UnitOfWork)
+
+        async def handle(request):
+            async with scope() as components:
+                await components[UnitOfWork].commit(...)
+
+    """
+
+    __slots__ = ("conductor", "roots", "_steps", "_index", "_parents")
+
+    conductor: "Conductor"
+    roots: t.Tuple[t.Type[Component], ...]
+
+    _steps: t.Tuple[Step, ...]
+    _index: t.Dict[t.Type[Component], int]
+    _parents: t.Tuple[Component, ...]
+
+    def __init__(
+        self,
+        conductor: "Conductor",
+        roots: t.Iterable[t.Type[Component]],
+    ) -> None:
+        self.conductor = conductor
+        self.roots = tuple(roots)
+        conductor.graph  # resolves dependencies of added components
+        steps: t.List[Step] = []
+        index: t.Dict[t.Type[Component], int] = {}
+        parents: t.Dict[Component, None] = {}
+        path: t.List[t.Type[Component]] = []
+
+        def visit(requested_class: t.Type[Component]) -> int:
+            component_class = conductor.patches.get(requested_class, requested_class)
+            try:
+                position = index[component_class]
+            except KeyError:
+                pass
+            else:
+                index.setdefault(requested_class, position)
+                return position
+            if component_class in path:
+                chain = path[path.index(component_class) :] + [component_class]
+                raise CircularDependencyError(*chain)
+            path.append(component_class)
+            injections: t.List[t.Tuple[str, t.Union[int, Component, Lazy]]] = []
+            references = component_class.__references__
+            for name, dependency_class in component_class.__depends_on__.items():
+                actual_class = conductor.patches.get(dependency_class, dependency_class)
+                reference = references.get(name)
+                if reference is None and actual_class.__scoped__:
+                    injections.append((name, visit(actual_class)))
+                    continue
+                dependency = conductor._dependency(actual_class, reference, False)
+                if dependency is None:
+                    injections.append((name, Lazy(conductor, actual_class)))
+                    continue
+                parents[dependency] = None
+                injections.append((name, dependency))
+            path.pop()
+            position = index[component_class] = len(steps)
+            index.setdefault(requested_class, position)
+            steps.append(
+                (
+                    component_class,
+                    conductor.config_policy(component_class),
+                    conductor.logging_policy(component_class),
+                    tuple(injections),
+                )
+            )
+            return position
+
+        for root in self.roots:
+            visit(root)
+        self._steps = tuple(steps)
+        self._index = index
+        self._parents = tuple(parents)
+
+    def __call__(self) -> "ScopeContext":
+        """Returns context manager, which enters the scope"""
+        return ScopeContext(self)
+
+    def __repr__(self) -> str:
+        names = ", ".join(f"{c.__module__}.{c.__name__}" for c in self.roots)
+        return f"<Scope {names}>"
+
+
+class ScopeContext:
+    """
+    Entry of scope
+
+    It is an asynchronous context manager, which sets up scoped components
+    on enter and shuts them down on exit.  Scoped component is available
+    by its class (or by the class it patches) within the context.
+
+    """
+
+    __slots__ = ("scope", "components")
+
+    scope: Scope
+    components: t.List[Component]
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.components = []
+
+    def __getitem__(self, component_class: t.Type[T]) -> T:
+        return t.cast(T, self.components[self.scope._index[component_class]])
+
+    async def __aenter__(self) -> "ScopeContext":
+        scope = self.scope
+        for parent in scope._parents:
+            if not parent._state.active:
+                raise ComponentError(f"{parent!r}: Component is not active")
+        conductor = scope.conductor
+        loop = conductor.loop
+        executor = conductor.executor
+        components = self.components
+        for component_class, config, logger, injections in scope._steps:
+            component = component_class(config=config, logger=logger, loop=loop)
+            component.executor = executor
+            for name, dependency in injections:
+                if isinstance(dependency, int):
+                    dependency = components[dependency]
+                setattr(component, name, dependency)
+            try:
+                await component.on_setup()
+            except BaseException:
+                if component._tasks is not None:
+                    await component._tasks.cancel()
+                await self._shutdown()
+                raise
+            component._state.activate()
+            components.append(component)
+        return self
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        components = self.components
+        while components:
+            component = components.pop()
+            component._state.deactivate()
+            try:
+                if component._tasks is not None:
+                    await component._tasks.cancel()
+                await component.on_shutdown()
+            except Exception:
+                component.logger.exception(
+                    "%r: Unexpected error during shutdown", component
+                )
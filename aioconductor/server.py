@@ -0,0 +1,83 @@
+import asyncio
+import typing as t
+
+from .component import Component
+
+
+Address = t.Tuple[str, t.Optional[int], t.Optional[str]]
+Response = t.Tuple[int, bytes, bytes, bytes]
+
+
+class HTTPComponent(Component):
+    """
+    Base of lightweight HTTP components
+
+    It listens on Unix socket, if ``path`` of ``__address__`` is given,
+    and on TCP ``host`` and ``port`` otherwise.
+    It answers each request by :meth:`respond` and closes connection.
+    Connection is closed without answer, if the request is not read
+    within ``__read_timeout__`` seconds.
+
+    """
+
+    __address__: t.ClassVar[Address] = ("127.0.0.1", None, None)
+    __read_timeout__: t.ClassVar[float] = 5.0
+
+    server: t.Optional[t.Any] = None
+
+    async def on_setup(self) -> None:
+        host, port, path = self.__address__
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+        self.logger.info("%r: Listening on %s", self, self.address)
+
+    async def on_shutdown(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    @property
+    def address(self) -> t.Any:
+        """Address of listening socket"""
+        if self.server is None:
+            return None
+        return self.server.sockets[0].getsockname()
+
+    def respond(self, target: str) -> Response:
+        """Returns status code, reason, content type, and body of response"""
+        return 404, b"Not Found", b"text/plain", b"Not Found\n"
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request = await asyncio.wait_for(
+                self._read(reader), self.__read_timeout__
+            )
+            parts = request.split()
+            target = parts[1].decode("latin-1") if len(parts) > 1 else ""
+            code, reason, content_type, body = self.respond(target)
+            writer.write(
+                b"HTTP/1.0 %d %s\r\n"
+                b"Content-Type: %s\r\n"
+                b"Content-Length: %d\r\n"
+                b"\r\n%s" % (code, reason, content_type, len(body), body)
+            )
+            await writer.drain()
+        except asyncio.TimeoutError:
+            pass
+        except ConnectionError:  # pragma: no cover
+            pass
+        finally:
+            writer.close()
+
+    async def _read(self, reader: asyncio.StreamReader) -> bytes:
+        request = await reader.readline()
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        return request
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+import typing as t
+import zlib
+from urllib.parse import quote
+
+from .component import Component
+
+
+class SnapshotStore:
+    """
+    Store of component snapshots
+
+    Snapshot of component is kept in the ``directory`` in a file
+    named by component class (and key of keyed instance) and hash of its config
+    (and ``version`` of application, if given), so that change of config or code
+    makes the previous snapshot stale.  Config should be JSON serializable,
+    ``TypeError`` is raised otherwise.  Stale snapshots of the component
+    are evicted when the new one is saved.  Snapshots older than
+    ``max_age`` seconds are evicted on load.
+
+    File starts with header, which contains checksum and length of data.
+    Data is restored by memory mapping of the file, so it is not copied.
+    Invalid file is evicted and treated as missing.
+
+    """
+
+    MAGIC = b"AIOCSNP1"
+    HEADER = struct.Struct("<8sIQ")  # magic, crc32 of data, length of data
+    SUFFIX = ".snapshot"
+
+    directory: str
+    max_age: t.Optional[float]
+    version: str
+
+    def __init__(
+        self,
+        directory: str,
+        max_age: t.Optional[float] = None,
+        version: str = "",
+    ) -> None:
+        self.directory = directory
+        self.max_age = max_age
+        self.version = version
+
+    def path(self, component: Component) -> str:
+        """Returns path to snapshot of the component"""
+        digest = hashlib.sha256(self.version.encode())
+        config = json.dumps(component.config, sort_keys=True, default=_default)
+        digest.update(config.encode())
+        return os.path.join(
+            self.directory,
+            f"{self._prefix(component)}{digest.hexdigest()[:16]}{self.SUFFIX}",
+        )
+
+    def load(self, component: Component) -> t.Optional[memoryview]:
+        """Returns data of valid snapshot of the component, or ``None``"""
+        path = self.path(component)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            stat = os.fstat(f.fileno())
+            header = self.HEADER.size
+            if stat.st_size < header or (
+                self.max_age is not None and time.time() - stat.st_mtime > self.max_age
+            ):
+                data = None
+            else:
+                buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                magic, checksum, length = self.HEADER.unpack_from(buffer)
+                data = buffer[header:]
+                if (
+                    magic != self.MAGIC
+                    or length != len(data)
+                    or zlib.crc32(data) != checksum
+                ):
+                    data = None
+        if data is None:
+            self._remove(path)
+        return data
+
+    def save(self, component: Component, data: bytes) -> None:
+        """Saves snapshot of the component and evicts its stale snapshots"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(component)
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, zlib.crc32(data), len(data)))
+                f.write(data)
+            os.replace(temp, path)
+        except BaseException:
+            self._remove(temp)
+            raise
+        prefix = self._prefix(component)
+        for name in os.listdir(self.directory):
+            stale = os.path.join(self.directory, name)
+            if name.startswith(prefix) and name.endswith(self.SUFFIX) and stale != path:
+                self._remove(stale)
+
+    def discard(self, component: Component) -> None:
+        """Removes snapshot of the component"""
+        self._remove(self.path(component))
+
+    def _prefix(self, component: Component) -> str:
+        component_class = component.__class__
+        name = f"{component_class.__module__}.{component_class.__qualname__}"
+        if component.key is not None:
+            name += f"[{quote(str(component.key), safe='')}]"
+        return f"{name}-"
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _default(value: t.Any) -> t.Any:
+    if isinstance(value, t.Mapping):
+        return dict(value)
+    # Default repr of object is unstable, so it cannot be a part of the key
+    raise TypeError(f"Config value {value!r} is not JSON serializable")
@@ -0,0 +1,96 @@
+import time
+import typing as t
+from collections import deque
+from enum import Enum
+
+from .component import Component
+from .graph import Graph
+
+
+class Strategy(str, Enum):
+    """
+    Restart strategies
+
+    *   ``ONE_FOR_ONE`` — failed component is restarted with its dependents;
+    *   ``REST_FOR_ONE`` — failed component is restarted with all components,
+        which are set up after it.
+
+    """
+
+    ONE_FOR_ONE = "one_for_one"
+    REST_FOR_ONE = "rest_for_one"
+
+
+class Supervisor:
+    """
+    Restart policy of conductor
+
+    Component, which fails on setup, or reports failure by
+    :meth:`Component.fail` when active, is restarted after delay,
+    which grows exponentially from ``backoff`` by ``factor`` up to
+    ``max_backoff`` with number of its restarts within ``period`` seconds.
+    If there are more than ``max_restarts`` restarts within ``period``,
+    supervisor gives up: failed setup is raised as usual,
+    and serving conductor is stopped.
+
+    ..  code-block:: python
+
+        conductor = Conductor(supervisor=Supervisor(max_restarts=5, period=60))
+
+    """
+
+    strategy: Strategy
+    max_restarts: int
+    period: float
+    backoff: float
+    factor: float
+    max_backoff: float
+
+    _history: t.Deque[t.Tuple[float, Component]]
+
+    def __init__(
+        self,
+        strategy: Strategy = Strategy.ONE_FOR_ONE,
+        max_restarts: int = 3,
+        period: float = 60.0,
+        backoff: float = 0.1,
+        factor: float = 2.0,
+        max_backoff: float = 30.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.strategy = Strategy(strategy)
+        self.max_restarts = max_restarts
+        self.period = period
+        self.backoff = backoff
+        self.factor = factor
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._history = deque()
+
+    def affected(
+        self,
+        graph: Graph[Component],
+        component: Component,
+    ) -> t.List[Component]:
+        """Returns components to be restarted in setup order"""
+        if self.strategy is Strategy.REST_FOR_ONE:
+            return graph.order[graph.order.index(component) :]
+        return graph.dependent_closure([component])
+
+    def restart(self, component: Component) -> t.Optional[float]:
+        """
+        Registers restart of component
+
+        Returns delay before the restart,
+        or ``None`` if restart intensity is exceeded.
+
+        """
+        now = self._clock()
+        history = self._history
+        while history and history[0][0] <= now - self.period:
+            history.popleft()
+        if len(history) >= self.max_restarts:
+            return None
+        restarts = sum(1 for _, c in history if c is component)
+        history.append((now, component))
+        return min(self.backoff * self.factor ** restarts, self.max_backoff)
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import typing as t
+from collections.abc import Coroutine
+
+
+# CPU time of the current thread, so that executor threads are not counted
+_clock = getattr(time, "thread_time", time.process_time)
+
+ErrorHandler = t.Callable[[BaseException], None]
+
+_INTROSPECTED = frozenset(
+    ("__name__", "__qualname__", "cr_code", "cr_frame", "cr_await", "cr_running")
+)
+
+
+class TaskGroup:
+    """
+    Background tasks of component
+
+    Tasks are spawned by :meth:`Component.spawn` and bound to lifetime
+    of the component: they are cancelled and awaited on its shutdown
+    before ``on_shutdown`` hook.  Task failed with exception
+    is reported by :meth:`Component.fail`.
+
+    The group counts spawned and failed tasks and CPU time spent
+    in its tasks, i.e. in each step of their coroutines.
+
+    """
+
+    __slots__ = ("loop", "tasks", "spawned", "failed", "cpu_time", "_on_error")
+
+    loop: asyncio.AbstractEventLoop
+    tasks: t.Set["asyncio.Task[t.Any]"]
+    spawned: int
+    failed: int
+    cpu_time: float
+
+    _on_error: t.Optional[ErrorHandler]
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_error: t.Optional[ErrorHandler] = None,
+    ) -> None:
+        self.loop = loop
+        self.tasks = set()
+        self.spawned = 0
+        self.failed = 0
+        self.cpu_time = 0.0
+        self._on_error = on_error
+
+    @property
+    def live(self) -> int:
+        """Number of tasks, which are not done yet"""
+        return len(self.tasks)
+
+    def spawn(
+        self,
+        coro: t.Coroutine[t.Any, t.Any, t.Any],
+        name: t.Optional[str] = None,
+    ) -> "asyncio.Task[t.Any]":
+        task = self.loop.create_task(_Timed(coro, self))
+        if name is not None and hasattr(task, "set_name"):
+            task.set_name(name)
+        self.tasks.add(task)
+        self.spawned += 1
+        task.add_done_callback(self._done)
+        return task
+
+    async def cancel(self) -> None:
+        """Cancels tasks and waits for them"""
+        while self.tasks:
+            tasks = tuple(self.tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        return {
+            "live": self.live,
+            "spawned": self.spawned,
+            "failed": self.failed,
+            "cpu_time": self.cpu_time,
+        }
+
+    def _done(self, task: "asyncio.Task[t.Any]") -> None:
+        self.tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.failed += 1
+            if self._on_error is not None:
+                self._on_error(error)
+
+
+class _Timed(Coroutine):
+    """Coroutine wrapper, which accounts CPU time of each step"""
+
+    __slots__ = ("_coro", "_group")
+
+    def __init__(self, coro: t.Coroutine[t.Any, t.Any, t.Any], group: TaskGroup):
+        self._coro = coro
+        self._group = group
+
+    def send(self, value: t.Any) -> t.Any:
+        start = _clock()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._group.cpu_time += _clock() - start
+
+    def throw(self, typ: t.Any, val: t.Any = None, tb: t.Any = None) -> t.Any:
+        start = _clock()
+        try:
+            if val is None and tb is None:
+                return self._coro.throw(typ)
+            return self._coro.throw(typ, val, tb)  # pragma: no cover
+        finally:
+            self._group.cpu_time += _clock() - start
+
+    def close(self) -> None:
+        self._coro.close()
+
+    def __await__(self) -> t.Generator[t.Any, None, t.Any]:
+        return self._coro.__await__()
+
+    def __getattr__(self, name: str) -> t.Any:
+        # Attributes of the wrapped coroutine are exposed for introspection,
+        # i.e. for repr and stack of task.
+        if name in _INTROSPECTED:
+            return getattr(self._coro, name)
+        raise AttributeError(name)
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import typing as t
+
+from .component import Component
+from .instrument import Event, Instrument
+
+
+UNKNOWN = "<unknown>"
+
+
+class Watchdog(Instrument):
+    """
+    Watchdog of event loop
+
+    Monitor component, created by :meth:`monitor`, ticks within the loop
+    each ``interval`` seconds and measures lag of the ticks.
+    A helper thread checks the ticks by the same high-resolution timer,
+    and when the loop is blocked longer than ``threshold`` seconds,
+    it captures the stack of the loop thread and attributes the blocked time
+    to the component class, which module owns the innermost frame of the stack.
+    If the module contains several component classes, the one,
+    which defines the function of the frame, is chosen.
+
+    Component classes are learned from lifecycle events,
+    so the watchdog should be passed to conductor as instrument:
+
+    ..  code-block:: python
+
+        watchdog = Watchdog(threshold=0.05)
+        conductor = Conductor(instruments=[watchdog])
+        conductor.add(watchdog.monitor())
+
+    Table of blocked time per component is available at runtime
+    by :meth:`blocked` and :meth:`report`, and it is logged
+    (and written into ``path``, if given) on shutdown of the monitor.
+
+    """
+
+    threshold: float
+    interval: float
+    path: t.Optional[str]
+    max_lag: float
+
+    _modules: t.Dict[str, t.List[t.Type[Component]]]
+    _blocked: t.Dict[str, float]
+    _lock: threading.Lock
+    _tick: float
+    _counted: float
+    _thread_id: t.Optional[int]
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: t.Optional[float] = None,
+        path: t.Optional[str] = None,
+    ) -> None:
+        self.threshold = threshold
+        self.interval = interval if interval is not None else threshold / 4
+        self.path = path
+        self.max_lag = 0.0
+        self._modules = {}
+        self._blocked = {}
+        self._lock = threading.Lock()
+        self._tick = self._counted = time.perf_counter()
+        self._thread_id = None
+
+    def __call__(self, component: Component, event: Event) -> None:
+        if event is Event.ACQUIRING:
+            component_class = component.__class__
+            classes = self._modules.setdefault(component_class.__module__, [])
+            if component_class not in classes:
+                classes.append(component_class)
+
+    def monitor(self) -> t.Type["Monitor"]:
+        """Returns monitor component class bound to this instance"""
+        attrs = {"__module__": Monitor.__module__, "__watchdog__": self}
+        return t.cast(t.Type[Monitor], type("Monitor", (Monitor,), attrs))
+
+    def blocked(self) -> t.Dict[str, float]:
+        """Returns blocked time in seconds per component, the longest first"""
+        with self._lock:
+            items = sorted(self._blocked.items(), key=lambda i: -i[1])
+        return dict(items)
+
+    def report(self) -> str:
+        """Returns text table of blocked milliseconds per component"""
+        lines = [f"Loop lag: max {self.max_lag * 1000:.3f} ms", "Blocked by component:"]
+        for name, blocked in self.blocked().items():
+            lines.append(f"    {name}  {blocked * 1000:.3f} ms")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """Writes table of blocked milliseconds into JSON file"""
+        blocked = {name: value * 1000 for name, value in self.blocked().items()}
+        with open(path, "w") as f:
+            json.dump({"max_lag_ms": self.max_lag * 1000, "blocked_ms": blocked}, f)
+
+    async def _ticker(self) -> None:
+        interval = self.interval
+        self._thread_id = threading.get_ident()
+        self._tick = self._counted = time.perf_counter()
+        while True:
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            self.max_lag = max(self.max_lag, now - self._tick - interval)
+            self._tick = now
+
+    def _watch(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            self._check(time.perf_counter())
+
+    def _check(self, now: float) -> None:
+        expected = self._tick + self.interval
+        if now - expected <= self.threshold or self._thread_id is None:
+            return
+        frame = sys._current_frames().get(self._thread_id)
+        name = self._owner(frame)
+        since = max(self._counted, expected)
+        self._counted = now
+        with self._lock:
+            self._blocked[name] = self._blocked.get(name, 0.0) + now - since
+
+    def _owner(self, frame: t.Any) -> str:
+        while frame is not None:
+            module = frame.f_globals.get("__name__")
+            classes = self._modules.get(module)
+            if classes:
+                if len(classes) == 1:
+                    return _name(classes[0])
+                function = frame.f_code.co_name
+                for component_class in classes:
+                    if function in component_class.__dict__:
+                        return _name(component_class)
+                return str(module)
+            frame = frame.f_back
+        return UNKNOWN
+
+
+class Monitor(Component):
+    """
+    Monitor of event loop
+
+    It runs ticker of :class:`Watchdog` within the loop and its helper thread
+    while active.  It should be created by :meth:`Watchdog.monitor`.
+
+    """
+
+    __watchdog__: t.ClassVar[t.Optional[Watchdog]] = None
+
+    thread: t.Optional[threading.Thread] = None
+    stop: t.Optional[threading.Event] = None
+
+    async def on_setup(self) -> None:
+        watchdog = self.__watchdog__
+        if watchdog is None:
+            return
+        self.spawn(watchdog._ticker(), name="watchdog")
+        self.stop = threading.Event()
+        self.thread = threading.Thread(
+            target=watchdog._watch,
+            args=(self.stop,),
+            name="aioconductor-watchdog",
+            daemon=True,
+        )
+        self.thread.start()
+
+    async def on_shutdown(self) -> None:
+        watchdog = self.__watchdog__
+        if watchdog is None or self.thread is None or self.stop is None:
+            return
+        self.stop.set()
+        await self.loop.run_in_executor(None, self.thread.join)
+        self.thread = self.stop = None
+        self.logger.info("%r: %s", self, watchdog.report())
+        if watchdog.path is not None:
+            watchdog.dump(watchdog.path)
+
+
+def _name(component_class: t.Type[Component]) -> str:
+    return f"{component_class.__module__}.{component_class.__qualname__}"
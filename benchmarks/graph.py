@@ -0,0 +1,56 @@
+"""
+Dependency graph benchmark
+
+Measures time of graph building, setup and shutdown
+of deep chains and wide fan-outs of growing size.
+Time per component should stay flat, as scheduling is linear.
+
+Usage::
+
+    python benchmarks/graph.py [size ...]
+
+"""
+
+import asyncio
+import sys
+import time
+import typing as t
+
+from aioconductor import Conductor, Component
+
+from shapes import chain, fanout
+
+
+async def measure(roots: t.List[t.Type[Component]]) -> t.Tuple[float, ...]:
+    conductor = Conductor()
+    for root in roots:
+        conductor.add(root)
+    start = time.perf_counter()
+    conductor.graph
+    built = time.perf_counter()
+    await conductor.setup()
+    active = time.perf_counter()
+    await conductor.shutdown()
+    inactive = time.perf_counter()
+    return built - start, active - built, inactive - active
+
+
+def main(sizes: t.List[int]) -> None:
+    print(
+        f"{'shape':<8}{'size':>8}{'graph, us':>12}{'setup, us':>12}{'shutdown, us':>14}"
+    )
+    for shape in (chain, fanout):
+        for size in sizes:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            timings = loop.run_until_complete(measure(shape(size)))
+            loop.close()
+            graph, setup, shutdown = (value / size * 1e6 for value in timings)
+            print(
+                f"{shape.__name__:<8}{size:>8}"
+                f"{graph:>12.2f}{setup:>12.2f}{shutdown:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1250, 2500, 5000, 10000, 20000])
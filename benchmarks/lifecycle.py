@@ -0,0 +1,198 @@
+"""
+Lifecycle benchmark
+
+Measures ``Conductor.setup`` and ``Conductor.shutdown`` of synthetic graphs
+(see ``shapes.py``): wall time, scheduling overhead per component,
+peak memory, and event loop lag.  Results are written as JSON,
+and can be compared against results of previous run.
+
+Scheduling overhead is wall time of setup (shutdown) minus ideal time,
+i.e. number of topological levels multiplied by simulated latency,
+divided by number of components.
+
+Usage::
+
+    python benchmarks/lifecycle.py --shape chain random --size 10000 50000 \\
+        --latency 0 0.001 --output after.json --compare before.json
+
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import typing as t
+
+from aioconductor import Conductor
+
+from shapes import SHAPES
+
+
+class LagMonitor:
+    """Samples event loop lag, i.e. delay of scheduled wake-ups"""
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.samples: t.List[float] = []
+        self._task: t.Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_event_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+
+    @property
+    def max(self) -> float:
+        return max(self.samples, default=0.0)
+
+    @property
+    def mean(self) -> float:
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+
+async def measure(shape: str, size: int, latency: float) -> t.Dict[str, t.Any]:
+    roots = SHAPES[shape](size, latency)
+    conductor = Conductor()
+    for root in roots:
+        conductor.add(root)
+
+    start = time.perf_counter()
+    graph = conductor.graph
+    graph_time = time.perf_counter() - start
+
+    monitor = LagMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    await conductor.setup()
+    setup_time = time.perf_counter() - start
+    start = time.perf_counter()
+    await conductor.shutdown()
+    shutdown_time = time.perf_counter() - start
+    await monitor.stop()
+
+    count = len(graph)
+    ideal = len(graph.levels) * latency
+    return {
+        "shape": shape,
+        "size": count,
+        "levels": len(graph.levels),
+        "latency": latency,
+        "graph": graph_time,
+        "setup": setup_time,
+        "shutdown": shutdown_time,
+        "setup_overhead": max(setup_time - ideal, 0.0) / count,
+        "shutdown_overhead": max(shutdown_time - ideal, 0.0) / count,
+        "loop_lag_max": monitor.max,
+        "loop_lag_mean": monitor.mean,
+    }
+
+
+async def measure_memory(shape: str, size: int) -> int:
+    roots = SHAPES[shape](size, 0.0)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        conductor = Conductor()
+        for root in roots:
+            conductor.add(root)
+        await conductor.setup()
+        await conductor.shutdown()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(shape: str, size: int, latency: float, memory: bool) -> t.Dict[str, t.Any]:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        result = loop.run_until_complete(measure(shape, size, latency))
+        if memory:
+            result["peak_memory"] = loop.run_until_complete(measure_memory(shape, size))
+        return result
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+
+
+def compare(results: t.List[t.Dict[str, t.Any]], path: str) -> None:
+    with open(path) as f:
+        baseline = {
+            (r["shape"], r["size"], r["latency"]): r for r in json.load(f)["results"]
+        }
+    print(f"\nCompared to {path}:")
+    for result in results:
+        base = baseline.get((result["shape"], result["size"], result["latency"]))
+        if base is None:
+            continue
+        changes = "".join(
+            f"  {key} {(result[key] / base[key] - 1) * 100:+.1f}%"
+            for key in ("setup", "shutdown", "peak_memory")
+            if base.get(key) and key in result
+        )
+        print(f"{result['shape']:<8}{result['size']:>8}{result['latency']:>8}{changes}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--shape", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--size", nargs="+", type=int, default=[10000, 50000])
+    parser.add_argument("--latency", nargs="+", type=float, default=[0.0, 0.001])
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    parser.add_argument("--output", help="write results as JSON into the file")
+    parser.add_argument("--compare", help="compare with results of previous run")
+    args = parser.parse_args()
+
+    print(
+        f"{'shape':<8}{'size':>8}{'latency':>8}{'setup, s':>10}{'shutdown, s':>13}"
+        f"{'overhead, us':>14}{'lag max, ms':>13}{'memory, MB':>12}"
+    )
+    results = []
+    for shape in args.shape:
+        for size in args.size:
+            for latency in args.latency:
+                result = run(shape, size, latency, not args.no_memory)
+                results.append(result)
+                print(
+                    f"{shape:<8}{result['size']:>8}{latency:>8}"
+                    f"{result['setup']:>10.3f}{result['shutdown']:>13.3f}"
+                    f"{result['setup_overhead'] * 1e6:>14.2f}"
+                    f"{result['loop_lag_max'] * 1e3:>13.2f}"
+                    f"{result.get('peak_memory', 0) / 2 ** 20:>12.1f}"
+                )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": sys.version,
+                    "platform": platform.platform(),
+                    "time": time.time(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
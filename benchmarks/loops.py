@@ -0,0 +1,117 @@
+"""
+Event loop benchmark
+
+Compares event loop implementations available to ``Conductor``:
+the default asyncio loop and uvloop (if installed).
+Measures setup and shutdown time of a random graph,
+and throughput of requests served over local TCP connections,
+as components of a network-heavy application would do.
+
+Usage::
+
+    python benchmarks/loops.py [--size 10000] [--requests 20000] [--clients 50]
+
+"""
+
+import argparse
+import asyncio
+import time
+import typing as t
+
+from aioconductor import Conductor, Component
+from aioconductor.loop import LoopFactory, default_loop_factory, uvloop_factory
+
+from shapes import random_dag
+
+
+class EchoServer(Component):
+    server: t.Any
+    port: int
+
+    async def on_setup(self) -> None:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def on_shutdown(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            writer.write(line)
+        writer.close()
+
+
+class Client(Component):
+    server: EchoServer
+
+    async def run(self, requests: int, clients: int) -> None:
+        await asyncio.gather(
+            *(self.connect(requests // clients) for _ in range(clients))
+        )
+
+    async def connect(self, requests: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        for _ in range(requests):
+            writer.write(b"ping\n")
+            await reader.readline()
+        writer.close()
+
+
+def measure_lifecycle(factory: LoopFactory, size: int) -> t.Tuple[float, float]:
+    conductor = Conductor(loop_factory=factory)
+    for root in random_dag(size):
+        conductor.add(root)
+    conductor.graph
+    start = time.perf_counter()
+    conductor.loop.run_until_complete(conductor.setup())
+    active = time.perf_counter()
+    conductor.loop.run_until_complete(conductor.shutdown())
+    inactive = time.perf_counter()
+    conductor._close_loop()
+    return active - start, inactive - active
+
+
+def measure_serving(factory: LoopFactory, requests: int, clients: int) -> float:
+    conductor = Conductor(loop_factory=factory)
+    client = conductor.add(Client)
+    conductor.loop.run_until_complete(conductor.setup())
+    start = time.perf_counter()
+    conductor.run(client.run(requests, clients))
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=50)
+    args = parser.parse_args()
+
+    factories: t.List[t.Tuple[str, LoopFactory]] = [("asyncio", default_loop_factory)]
+    try:
+        uvloop_factory().close()
+    except ImportError:
+        print("uvloop is not installed, skipped")
+    else:
+        factories.append(("uvloop", uvloop_factory))
+
+    print(f"{'loop':<10}{'setup, ms':>12}{'shutdown, ms':>14}{'requests/s':>14}")
+    for name, factory in factories:
+        setup, shutdown = measure_lifecycle(factory, args.size)
+        throughput = measure_serving(factory, args.requests, args.clients)
+        print(
+            f"{name:<10}{setup * 1000:>12.1f}{shutdown * 1000:>14.1f}"
+            f"{throughput:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Component memory benchmark
+
+Measures memory allocated per component instance:
+constructed only, and active (set up with a single dependency).
+
+Usage::
+
+    python benchmarks/memory.py [count]
+
+"""
+
+import asyncio
+import gc
+import sys
+import tracemalloc
+import typing as t
+from logging import getLogger
+
+from aioconductor import Component
+
+
+class Dependency(Component):
+    pass
+
+
+class Small(Component):
+    dependency: Dependency
+
+
+async def measure(count: int) -> t.Tuple[int, int]:
+    logger = getLogger("benchmark")
+    loop = asyncio.get_event_loop()
+    dependency = Dependency(config={}, logger=logger, loop=loop)
+    await dependency._setup({})
+
+    gc.collect()
+    tracemalloc.start()
+    components = [Small(config={}, logger=logger, loop=loop) for _ in range(count)]
+    constructed = tracemalloc.get_traced_memory()[0]
+    for component in components:
+        await component._setup({"dependency": dependency})
+    active = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return constructed, active
+
+
+def main(count: int) -> None:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    constructed, active = loop.run_until_complete(measure(count))
+    loop.close()
+    print(f"{count} components")
+    print(f"constructed: {constructed / 2 ** 20:8.2f} MB")
+    print(f"active:      {active / 2 ** 20:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
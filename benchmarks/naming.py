@@ -0,0 +1,70 @@
+"""
+Component naming benchmark
+
+Measures time of ``camelcase_to_underscore`` against the former
+implementation, which split names by uncompiled pattern,
+and time of logger resolution by ``ComponentLoggingPolicy``
+with and without its per-class cache.
+
+Usage::
+
+    python benchmarks/naming.py [number]
+
+"""
+
+import re
+import sys
+import timeit
+import typing as t
+from logging import getLogger
+
+from aioconductor import Component, ComponentLoggingPolicy
+from aioconductor.naming import camelcase_to_underscore
+
+
+NAMES = ["DB", "HTTPClient", "CoolXMLParser", "MessageQueue", "RSA512Crypt"]
+
+
+def former_camelcase_to_underscore(name: str) -> str:
+    return "_".join(
+        word.lower() for word in re.split(r"([A-Z]{1}[a-z]+|[0-9]+)", name) if word
+    )
+
+
+def uncached_policy(component_class: t.Type[Component]) -> t.Any:
+    return getLogger(
+        f"{component_class.__module__}."
+        f"{former_camelcase_to_underscore(component_class.__name__)}"
+    )
+
+
+def measure(
+    func: t.Callable[[t.Any], t.Any], args: t.List[t.Any], number: int
+) -> float:
+    def run() -> None:
+        for arg in args:
+            func(arg)
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / number / len(args)
+
+
+def main(number: int) -> None:
+    classes = [type(name, (Component,), {}) for name in NAMES]
+    policy = ComponentLoggingPolicy()
+    print(f"{'case':<32}{'former, us':>12}{'current, us':>13}")
+    for case, former, current, args in (
+        (
+            "camelcase_to_underscore",
+            former_camelcase_to_underscore,
+            camelcase_to_underscore,
+            NAMES,
+        ),
+        ("ComponentLoggingPolicy", uncached_policy, policy, classes),
+    ):
+        before = measure(former, args, number) * 1e6
+        after = measure(current, args, number) * 1e6
+        print(f"{case:<32}{before:>12.3f}{after:>13.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
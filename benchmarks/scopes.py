@@ -0,0 +1,83 @@
+"""
+Scope benchmark
+
+Measures number of request scopes entered and exited per second
+against the former approach, i.e. a new conductor per request.
+Each request needs two scoped components, which depend on
+two long-lived components of application conductor.
+
+Usage::
+
+    python benchmarks/scopes.py [number]
+
+"""
+
+import asyncio
+import sys
+import time
+
+from aioconductor import Conductor, Component
+
+
+class Database(Component):
+    pass
+
+
+class Cache(Component):
+    pass
+
+
+class Transaction(Component):
+    __scoped__ = True
+
+    db: Database
+
+
+class UnitOfWork(Component):
+    __scoped__ = True
+
+    tx: Transaction
+    cache: Cache
+
+
+async def conductor_per_request(loop: asyncio.AbstractEventLoop, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        conductor = Conductor(loop=loop)
+        conductor.add(UnitOfWork)
+        await conductor.setup()
+        await conductor.shutdown()
+    return number / (time.perf_counter() - start)
+
+
+async def scopes(conductor: Conductor, number: int) -> float:
+    scope = conductor.scope(UnitOfWork)
+    start = time.perf_counter()
+    for _ in range(number):
+        async with scope():
+            pass
+    return number / (time.perf_counter() - start)
+
+
+def main(number: int) -> None:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    conductor = Conductor(loop=loop)
+    conductor.add(Database)
+    conductor.add(Cache)
+    loop.run_until_complete(conductor.setup())
+    try:
+        former = loop.run_until_complete(
+            conductor_per_request(loop, max(number // 20, 1))
+        )
+        current = loop.run_until_complete(scopes(conductor, number))
+    finally:
+        loop.run_until_complete(conductor.shutdown())
+        loop.close()
+    print(f"{'case':<24}{'per second':>12}{'us each':>10}")
+    for case, rate in (("conductor per request", former), ("scope", current)):
+        print(f"{case:<24}{rate:>12.0f}{1e6 / rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
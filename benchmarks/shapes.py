@@ -0,0 +1,95 @@
+"""
+Synthetic component graphs
+
+Each function returns root component classes of a graph of the given size.
+Components of the graphs sleep ``latency`` seconds in their hooks.
+
+"""
+
+import asyncio
+import random
+import typing as t
+
+from aioconductor import Component
+
+
+Shape = t.Callable[[int, float], t.List[t.Type[Component]]]
+
+
+class Synthetic(Component):
+    latency: t.ClassVar[float] = 0.0
+
+    async def on_setup(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def on_shutdown(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+def component(
+    name: str,
+    latency: float,
+    dependencies: t.Sequence[t.Type[Component]] = (),
+) -> t.Type[Component]:
+    return type(
+        name,
+        (Synthetic,),
+        {
+            "latency": latency,
+            "__annotations__": {f"d{i}": d for i, d in enumerate(dependencies)},
+        },
+    )
+
+
+def chain(size: int, latency: float = 0.0) -> t.List[t.Type[Component]]:
+    """Each component depends on the previous one"""
+    last = component("C0", latency)
+    for i in range(1, size):
+        last = component(f"C{i}", latency, [last])
+    return [last]
+
+
+def fanout(size: int, latency: float = 0.0) -> t.List[t.Type[Component]]:
+    """All components depend on the single root one"""
+    root = component("Root", latency)
+    return [component(f"C{i}", latency, [root]) for i in range(1, size)]
+
+
+def diamond(
+    size: int,
+    latency: float = 0.0,
+    width: int = 8,
+) -> t.List[t.Type[Component]]:
+    """Stacked diamonds: ``width`` components between each pair of joints"""
+    joint = component("J0", latency)
+    count = 1
+    while count + width + 1 <= size:
+        middle = [component(f"M{count + i}", latency, [joint]) for i in range(width)]
+        joint = component(f"J{count + width}", latency, middle)
+        count += width + 1
+    return [joint]
+
+
+def random_dag(
+    size: int,
+    latency: float = 0.0,
+    degree: int = 3,
+    seed: int = 0,
+) -> t.List[t.Type[Component]]:
+    """Each component depends on up to ``degree`` random preceding ones"""
+    rnd = random.Random(seed)
+    classes: t.List[t.Type[Component]] = []
+    for i in range(size):
+        dependencies = rnd.sample(classes, min(degree, len(classes)))
+        classes.append(component(f"R{i}", latency, dependencies))
+    return classes
+
+
+SHAPES: t.Dict[str, Shape] = {
+    "chain": chain,
+    "fanout": fanout,
+    "diamond": diamond,
+    "random": random_dag,
+}
@@ -1,9 +1,11 @@
 import asyncio
 import logging
+import typing as t
 
 import pytest  # type: ignore
 
 from aioconductor import Component
+from aioconductor.component import State
 
 
 def test_depends_on() -> None:
@@ -39,12 +41,40 @@ def test_depends_on() -> None:
     assert Z.__depends_on__ == {"component_1": A, "component_2": B, "component_3": C}
 
 
+def test_references() -> None:
+    class A(Component):
+        pass
+
+    class B(Component):
+        pass
+
+    class X(Component):
+        first: A = A.instance(1)
+        rest: t.Mapping[int, A] = A.pool(range(2, 4))
+        b: B
+
+    class Y(X):
+        first: A  # type: ignore
+        b: B = B.instance("b")
+
+    assert X.__depends_on__ == {"first": A, "rest": A, "b": B}
+    assert {name: repr(ref) for name, ref in X.__references__.items()} == {
+        "first": "<Reference tests.test_component.A(1)>",
+        "rest": "<Reference tests.test_component.A[2, 3]>",
+    }
+    assert Y.__depends_on__ == X.__depends_on__
+    assert list(Y.__references__) == ["rest", "b"]
+    assert Y.__references__["b"].key == "b"
+
+
 def test_repr(event_loop: asyncio.AbstractEventLoop) -> None:
     class A(Component):
         pass
 
     a = A(config={}, logger=logging.getLogger(__name__), loop=event_loop)
     assert repr(a) == "<tests.test_component.A()>"
+    a.key = "shard"
+    assert repr(a) == "<tests.test_component.A('shard')>"
 
 
 @pytest.mark.asyncio
@@ -94,25 +124,21 @@ async def test_setup_and_shutdown(event_loop: asyncio.AbstractEventLoop) -> None
     c = C(config={}, logger=logger, loop=event_loop)
     d = D(config={}, logger=logger, loop=event_loop)
 
-    assert not a._active.is_set()
-    assert a._released.is_set()
-    assert a.depends_on == set()
-    assert a.required_by == set()
+    assert not a._state.active
+    assert not a._state.holders
+    assert a.depends_on == ()
 
-    assert not b._active.is_set()
-    assert b._released.is_set()
-    assert b.depends_on == set()
-    assert b.required_by == set()
+    assert not b._state.active
+    assert not b._state.holders
+    assert b.depends_on == ()
 
-    assert not c._active.is_set()
-    assert c._released.is_set()
-    assert c.depends_on == set()
-    assert c.required_by == set()
+    assert not c._state.active
+    assert not c._state.holders
+    assert c.depends_on == ()
 
-    assert not d._active.is_set()
-    assert d._released.is_set()
-    assert d.depends_on == set()
-    assert d.required_by == set()
+    assert not d._state.active
+    assert not d._state.holders
+    assert d.depends_on == ()
 
     await asyncio.gather(
         a._setup({}),
@@ -122,49 +148,96 @@ async def test_setup_and_shutdown(event_loop: asyncio.AbstractEventLoop) -> None
     )
     assert setup_log in (["a", "b", "c", "d"], ["a", "c", "b", "d"])
 
-    assert a._active.is_set()
-    assert not a._released.is_set()
-    assert a.depends_on == set()
-    assert a.required_by == {b, c}
+    assert a._state.active
+    assert a._state.holders in ([b, c], [c, b])
+    assert a.depends_on == ()
 
-    assert b._active.is_set()
-    assert not b._released.is_set()
-    assert b.depends_on == {a}
-    assert b.required_by == {d}
+    assert b._state.active
+    assert b._state.holders == [d]
+    assert b.depends_on == (a,)
     assert b.a is a
 
-    assert c._active.is_set()
-    assert not c._released.is_set()
-    assert c.depends_on == {a}
-    assert c.required_by == {d}
+    assert c._state.active
+    assert c._state.holders == [d]
+    assert c.depends_on == (a,)
     assert c.a is a
 
-    assert d._active.is_set()
-    assert d._released.is_set()
-    assert d.depends_on == {b, c}
-    assert d.required_by == set()
+    assert d._state.active
+    assert not d._state.holders
+    assert d.depends_on == (b, c)
     assert d.b is b
     assert d.c is c
 
     await asyncio.gather(a._shutdown(), b._shutdown(), c._shutdown(), d._shutdown())
     assert shutdown_log in (["d", "b", "c", "a"], ["d", "c", "b", "a"])
 
-    assert not a._active.is_set()
-    assert a._released.is_set()
-    assert a.depends_on == set()
-    assert a.required_by == set()
-
-    assert not b._active.is_set()
-    assert b._released.is_set()
-    assert b.depends_on == set()
-    assert b.required_by == set()
-
-    assert not c._active.is_set()
-    assert c._released.is_set()
-    assert c.depends_on == set()
-    assert c.required_by == set()
-
-    assert not d._active.is_set()
-    assert d._released.is_set()
-    assert d.depends_on == set()
-    assert d.required_by == set()
+    assert not a._state.active
+    assert not a._state.holders
+    assert a.depends_on == ()
+
+    assert not b._state.active
+    assert not b._state.holders
+    assert b.depends_on == ()
+
+    assert not c._state.active
+    assert not c._state.holders
+    assert c.depends_on == ()
+
+    assert not d._state.active
+    assert not d._state.holders
+    assert d.depends_on == ()
+
+
+@pytest.mark.asyncio
+async def test_state() -> None:
+    state = State()
+    assert not state.active
+    assert state.refs == 0
+    assert state.depends_on == ()
+
+    await state.wait_released()
+    waiter = asyncio.ensure_future(state.wait_active())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    state.activate()
+    await waiter
+    await state.wait_active()
+
+    logger = logging.getLogger("test")
+    a = Component(config={}, logger=logger, loop=asyncio.get_event_loop())
+    b = Component(config={}, logger=logger, loop=asyncio.get_event_loop())
+    state.acquire(a)
+    state.acquire(b)
+    assert state.holders == [a, b]
+    waiter = asyncio.ensure_future(state.wait_released())
+    state.release(a)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    state.release(b)
+    await waiter
+    assert state.refs == 0
+
+    state.acquire(a)
+    waiter = asyncio.ensure_future(state.wait_released())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    state.release(b)  # not a holder
+    assert state.refs == 1
+    state.release(a)
+    await waiter
+
+    state.deactivate()
+    assert not state.active
+    waiter = asyncio.ensure_future(state.wait_active())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    waiter.cancel()
+
+
+def test_slots(event_loop: asyncio.AbstractEventLoop) -> None:
+    class A(Component):
+        __slots__ = ()
+
+    a = A(config={}, logger=logging.getLogger(__name__), loop=event_loop)
+    with pytest.raises(AttributeError):
+        a.__dict__
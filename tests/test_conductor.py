@@ -1,9 +1,24 @@
 import asyncio
+import os
+import signal
+import threading
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from logging import getLogger
 
 import pytest  # type: ignore
 
-from aioconductor import Conductor, Component, CircularDependencyError
+from aioconductor import (
+    Conductor,
+    Component,
+    CircularDependencyError,
+    ComponentError,
+    SetupError,
+    BoundedScheduler,
+    LayeredConfigPolicy,
+    Pool,
+)
 
 
 @pytest.mark.asyncio
@@ -60,34 +75,34 @@ async def test_setup_and_shutdown() -> None:
     assert a.loop is conductor.loop
     assert a.config == conductor.config_policy(A)
     assert a.logger == conductor.logging_policy(A)
-    assert a._active.is_set()
+    assert a._state.active
 
     assert b.loop is conductor.loop
     assert b.config == conductor.config_policy(B)
     assert b.logger == conductor.logging_policy(B)
-    assert b._active.is_set()
+    assert b._state.active
     assert b.a is a
 
     assert c.loop is conductor.loop
     assert c.config == conductor.config_policy(C)
     assert c.logger == conductor.logging_policy(C)
-    assert c._active.is_set()
+    assert c._state.active
     assert c.a is a
 
     assert d.loop is conductor.loop
     assert d.config == conductor.config_policy(D)
     assert d.logger == conductor.logging_policy(D)
-    assert d._active.is_set()
+    assert d._state.active
     assert d.b is b
     assert d.c is c
 
     await conductor.shutdown()
     assert shutdown_log in (["d", "b", "c", "a"], ["d", "c", "b", "a"])
 
-    assert not a._active.is_set()
-    assert not b._active.is_set()
-    assert not c._active.is_set()
-    assert not d._active.is_set()
+    assert not a._state.active
+    assert not b._state.active
+    assert not c._state.active
+    assert not d._state.active
 
 
 @pytest.mark.asyncio
@@ -122,6 +137,150 @@ async def test_circular_dependency_error() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_keyed_components() -> None:
+    log = []
+
+    class Shard(Component):
+        async def on_setup(self) -> None:
+            log.append(("setup", self.key))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", self.key))
+
+    class Users(Component):
+        shard: Shard = Shard.instance(1)
+        shards: t.Mapping[int, Shard] = Shard.pool(range(4))
+
+        async def on_setup(self) -> None:
+            log.append(("setup", "users"))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", "users"))
+
+    conductor = Conductor(
+        scheduler=BoundedScheduler(limit=2),
+        config_policy=LayeredConfigPolicy(loader=lambda: [{"pool": {"x": 1}}]),
+    )
+    users = conductor.add(Users)
+    extra = conductor.add(Shard, 10)
+    assert conductor.add(Shard, 10) is extra
+    assert conductor.add(Shard) is not extra
+    await conductor.setup()
+
+    assert isinstance(users.shards, Pool)
+    assert repr(users.shards) == (
+        "<aioconductor.pool.Pool(tests.test_conductor.Shard x 4)>"
+    )
+    assert dict(users.shards) == {
+        key: conductor.components[Shard, key] for key in range(4)
+    }
+    assert len(users.shards) == 4
+    # Pool is internal node, which is not configured by policies
+    assert users.shards.config == {}
+    assert users.shards.logger is conductor.logger
+    assert users.shard is users.shards[1]
+    assert repr(users.shard) == "<tests.test_conductor.Shard(1)>"
+    assert users.shards[1]._state.refs == 2
+    assert users.shards == users.shards != dict(users.shards)
+    assert set(log) == {("setup", key) for key in (None, 0, 1, 2, 3, 10, "users")}
+    assert log.index(("setup", "users")) > max(
+        log.index(("setup", key)) for key in range(4)
+    )
+
+    log.clear()
+    await conductor.deactivate(Shard, 10)
+    assert log == [("shutdown", 10)]
+    assert (Shard, 10) not in conductor.components
+    await conductor.deactivate(Shard, 10)
+
+    log.clear()
+    await conductor.deactivate(Users)
+    assert log[0] == ("shutdown", "users")
+    assert sorted(log[1:], key=str) == sorted(
+        [("shutdown", key) for key in range(4)], key=str
+    )
+    assert list(conductor.components) == [Shard]
+
+    log.clear()
+    shard = await conductor.activate(Shard, 5)
+    assert shard.key == 5
+    assert log == [("setup", 5)]
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_setup_error() -> None:
+    log = []
+
+    class A(Component):
+        async def on_setup(self) -> None:
+            log.append("setup A")
+
+        async def on_shutdown(self) -> None:
+            log.append("shutdown A")
+
+    class B(Component):
+        a: A
+
+        async def on_setup(self) -> None:
+            await asyncio.sleep(0.01)
+            raise ConnectionError("B")
+
+    class C(Component):
+        b: B
+
+    class D(Component):
+        async def on_setup(self) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                log.append("cancelled D")
+                raise
+
+    class E(A):
+        a: A
+
+    conductor = Conductor()
+    for component_class in (C, D, E):
+        conductor.add(component_class)
+    a, b, c, d, e = (conductor.add(cls) for cls in (A, B, C, D, E))
+
+    start = time.perf_counter()
+    with pytest.raises(SetupError) as info:
+        await conductor.setup()
+    assert time.perf_counter() - start < 1.0
+    error = info.value
+    assert list(error.errors) == [b]
+    assert isinstance(error.__cause__, ConnectionError)
+    assert error.chains == {b: (c, b)}
+    assert str(error) == (
+        "Setup failed\n"
+        "    <tests.test_conductor.C()> -> <tests.test_conductor.B()>: "
+        "ConnectionError('B')"
+    )
+    assert log == ["setup A", "setup A", "cancelled D", "shutdown A", "shutdown A"]
+    assert not conductor._setups
+    assert not any(x._state.active or x._state.refs for x in (a, b, c, d, e))
+
+    await conductor.shutdown()
+    assert len(log) == 5
+
+    # Cancelled setup leaves active components to shutdown
+    log.clear()
+    conductor = Conductor()
+    conductor.add(A)
+    conductor.add(D)
+    setup = asyncio.ensure_future(conductor.setup())
+    await asyncio.sleep(0.01)
+    setup.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await setup
+    assert list(conductor._setups) == [conductor.add(A)]
+    await conductor.shutdown()
+    assert log == ["setup A", "cancelled D", "shutdown A"]
+
+
 @pytest.mark.asyncio
 async def test_patch() -> None:
     class A(Component):
@@ -177,7 +336,7 @@ def test_run(event_loop: asyncio.AbstractEventLoop) -> None:
     assert setup_log == ["a"]
     assert run_log == ["a"]
     assert shutdown_log == ["a"]
-    assert not a._active.is_set()
+    assert not a._state.active
 
 
 def test_serve(event_loop: asyncio.AbstractEventLoop) -> None:
@@ -229,13 +388,556 @@ def test_serve(event_loop: asyncio.AbstractEventLoop) -> None:
     assert setup_log == ["a", "b"]
     assert run_log == ["a", "a", "a"]
     assert shutdown_log == ["b", "a"]
-    assert not b._active.is_set()
+    assert not b._state.active
     assert b.run_task.done()
 
 
+def test_serve_drain(event_loop: asyncio.AbstractEventLoop) -> None:
+    log = []
+
+    class A(Component):
+        async def on_setup(self) -> None:
+            self.loop.call_later(0.01, os.kill, os.getpid(), signal.SIGTERM)
+
+        async def on_shutdown(self) -> None:
+            log.append((conductor.health.draining, conductor.health.ready))
+
+    conductor = Conductor(loop=event_loop)
+    conductor.add(A)
+    conductor.serve()
+
+    assert log == [(True, False)]
+
+
+@pytest.mark.asyncio
+async def test_reload(caplog: t.Any) -> None:
+    caplog.set_level("INFO")
+    log: t.List[t.Tuple[t.Any, ...]] = []
+
+    class Logged(Component):
+        async def on_setup(self) -> None:
+            log.append(("setup", self.__class__.__name__, dict(self.config)))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", self.__class__.__name__))
+
+    class Db(Logged):
+        pass
+
+    class Cache(Logged):
+        pass
+
+    class Shard(Logged):
+        pass
+
+    class Repo(Logged):
+        db: Db
+        shards: t.Mapping[int, Shard] = Shard.pool(range(2))
+
+    class Api(Logged):
+        repo: Repo
+        cache: Cache
+
+    class Idle(Logged):
+        pass
+
+    layers = [{"db": {"dsn": "a"}, "cache": {"size": 1}}]
+    conductor = Conductor(config_policy=LayeredConfigPolicy(loader=lambda: layers))
+    api = conductor.add(Api)
+    await conductor.setup()
+    idle = conductor.add(Idle)  # not set up
+    log.clear()
+
+    assert await conductor.reload() == []
+    assert log == []
+    assert "restarted components: none" in caplog.text
+
+    layers[0] = {
+        "db": {"dsn": "b"},
+        "cache": {"size": 1},
+        "idle": {"x": 1},
+    }
+    restarted = await conductor.reload()
+    repo = api.repo
+    assert restarted == [api.repo.db, repo, api]
+    assert log == [
+        ("shutdown", "Api"),
+        ("shutdown", "Repo"),
+        ("shutdown", "Db"),
+        ("setup", "Db", {"dsn": "b"}),
+        ("setup", "Repo", {}),
+        ("setup", "Api", {}),
+    ]
+    assert api._state.active and api.cache._state.active
+    assert dict(idle.config) == {"x": 1}
+    assert not idle._state.active
+
+    layers[0] = {"db": {"dsn": "b"}, "shard": {"instances": {"1": {"db": 1}}}}
+    log.clear()
+    restarted = await conductor.reload()
+    assert [c.__class__.__name__ for c in restarted] == [
+        "Shard",
+        "Pool",
+        "Repo",
+        "Cache",
+        "Api",
+    ]
+
+    # Pending reload is cancelled on shutdown
+    layers[0] = {}
+    conductor._on_reload()
+    await asyncio.sleep(0)
+    await conductor.shutdown()
+    assert conductor._reloading is None
+
+
+def test_reload_failure(event_loop: asyncio.AbstractEventLoop, caplog: t.Any) -> None:
+    class A(Component):
+        async def on_setup(self) -> None:
+            if self.config.get("broken"):
+                raise ConnectionError()
+
+    layers: t.List[t.Dict[str, t.Any]] = [{}]
+    conductor = Conductor(
+        config_policy=LayeredConfigPolicy(loader=lambda: layers),
+        loop=event_loop,
+    )
+    a = conductor.add(A)
+    event_loop.run_until_complete(conductor.setup())
+    layers[0] = {"a": {"broken": True}}
+    conductor._on_reload()
+    conductor._on_reload()
+    assert "Reload is already in progress" in caplog.text
+    event_loop.run_forever()  # stopped by failed reload
+
+    assert conductor.health.draining
+    assert "Reload failed, stopping..." in caplog.text
+    assert not a._state.active
+    conductor._on_reload()
+    assert conductor._reloading is None
+    event_loop.run_until_complete(conductor.shutdown())
+
+
+def test_serve_reload(event_loop: asyncio.AbstractEventLoop) -> None:
+    log = []
+
+    class A(Component):
+        async def on_setup(self) -> None:
+            log.append(dict(self.config))
+            if len(log) == 1:
+                layers[0] = {"a": {"x": 2}}
+                self.loop.call_later(0.01, os.kill, os.getpid(), signal.SIGHUP)
+            else:
+                self.loop.call_later(0.01, os.kill, os.getpid(), signal.SIGTERM)
+
+    layers = [{"a": {"x": 1}}]
+    conductor = Conductor(
+        config_policy=LayeredConfigPolicy(loader=lambda: layers),
+        loop=event_loop,
+    )
+    conductor.add(A)
+    conductor.serve()
+
+    assert log == [{"x": 1}, {"x": 2}]
+
+
 def test_deprecation_warnings() -> None:
     with pytest.deprecated_call():
         Conductor(config={})
 
     with pytest.deprecated_call():
         Conductor(logger=getLogger("test"))
+
+
+def test_serve_workers(event_loop: asyncio.AbstractEventLoop, tmp_path: t.Any) -> None:
+    path = str(tmp_path / "log")
+
+    def log(*args: t.Any) -> None:
+        with open(path, "a") as f:
+            f.write(" ".join(str(arg) for arg in args) + "\n")
+
+    class Settings(Component):
+        async def on_setup(self) -> None:
+            log("setup", "settings", os.getpid())
+
+        async def on_shutdown(self) -> None:
+            log("shutdown", "settings", os.getpid())
+
+    class Socket(Component):
+        __parent_only__ = True
+
+        settings: Settings
+
+        async def on_setup(self) -> None:
+            log("setup", "socket", os.getpid())
+
+        async def on_shutdown(self) -> None:
+            log("shutdown", "socket", os.getpid())
+
+    class Worker(Component):
+        socket: Socket
+
+        async def on_setup(self) -> None:
+            log("setup", "worker", os.getpid(), self.socket.__class__.__name__)
+            os.kill(os.getppid(), signal.SIGHUP)
+            os.kill(os.getppid(), signal.SIGTERM)
+
+        async def on_shutdown(self) -> None:
+            log("shutdown", "worker", os.getpid())
+
+    conductor = Conductor(loop=event_loop)
+    conductor.add(Worker)
+    handlers = {
+        signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGHUP)
+    }
+    conductor.serve(workers=2)
+    for signum, handler in handlers.items():
+        assert signal.getsignal(signum) is handler
+
+    with open(path) as f:
+        records = [line.split() for line in f]
+    parent = str(os.getpid())
+    assert records[:2] == [
+        ["setup", "settings", parent],
+        ["setup", "socket", parent],
+    ]
+    assert records[-2:] == [
+        ["shutdown", "socket", parent],
+        ["shutdown", "settings", parent],
+    ]
+    workers = records[2:-2]
+    assert len(workers) == 4
+    pids = {record[2] for record in workers}
+    assert len(pids) == 2
+    assert parent not in pids
+    for pid in pids:
+        assert [record for record in workers if record[2] == pid] == [
+            ["setup", "worker", pid, "Socket"],
+            ["shutdown", "worker", pid],
+        ]
+
+
+def test_serve_worker(event_loop: asyncio.AbstractEventLoop) -> None:
+    log: t.List[t.Tuple[str, str, asyncio.AbstractEventLoop]] = []
+
+    class Shared(Component):
+        __parent_only__ = True
+
+        async def on_setup(self) -> None:
+            log.append(("setup", "shared", self.loop))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", "shared", self.loop))  # pragma: no cover
+
+    class Worker(Component):
+        shared: Shared
+
+        async def on_setup(self) -> None:
+            log.append(("setup", "worker", self.loop))
+            if self.config.get("x") is None:
+                # Shared component is restarted by the parent process only
+                layers[0] = {"shared": {"x": 1}, "worker": {"x": 1}}
+                self.loop.call_soon(conductor._on_reload)
+            else:
+                self.loop.call_later(0.01, self.loop.stop)
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", "worker", self.loop))
+
+    layers: t.List[t.Dict[str, t.Any]] = [{}]
+    conductor = Conductor(
+        config_policy=LayeredConfigPolicy(loader=lambda: layers),
+        loop=event_loop,
+    )
+    worker = conductor.add(Worker)
+    shared = conductor.add(Shared)
+    event_loop.run_until_complete(conductor._setup_components([shared]))
+    log.clear()
+
+    handlers = {
+        signum: signal.getsignal(signum)
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
+    }
+    mask = signal.pthread_sigmask(signal.SIG_BLOCK, set())
+    try:
+        conductor._serve_worker({shared}, mask)
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+        asyncio.set_event_loop(event_loop)
+
+    assert conductor.loop is not event_loop
+    assert conductor.loop.is_closed()
+    assert conductor.add(Shared) is shared
+    assert conductor.add(Worker) is not worker
+    loop = conductor.loop
+    assert log == [
+        ("setup", "worker", loop),
+        ("shutdown", "worker", loop),
+        ("setup", "worker", loop),
+        ("shutdown", "worker", loop),
+    ]
+    assert shared._state.active
+    assert shared.config == {}
+
+
+def test_serve_workers_failure(
+    event_loop: asyncio.AbstractEventLoop, caplog: t.Any
+) -> None:
+    class Worker(Component):
+        async def on_setup(self) -> None:
+            raise RuntimeError("Worker is broken")
+
+    conductor = Conductor(loop=event_loop)
+    conductor.add(Worker)
+    conductor.serve(workers=1)
+
+    assert "exited with status 256" in caplog.text
+
+
+def test_serve_workers_shared_failure() -> None:
+    class Shared(Component):
+        __parent_only__ = True
+
+        async def on_setup(self) -> None:
+            raise ConnectionError()
+
+    class Worker(Component):
+        shared: Shared
+
+    asyncio.set_event_loop(None)
+    conductor = Conductor()
+    conductor.add(Worker)
+    with pytest.raises(SetupError):
+        conductor.serve(workers=1)
+    assert conductor.executor is None
+    assert conductor.loop.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_activate_and_deactivate() -> None:
+    log = []
+
+    class Logged(Component):
+        async def on_setup(self) -> None:
+            log.append(("setup", self.__class__.__name__))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", self.__class__.__name__))
+
+    class A(Logged):
+        pass
+
+    class C(Logged):
+        pass
+
+    class E(Logged):
+        pass
+
+    class B(Logged):
+        a: A
+        c: C
+        e: E
+
+    class D(Logged):
+        c: C
+
+    conductor = Conductor()
+    conductor.add(A)
+    conductor.add(D)
+    await conductor.setup()
+    assert sorted(log) == [("setup", "A"), ("setup", "C"), ("setup", "D")]
+
+    log.clear()
+    b = await conductor.activate(B)
+    assert b._state.active
+    assert log == [("setup", "E"), ("setup", "B")]
+
+    log.clear()
+    await conductor.deactivate(B)
+    assert log == [("shutdown", "B"), ("shutdown", "E")]
+    assert set(conductor.components) == {A, C, D}
+    assert set(conductor.graph) == set(conductor.components.values())
+
+    log.clear()
+    await conductor.deactivate(D)
+    assert log == [("shutdown", "D"), ("shutdown", "C")]
+    assert set(conductor.components) == {A}
+
+    log.clear()
+    await conductor.deactivate(D)
+    conductor.add(B)
+    await conductor.deactivate(B)
+    assert log == []
+    assert set(conductor.components) == {A}
+
+    await conductor.shutdown()
+    assert log == [("shutdown", "A")]
+
+
+@pytest.mark.asyncio
+async def test_deactivate_waits_for_release() -> None:
+    class A(Component):
+        pass
+
+    class B(Component):
+        a: A
+
+    conductor = Conductor()
+    b = conductor.add(B)
+    a = conductor.add(A)
+    await conductor.setup()
+
+    deactivate_a = asyncio.ensure_future(conductor.deactivate(A))
+    await asyncio.sleep(0.001)
+    assert not deactivate_a.done()
+    assert a._state.active
+
+    await conductor.deactivate(B)
+    await deactivate_a
+    assert not a._state.active
+    assert not b._state.active
+    assert conductor.components == {}
+
+
+@pytest.mark.asyncio
+async def test_shutdown_timeouts(caplog: t.Any) -> None:
+    log = []
+
+    class A(Component):
+        __shutdown_timeout__ = 1.0
+
+        async def on_shutdown(self) -> None:
+            log.append("a")
+
+    class B(Component):
+        a: A
+
+        async def on_shutdown(self) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                log.append("b cancelled")
+                # Hold A a bit longer, so that its release is timed out too
+                await asyncio.sleep(0.02)
+                raise
+
+    class C(Component):
+        __shutdown_timeout__ = 0.01
+
+        a: A
+
+        async def on_shutdown(self) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                log.append("c cancelled")
+                raise
+
+    conductor = Conductor(shutdown_timeout=0.05)
+    a = conductor.add(A)
+    b = conductor.add(B)
+    c = conductor.add(C)
+    await conductor.setup()
+
+    start = conductor.loop.time()
+    await conductor.shutdown()
+    assert conductor.loop.time() - start < 0.5
+
+    assert log == ["c cancelled", "b cancelled", "a"]
+    assert not a._state.active
+    assert not b._state.active
+    assert not c._state.active
+    assert a._state.refs == 0
+    assert f"{c!r}: Shutdown is timed out and cancelled" in caplog.text
+    assert f"{b!r}: Shutdown is timed out and cancelled" in caplog.text
+    assert f"{a!r}: Release is timed out, still required by {b!r}" in caplog.text
+    assert f"Shutdown is timed out for: {c!r}, {b!r}, {a!r}" in caplog.text
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_blocking_hooks() -> None:
+    log = []
+    threads = set()
+    # Hooks pass the barrier only if all of them are run at the same time
+    barrier = threading.Barrier(4, timeout=5)
+
+    class Blocking(Component):
+        def on_setup_blocking(self) -> None:
+            threads.add(threading.get_ident())
+            barrier.wait()
+            log.append(("setup blocking", self.__class__.__name__))
+
+        async def on_setup(self) -> None:
+            log.append(("setup", self.__class__.__name__))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", self.__class__.__name__))
+
+        def on_shutdown_blocking(self) -> None:
+            log.append(("shutdown blocking", self.__class__.__name__))
+
+    class A(Blocking):
+        pass
+
+    class B(Blocking):
+        pass
+
+    class C(Blocking):
+        pass
+
+    class D(Blocking):
+        pass
+
+    conductor = Conductor(executor_workers=4)
+    for component_class in (A, B, C, D):
+        conductor.add(component_class)
+    assert conductor.executor is None
+
+    await conductor.setup()
+    executor = conductor.executor
+    assert executor is not None
+    assert len(threads) == 4
+    assert threading.get_ident() not in threads
+    a = conductor.add(A)
+    assert a.executor is executor
+    assert log.index(("setup blocking", "A")) < log.index(("setup", "A"))
+
+    await conductor.shutdown()
+    assert conductor.executor is None
+    assert a.executor is None
+    assert log.index(("shutdown", "A")) < log.index(("shutdown blocking", "A"))
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+@pytest.mark.asyncio
+async def test_process_executor() -> None:
+    class A(Component):
+        result: int
+
+        async def on_setup(self) -> None:
+            self.result = await self.run_blocking(square, 3)
+
+    conductor = Conductor(executor_factory=ProcessPoolExecutor, executor_workers=1)
+    a = conductor.add(A)
+    await conductor.setup()
+    assert a.result == 9
+    await conductor.shutdown()
+
+    class Blocking(Component):
+        def on_shutdown_blocking(self) -> None:
+            pass  # pragma: no cover
+
+    with pytest.raises(ComponentError) as info:
+        conductor.add(Blocking)
+    assert str(info.value) == (
+        "tests.test_conductor.test_process_executor.<locals>.Blocking: "
+        "Blocking hooks cannot be run in process pool executor"
+    )
+    assert Blocking not in conductor.components
@@ -1,4 +1,15 @@
-from aioconductor import Conductor, Component, Config, SimpleConfigPolicy
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import (
+    Conductor,
+    Component,
+    Config,
+    SimpleConfigPolicy,
+    LayeredConfigPolicy,
+    environ_config,
+)
 
 
 class A(Component):
@@ -18,3 +29,124 @@ def test_simple_config_policy() -> None:
 
     assert a.config is config
     assert b.config is config
+
+
+class DBConnection(Component):
+    pass
+
+
+def test_layered_config_policy() -> None:
+    policy = LayeredConfigPolicy(
+        {"a": {"x": 1, "nested": {"y": 2, "z": 3}}, "b": "not a section"},
+        {"a": {"nested": {"z": 4}}, "db_connection": {"dsn": "sqlite://"}},
+    )
+    conductor = Conductor(config_policy=policy)
+
+    a = conductor.add(A)
+    b = conductor.add(B)
+    db = conductor.add(DBConnection)
+
+    assert a.config == {"x": 1, "nested": {"y": 2, "z": 4}}
+    assert b.config == {}
+    assert db.config == {"dsn": "sqlite://"}
+    assert policy(A) is a.config
+
+    with pytest.raises(TypeError):
+        a.config["x"] = 2  # type: ignore
+    with pytest.raises(TypeError):
+        a.config["nested"]["y"] = 3
+
+
+def test_layered_config_policy_keyed() -> None:
+    policy = LayeredConfigPolicy(
+        {"a": {"x": 1, "y": 1, "instances": {"1": {"y": 2}, "2": "not a section"}}},
+        {"b": {"x": 1, "instances": "not a section"}},
+    )
+    conductor = Conductor(config_policy=policy)
+
+    assert conductor.add(A).config == {
+        "x": 1,
+        "y": 1,
+        "instances": {"1": {"y": 2}, "2": "not a section"},
+    }
+    assert conductor.add(A, 1).config == {"x": 1, "y": 2}
+    assert conductor.add(A, 2).config == {"x": 1, "y": 1}
+    assert conductor.add(B, 1).config == {"x": 1}
+    assert conductor.add(DBConnection, 1).config == {}
+    assert policy(A, 1) is conductor.add(A, 1).config
+
+    calls: t.List[Config] = []
+    policy.subscribe(A, calls.append, key=1)
+    policy.reload({"a": {"instances": {"1": {"y": 3}}}})
+    assert calls == [{"y": 3}]
+    policy.unsubscribe(A, calls.append, key=1)
+    policy.reload({})
+    assert len(calls) == 1
+
+
+def test_layered_config_policy_reload() -> None:
+    policy = LayeredConfigPolicy({"a": {"x": 1}, "b": {"x": 1}})
+    calls: t.List[t.Tuple[str, Config]] = []
+
+    def listener(config: Config) -> None:
+        calls.append(("a", config))
+
+    policy.subscribe(A, listener)
+    policy.subscribe(B, lambda config: calls.append(("b", config)))
+    policy(A)
+
+    policy.reload({"a": {"x": 1}, "b": {"x": 2}})
+    assert calls == [("b", {"x": 2})]
+
+    calls.clear()
+    policy.reload({"a": {"x": 2}}, {"b": {"x": 2}})
+    assert calls == [("a", {"x": 2})]
+    assert policy(A) == {"x": 2}
+
+    calls.clear()
+    policy.unsubscribe(A, listener)
+    policy.unsubscribe(A, listener)
+    policy.reload({})
+    assert calls == [("b", {})]
+
+
+def test_layered_config_policy_loader() -> None:
+    layers = [{"a": {"x": 1}}]
+    policy = LayeredConfigPolicy(loader=lambda: layers)
+    assert policy(A) == {"x": 1}
+
+    layers = [{"a": {"x": 2}}]
+    assert policy(A) == {"x": 1}
+    policy.refresh()
+    assert policy(A) == {"x": 2}
+
+    policy = LayeredConfigPolicy({"a": {"x": 0}}, loader=lambda: layers)
+    assert policy(A) == {"x": 0}
+    policy.refresh()
+    assert policy(A) == {"x": 2}
+
+    policy = LayeredConfigPolicy({"a": {"x": 0}})
+    policy.refresh()
+    assert policy(A) == {"x": 0}
+
+
+def test_environ_config() -> None:
+    environ = {
+        "APP__DB_CONNECTION__DSN": "sqlite://",
+        "APP__DB_CONNECTION__POOL__SIZE": "4",
+        "APP__DEBUG": "1",
+        "OTHER__DEBUG": "0",
+    }
+    assert environ_config("APP", environ) == {
+        "db_connection": {"dsn": "sqlite://", "pool": {"size": "4"}},
+        "debug": "1",
+    }
+    assert isinstance(environ_config("APP"), dict)
+
+    with pytest.raises(ValueError) as info:
+        environ_config("APP", {"APP__DB": "x", "APP__DB__HOST": "y"})
+    assert str(info.value) == "Variable APP__DB__HOST conflicts with APP__DB"
+
+    with pytest.raises(ValueError) as info:
+        environ_config("APP", {"APP__DB__HOST": "y", "APP__DB": "x"})
+    assert str(info.value) == "Variable APP__DB conflicts with APP__DB__HOST"
@@ -0,0 +1,115 @@
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, Graph, CircularDependencyError
+
+
+def test_levels() -> None:
+    dependencies = {
+        "a": {},
+        "b": {"a": "a"},
+        "c": {"a": "a"},
+        "d": {"b": "b", "c": "c"},
+        "e": {},
+    }
+    graph = Graph(["d", "e"], dependencies.__getitem__)
+
+    assert graph.levels == [["a", "e"], ["b", "c"], ["d"]]
+    assert graph.level == {"a": 0, "b": 1, "c": 1, "d": 2, "e": 0}
+    assert graph.order == ["a", "b", "c", "d", "e"]
+    assert graph.dependencies == dependencies
+    assert len(graph) == 5
+    assert list(graph) == graph.order
+    assert "a" in graph
+    assert "x" not in graph
+
+
+def test_resolve_is_called_once_per_node() -> None:
+    calls = []
+    dependencies = {"a": {}, "b": {"a": "a"}, "c": {"a": "a", "b": "b"}}
+
+    def resolve(node: str) -> dict:
+        calls.append(node)
+        return dependencies[node]
+
+    Graph(["c", "b", "a"], resolve)
+    assert sorted(calls) == ["a", "b", "c"]
+
+
+def test_circular_dependency_error() -> None:
+    dependencies = {"a": {"x": "b"}, "b": {"x": "c"}, "c": {"x": "b"}}
+
+    with pytest.raises(CircularDependencyError) as info:
+        Graph(["a"], dependencies.__getitem__)
+    assert info.value.args == ("a", "b", "c", "b")
+
+
+def test_deep_chain() -> None:
+    depth = 10000
+    graph = Graph([depth], lambda node: {"x": node - 1} if node else {})
+
+    assert graph.order == list(range(depth + 1))
+    assert len(graph.levels) == depth + 1
+
+
+@pytest.mark.asyncio
+async def test_conductor_graph_cache() -> None:
+    class A(Component):
+        pass
+
+    class B(Component):
+        a: A
+
+    class Patch(Component):
+        pass
+
+    conductor = Conductor()
+    b = conductor.add(B)
+
+    graph = conductor.graph
+    a = conductor.add(A)
+    assert conductor.graph is graph
+    assert graph.levels == [[a], [b]]
+
+    await conductor.setup()
+    assert conductor.graph is graph
+    await conductor.shutdown()
+
+    conductor.patch(A, Patch)
+    assert conductor.graph is not graph
+    patch = conductor.add(A)
+    assert isinstance(patch, Patch)
+    assert conductor.graph.dependencies[b] == {"a": patch}
+
+
+@pytest.mark.asyncio
+async def test_conductor_deep_chain() -> None:
+    classes = [type("C0", (Component,), {})]
+    for i in range(1, 1500):
+        classes.append(
+            type(f"C{i}", (Component,), {"__annotations__": {"x": classes[-1]}})
+        )
+
+    conductor = Conductor()
+    last: Component = conductor.add(classes[-1])
+    await conductor.setup()
+    assert last._state.active
+    await conductor.shutdown()
+    assert not last._state.active
+
+
+def test_closure() -> None:
+    dependencies = {
+        "a": {},
+        "b": {"a": "a"},
+        "c": {"a": "a"},
+        "d": {"b": "b", "c": "c"},
+        "e": {},
+    }
+    graph = Graph(["d", "e"], dependencies.__getitem__)
+
+    assert graph.closure(["b"]) == ["a", "b"]
+    assert graph.closure(["e", "c", "a"]) == ["e", "a", "c"]
+    assert graph.closure(["d"]) == ["a", "b", "c", "d"]
+    assert graph.dependent_closure(["b"]) == ["b", "d"]
+    assert graph.dependent_closure(["a", "e"]) == ["a", "b", "c", "d", "e"]
+    assert graph.dependent_closure([]) == []
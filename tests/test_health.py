@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+import signal
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, Health, Phase, Probe
+
+
+class A(Component):
+    pass
+
+
+class B(Component):
+    a: A
+
+
+async def request(address: t.Any, target: str) -> t.Tuple[int, t.Any]:
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address[:2])
+    writer.write(f"GET {target} HTTP/1.0\r\nHost: localhost\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    head, body = response.split(b"\r\n\r\n", 1)
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.mark.asyncio
+async def test_health() -> None:
+    conductor = Conductor()
+    health = conductor.health
+    b = conductor.add(B)
+    a = conductor.add(A)
+
+    assert health.phases == {a: Phase.PENDING, b: Phase.PENDING}
+    assert health.counts[Phase.PENDING] == 2
+    assert not health.ready
+
+    events = []
+
+    def observe(component: Component, event: t.Any) -> None:
+        events.append((component, health.phases[component]))
+
+    conductor.instruments.append(observe)  # type: ignore
+    await conductor.setup()
+    assert (a, Phase.SETTING_UP) in events
+    assert health.counts[Phase.ACTIVE] == 2
+    assert health.counts[Phase.PENDING] == 0
+    assert health.ready
+    assert health.status() == {
+        "ready": True,
+        "draining": False,
+        "counts": {
+            "pending": 0,
+            "setting_up": 0,
+            "active": 2,
+            "draining": 0,
+            "inactive": 0,
+        },
+        "components": {repr(a): "active", repr(b): "active"},
+    }
+
+    events.clear()
+    await conductor.deactivate(B)
+    assert (b, Phase.DRAINING) in events
+    assert health.phases == {a: Phase.ACTIVE}
+    assert health.ready
+    health.discard(b)
+
+    await conductor.shutdown()
+    assert health.phases == {a: Phase.INACTIVE}
+    assert health.counts[Phase.INACTIVE] == 1
+    assert not health.ready
+
+
+@pytest.mark.asyncio
+async def test_probe(tmp_path: t.Any) -> None:
+    conductor = Conductor()
+    probe_class = conductor.health.probe(port=0)
+    probe = conductor.add(probe_class)
+    a = conductor.add(A)
+    assert isinstance(probe, Probe)
+    assert probe.address is None
+
+    await conductor.setup()
+    address = probe.address
+
+    assert await request(address, "/live") == (200, {"alive": True})
+    status, body = await request(address, "/ready")
+    assert status == 200
+    assert body["ready"]
+    assert "components" not in body
+    status, body = await request(address, "/status")
+    assert status == 200
+    assert body["components"][repr(a)] == "active"
+    assert await request(address, "/unknown") == (404, {"error": "not found"})
+
+    conductor.health.draining = True
+    status, body = await request(address, "/ready")
+    assert status == 503
+    assert body["draining"]
+
+    await conductor.shutdown()
+    assert probe.address is None
+    await probe.on_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_probe_unix_socket(tmp_path: t.Any) -> None:
+    path = str(tmp_path / "probe.sock")
+    conductor = Conductor()
+    conductor.add(conductor.health.probe(path=path))
+    await conductor.setup()
+    try:
+        assert await request(path, "/live") == (200, {"alive": True})
+    finally:
+        await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_probe_unbound() -> None:
+    conductor = Conductor()
+    probe = conductor.add(Probe)
+    await conductor.setup()
+    try:
+        status, body = await request(probe.address, "/live")
+        assert status == 500
+        assert await request(probe.address, "") == (500, body)
+    finally:
+        await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_probe_read_timeout() -> None:
+    conductor = Conductor()
+    probe_class = conductor.health.probe(port=0)
+    probe_class.__read_timeout__ = 0.01
+    probe = conductor.add(probe_class)
+    await conductor.setup()
+    try:
+        reader, writer = await asyncio.open_connection(*probe.address[:2])
+        writer.write(b"GET /live HTTP/1.0\r\n")  # headers are never finished
+        assert await asyncio.wait_for(reader.read(), 1.0) == b""
+        writer.close()
+    finally:
+        await conductor.shutdown()
+
+
+def test_serve_drain_delay(event_loop: asyncio.AbstractEventLoop) -> None:
+    log: t.List[t.Tuple[str, int]] = []
+
+    class A(Component):
+        async def on_setup(self) -> None:
+            self.loop.call_later(0.01, os.kill, os.getpid(), signal.SIGTERM)
+            self.loop.call_later(0.05, self.loop.create_task, self.check())
+
+        async def check(self) -> None:
+            status, _ = await request(probe.address, "/ready")
+            log.append(("ready", status))
+
+        async def on_shutdown(self) -> None:
+            await asyncio.sleep(0.05)
+            await self.check()  # the probe is still serving
+
+    conductor = Conductor(loop=event_loop, drain_delay=0.2)
+    probe = conductor.add(conductor.health.probe(port=0))
+    conductor.add(A)
+    conductor.serve()
+
+    assert log == [("ready", 503), ("ready", 503)]
+    assert probe.address is None
+
+
+def test_drain_twice(event_loop: asyncio.AbstractEventLoop) -> None:
+    conductor = Conductor(loop=event_loop, drain_delay=10.0)
+    event_loop.call_soon(conductor._drain)
+    event_loop.call_soon(conductor._drain)
+    event_loop.run_forever()  # the second drain stops the loop immediately
+    assert conductor.health.draining
+
+
+def test_health_standalone() -> None:
+    health = Health()
+    a = A(config={}, logger=None, loop=None)  # type: ignore
+    health.add(a)
+    health.add(a)
+    assert health.counts[Phase.PENDING] == 1
+    health.discard(a)
+    health.discard(a)
+    assert health.counts[Phase.PENDING] == 0
+    assert health.ready
@@ -0,0 +1,106 @@
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, ComponentError, Lazy
+
+
+@pytest.mark.asyncio
+async def test_lazy_dependency() -> None:
+    log = []
+
+    class Logged(Component):
+        def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+            super().__init__(*args, **kwargs)
+            log.append(("init", self.__class__.__name__))
+
+        async def on_setup(self) -> None:
+            log.append(("setup", self.__class__.__name__))
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", self.__class__.__name__))
+
+    class Storage(Logged):
+        pass
+
+    class Cache(Logged):
+        __lazy__ = True
+
+        storage: Storage
+        value = 42
+
+        async def get(self) -> int:
+            return self.value
+
+    class Unused(Logged):
+        __lazy__ = True
+
+    class API(Logged):
+        cache: Cache
+        unused: Unused
+
+    conductor = Conductor()
+    api = conductor.add(API)
+    await conductor.setup()
+
+    assert log == [("init", "API"), ("setup", "API")]
+    assert isinstance(api.cache, Lazy)
+    assert repr(api.cache) == "<Lazy tests.test_lazy.Cache>"
+    with pytest.raises(ComponentError):
+        api.cache.value
+
+    assert await api.cache.get() == 42
+    cache = conductor.add(Cache)
+    storage = conductor.add(Storage)
+    assert isinstance(cache, Cache)
+    assert api.cache is cache
+    assert cache.storage is storage
+    assert api.depends_on == (cache,)
+    assert cache._state.refs == 1
+    assert log[2:] == [
+        ("init", "Cache"),
+        ("init", "Storage"),
+        ("setup", "Storage"),
+        ("setup", "Cache"),
+    ]
+    assert isinstance(api.unused, Lazy)
+
+    log.clear()
+    await conductor.shutdown()
+    assert log == [("shutdown", "API"), ("shutdown", "Cache"), ("shutdown", "Storage")]
+
+
+@pytest.mark.asyncio
+async def test_lazy_proxy() -> None:
+    class A(Component):
+        __lazy__ = True
+
+        value = 42
+
+    class B(Component):
+        a: A
+
+    conductor = Conductor()
+    proxy = conductor.add(A)
+    assert isinstance(proxy, Lazy)
+    assert A not in conductor.components
+
+    b = conductor.add(B)
+    await conductor.setup()
+    b_proxy = b.a
+    assert isinstance(b_proxy, Lazy)
+
+    a = await proxy
+    assert isinstance(a, A)
+    assert a._state.active
+    assert conductor.add(A) is a
+    assert await conductor.activate(A) is a
+    assert proxy.value == 42
+    assert a._state.refs == 0
+
+    assert b_proxy.value == 42
+    assert b.a is a
+    assert a._state.refs == 1
+
+    await conductor.shutdown()
+    assert not a._state.active
@@ -1,11 +1,22 @@
+import asyncio
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+import typing as t
 from logging import getLogger
 
+import pytest  # type: ignore
+
 from aioconductor import (
     Conductor,
     Component,
     SimpleLoggingPolicy,
     ModuleLoggingPolicy,
     ComponentLoggingPolicy,
+    QueueLoggingPolicy,
 )
 
 
@@ -45,3 +56,158 @@ def test_component_logging_policy() -> None:
 
     assert a.logger.name == "tests.test_logging.a"
     assert b.logger.name == "tests.test_logging.b"
+
+
+def test_component_logging_policy_cache() -> None:
+    policy = ComponentLoggingPolicy()
+    assert policy(A) is policy(A)
+
+    Dynamic = type("DynamicTenant", (Component,), {"__module__": __name__})
+    assert policy(Dynamic).name == "tests.test_logging.dynamic_tenant"
+    assert len(policy._loggers) == 2
+
+    del Dynamic
+    gc.collect()
+    assert len(policy._loggers) == 1
+
+
+class Recorder(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: t.List[str] = []
+        self.entered = threading.Event()
+        self.released = threading.Event()
+        self.released.set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        self.released.wait()
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def recorder() -> t.Iterator[Recorder]:
+    logger = getLogger("tests.test_logging")
+    handler = Recorder()
+    level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield handler
+    logger.setLevel(level)
+    logger.removeHandler(handler)
+
+
+def test_queue_logging_policy(
+    event_loop: asyncio.AbstractEventLoop,
+    recorder: Recorder,
+) -> None:
+    policy = QueueLoggingPolicy(batch_size=2)
+    conductor = Conductor(logging_policy=policy, loop=event_loop)
+
+    a = conductor.add(A)
+    b = conductor.add(B)
+    assert a.logger.name == "tests.test_logging"
+    assert a.logger.getEffectiveLevel() == logging.INFO
+    assert a.logger.getEffectiveLevel() == logging.INFO
+
+    event_loop.run_until_complete(policy.flush())
+
+    args = ["x"]
+    a.logger.info("%s of %s", args, a)
+    args.append("y")
+    a.logger.debug("Debug is disabled")
+    event_loop.run_until_complete(conductor.setup())
+    event_loop.run_until_complete(conductor.shutdown())
+
+    assert recorder.messages[0] == f"['x'] of {a!r}"
+    assert "Debug is disabled" not in recorder.messages
+    assert f"{a!r}: Inactive" in recorder.messages
+    assert f"{b!r}: Inactive" in recorder.messages
+    assert policy.dropped == 0
+
+    policy.close()
+    policy.close()
+    a.logger.info("Restarted")
+    event_loop.run_until_complete(policy.flush())
+    assert recorder.messages[-1] == "Restarted"
+    policy.close()
+
+
+def test_queue_logging_policy_workers(
+    event_loop: asyncio.AbstractEventLoop, tmp_path: t.Any
+) -> None:
+    class Shared(Component):
+        __parent_only__ = True
+
+        async def on_shutdown(self) -> None:
+            self.logger.info("shared shutdown")
+
+    class Worker(Component):
+        shared: Shared
+
+        async def on_setup(self) -> None:
+            os.kill(os.getppid(), signal.SIGTERM)
+
+        async def on_shutdown(self) -> None:
+            self.logger.info("worker shutdown")
+
+    class SlowHandler(logging.FileHandler):
+        def emit(self, record: logging.LogRecord) -> None:
+            time.sleep(0.01)
+            super().emit(record)
+
+    path = str(tmp_path / "log")
+    handler = SlowHandler(path)
+    logger = getLogger("tests.test_logging")
+    logger.addHandler(handler)
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    try:
+        policy = QueueLoggingPolicy()
+        conductor = Conductor(logging_policy=policy, loop=event_loop)
+        conductor.add(Worker)
+        conductor.serve(workers=1)
+        # Records of both processes are written before they exit
+        with open(path) as f:
+            messages = f.read().splitlines()
+        assert "worker shutdown" in messages
+        shared = conductor.components[Shared]
+        assert messages[-2:] == ["shared shutdown", f"{shared!r}: Inactive"]
+        policy.close()
+    finally:
+        logger.setLevel(level)
+        logger.removeHandler(handler)
+        handler.close()
+
+
+@pytest.mark.parametrize(
+    "overflow, sample, dropped",
+    [("drop", 1, 3), ("block", 1, 0), ("sample", 2, 2)],
+)
+def test_queue_logging_policy_overflow(
+    recorder: Recorder,
+    overflow: str,
+    sample: int,
+    dropped: int,
+) -> None:
+    policy = QueueLoggingPolicy(maxsize=1, overflow=overflow, sample=sample)
+    logger = policy(A)
+
+    recorder.released.clear()
+    logger.info("0")
+    recorder.entered.wait()
+    logger.info("1")
+    timer = threading.Timer(0.05, recorder.released.set)
+    timer.start()
+    for i in range(2, 5):
+        logger.info(str(i))
+    timer.join()
+    policy.close()
+
+    assert policy.dropped == dropped
+    assert len(recorder.messages) == 5 - dropped
+
+
+def test_queue_logging_policy_errors() -> None:
+    with pytest.raises(ValueError):
+        QueueLoggingPolicy(overflow="unknown")
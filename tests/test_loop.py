@@ -0,0 +1,118 @@
+import asyncio
+import sys
+import types
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component
+from aioconductor.loop import (
+    default_loop_factory,
+    uvloop_factory,
+    auto_loop_factory,
+    close_loop,
+    current_loop,
+)
+
+
+def test_loop_factories(monkeypatch: t.Any) -> None:
+    loop = default_loop_factory()
+    assert isinstance(loop, asyncio.AbstractEventLoop)
+    loop.close()
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    with pytest.raises(ImportError):
+        uvloop_factory()
+    loop = auto_loop_factory()
+    assert isinstance(loop, asyncio.AbstractEventLoop)
+    loop.close()
+
+    uvloop = types.ModuleType("uvloop")
+    uvloop.new_event_loop = lambda: "uvloop"  # type: ignore
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    assert auto_loop_factory() == "uvloop"  # type: ignore
+
+
+def test_close_loop() -> None:
+    log = []
+    loop = asyncio.new_event_loop()
+
+    async def generator() -> t.AsyncIterator[int]:
+        try:
+            yield 1
+            yield 2
+        finally:
+            log.append("generator")
+
+    async def task() -> None:
+        try:
+            async for _ in generator():
+                await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            log.append("task")
+            raise
+
+    loop.create_task(task())
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.run_until_complete(loop.run_in_executor(None, log.append, "executor"))
+    close_loop(loop)
+
+    assert loop.is_closed()
+    assert log == ["executor", "task", "generator"]
+
+    loop = asyncio.new_event_loop()
+    close_loop(loop)
+    assert loop.is_closed()
+
+
+def test_loop_factory() -> None:
+    loops = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        loops.append(loop)
+        return loop
+
+    class A(Component):
+        async def run(self) -> None:
+            pass
+
+    asyncio.set_event_loop(None)
+    conductor = Conductor(loop_factory=loop_factory)
+    assert conductor.loop is loops[0]
+    a = conductor.add(A)
+    conductor.run(a.run())
+    assert conductor.loop.is_closed()
+    assert asyncio.get_event_loop_policy()._local._loop is None  # type: ignore
+    assert current_loop() is None
+
+    # The next run gets new own loop
+    group = a.task_group
+    conductor.run(a.run())
+    assert loops[1] is not loops[0]
+    assert conductor.loop is a.loop is group.loop is loops[1]
+    assert conductor.loop.is_closed()
+    assert current_loop() is None
+
+
+def test_current_loop() -> None:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        assert current_loop() is loop
+        conductor = Conductor(loop_factory=lambda: None)  # type: ignore
+        conductor.run(asyncio.sleep(0))
+        assert conductor.loop is loop
+        assert not loop.is_closed()
+        loop.close()
+        assert current_loop() is None
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_given_loop(event_loop: asyncio.AbstractEventLoop) -> None:
+    conductor = Conductor(loop=event_loop, loop_factory=lambda: None)  # type: ignore
+    conductor.run(asyncio.sleep(0))
+    assert conductor.loop is event_loop
+    assert not event_loop.is_closed()
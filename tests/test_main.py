@@ -0,0 +1,201 @@
+import json
+import sys
+import textwrap
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor.__main__ import main
+from aioconductor.graph import strongly_connected
+
+
+APP = """
+    from aioconductor import Component
+
+
+    class Settings(Component):
+        pass
+
+
+    class Database(Component):
+        settings: Settings
+
+
+    class Queue(Component):
+        __lazy__ = True
+
+        settings: Settings
+
+
+    class Api(Component):
+        db: Database
+        queue: Queue
+
+
+    class Worker(Component):
+        db: Database
+
+
+    services = [Api, Worker]
+"""
+
+CONDUCTOR = """
+    from aioconductor import Conductor, Component
+
+    from {module} import Database, Api
+
+
+    class FakeDatabase(Component):
+        pass
+
+
+    conductor = Conductor(loop=object())
+    conductor.patch(Database, FakeDatabase)
+    conductor.add(Api)
+"""
+
+CYCLES = """
+    from aioconductor import Component
+
+
+    class A(Component):
+        pass
+
+
+    class B(Component):
+        a: A
+
+
+    class C(Component):
+        pass
+
+
+    A.__depends_on__["b"] = B
+    C.__depends_on__["c"] = C
+"""
+
+
+@pytest.fixture
+def app(tmp_path: t.Any, monkeypatch: t.Any) -> t.Iterator[t.Callable[..., str]]:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    counter = iter(range(1000))
+
+    def create(template: str, module: str = "") -> str:
+        name = f"app_{next(counter)}_{id(tmp_path)}"
+        source = textwrap.dedent(template).format(module=module)
+        (tmp_path / f"{name}.py").write_text(source)
+        return name
+
+    yield create
+    for name in [name for name in sys.modules if name.startswith("app_")]:
+        del sys.modules[name]
+
+
+def test_text(app: t.Any, capsys: t.Any) -> None:
+    module = app(APP)
+    assert main([module]) == 0
+    output = capsys.readouterr().out.splitlines()
+
+    assert output[0] == "Components: 5"
+    assert output[1] == "Levels: 3"
+    assert output[2] == "Critical path: 3"
+    assert output[3] == f"    {module}.Settings"
+    assert output[4] == f"    {module}.Database"
+    assert output[5] in (f"    {module}.Api", f"    {module}.Worker")
+    assert output[6] == "Max parallelism: 2"
+    assert output[7] == f"Level 0: {module}.Settings"
+
+
+def test_json(app: t.Any, tmp_path: t.Any) -> None:
+    module = app(APP)
+    path = str(tmp_path / "graph.json")
+    assert main([f"{module}:Worker", "--format", "json", "-o", path]) == 0
+    with open(path) as f:
+        result = json.load(f)
+
+    assert result == {
+        "components": [f"{module}.Settings", f"{module}.Database", f"{module}.Worker"],
+        "dependencies": {
+            f"{module}.Worker": {"db": f"{module}.Database"},
+            f"{module}.Database": {"settings": f"{module}.Settings"},
+            f"{module}.Settings": {},
+        },
+        "levels": [
+            [f"{module}.Settings"],
+            [f"{module}.Database"],
+            [f"{module}.Worker"],
+        ],
+        "critical_path": [
+            f"{module}.Settings",
+            f"{module}.Database",
+            f"{module}.Worker",
+        ],
+        "width": 1,
+        "cycles": [],
+    }
+
+
+def test_dot(app: t.Any, capsys: t.Any) -> None:
+    module = app(APP)
+    conductor_module = app(CONDUCTOR, module)
+    assert main([conductor_module, "-f", "dot"]) == 0
+    output = capsys.readouterr().out
+
+    assert output.startswith("digraph aioconductor {")
+    assert f'"{module}.Queue" [style=dashed];' in output
+    assert (
+        f'"{module}.Api" -> "{conductor_module}.FakeDatabase" [label="db"];'
+        in output
+    )
+    assert f'"{module}.Database"' not in output
+
+
+def test_cycles(app: t.Any, capsys: t.Any) -> None:
+    module = app(CYCLES)
+    assert main([module]) == 1
+    output = capsys.readouterr().out.splitlines()
+
+    assert output[0] == "Components: 3"
+    assert output[1] == "Circular dependencies: 2"
+    assert sorted(output[2:]) == sorted(
+        [f"    {module}.B, {module}.A", f"    {module}.C"]
+    )
+
+    assert main([module, "-f", "json"]) == 1
+    result = json.loads(capsys.readouterr().out)
+    assert result["levels"] == []
+    assert result["critical_path"] == []
+    assert result["width"] == 0
+
+
+def test_empty(app: t.Any, capsys: t.Any) -> None:
+    module = app("")
+    assert main([module]) == 0
+    assert capsys.readouterr().out.splitlines()[:4] == [
+        "Components: 0",
+        "Levels: 0",
+        "Critical path: 0",
+        "Max parallelism: 0",
+    ]
+
+
+def test_list_target(app: t.Any, capsys: t.Any) -> None:
+    module = app(APP)
+    assert main([f"{module}:services"]) == 0
+    assert capsys.readouterr().out.startswith("Components: 5\n")
+
+
+def test_invalid_target(app: t.Any) -> None:
+    module = app("x = 1\ny = [1]")
+    with pytest.raises(TypeError):
+        main([f"{module}:x"])
+    with pytest.raises(TypeError):
+        main([f"{module}:y"])
+
+
+def test_strongly_connected() -> None:
+    graph = {1: [2], 2: [3, 1], 3: [], 4: [4, 3]}
+    components = strongly_connected(
+        [1, 4], lambda node: {str(n): n for n in graph[node]}
+    )
+    assert components == [[3], [2, 1], [4]]
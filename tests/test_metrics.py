@@ -0,0 +1,158 @@
+import asyncio
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import (
+    Conductor,
+    Component,
+    Metrics,
+    Histogram,
+    Exporter,
+    Pool,
+    Profiler,
+)
+
+
+class A(Component):
+    async def on_setup(self) -> None:
+        await asyncio.sleep(0.01)
+
+
+class B(Component):
+    a: A
+
+
+def test_histogram() -> None:
+    histogram = Histogram([0.1, 1.0])
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(2.0)
+
+    assert histogram.counts == [2, 1]
+    assert histogram.count == 4
+    assert list(histogram.render("x", 'a="b"')) == [
+        'x_bucket{a="b",le="0.1"} 2',
+        'x_bucket{a="b",le="1.0"} 3',
+        'x_bucket{a="b",le="+Inf"} 4',
+        'x_sum{a="b"} 2.65',
+        'x_count{a="b"} 4',
+    ]
+    assert list(histogram.render("x"))[-2:] == ["x_sum 2.65", "x_count 4"]
+
+
+@pytest.mark.asyncio
+async def test_metrics() -> None:
+    metrics = Metrics()
+    conductor = Conductor(instruments=[metrics])
+    conductor.add(B)
+    conductor.add(A)
+    await conductor.setup()
+
+    label_a = f'component="{A.__module__}.{A.__qualname__}"'
+    label_b = f'component="{B.__module__}.{B.__qualname__}"'
+    waiting, setup, releasing, shutdown = metrics.histograms[label_a]
+    assert setup.count == 1
+    assert setup.sum >= 0.01
+    assert metrics.histograms[label_b][0].sum >= 0.01
+
+    text = metrics.render()
+    assert "# TYPE aioconductor_setup_seconds histogram" in text
+    assert f"aioconductor_setup_seconds_count{{{label_a}}} 1" in text
+    assert f"aioconductor_dependents{{{label_a}}} 1" in text
+    assert f"aioconductor_dependents{{{label_b}}} 0" in text
+    assert "aioconductor_loop_lag_seconds_count 0" in text
+
+    await conductor.shutdown()
+    assert shutdown.count == 1
+    assert releasing.count == 1
+    assert metrics.histograms[label_b][3].count == 1
+    assert "aioconductor_dependents{" not in metrics.render()
+
+
+@pytest.mark.asyncio
+async def test_metrics_keyed() -> None:
+    class Shard(Component):
+        async def on_setup(self) -> None:
+            self.spawn(asyncio.sleep(3600))
+
+    class Users(Component):
+        shards: t.Mapping[t.Any, Shard] = Shard.pool([1, 'x"y'])
+
+    metrics = Metrics()
+    profiler = Profiler()
+    conductor = Conductor(instruments=[metrics, profiler])
+    users = conductor.add(Users)
+    await conductor.setup()
+    try:
+        text = metrics.render()
+        series = [line for line in text.splitlines() if not line.startswith("#")]
+        assert len(series) == len(set(series))
+        label = f'component="{Shard.__module__}.{Shard.__qualname__}"'
+        assert f'aioconductor_tasks{{{label},key="1"}} 1' in text
+        assert f'aioconductor_tasks{{{label},key="x\\"y"}} 1' in text
+        assert "aioconductor.pool.Pool" not in text
+
+        pool = users.shards
+        assert isinstance(pool, Pool)
+        assert pool not in conductor.health.phases
+        assert pool not in profiler.timestamps
+        assert conductor.health.ready
+    finally:
+        await conductor.shutdown()
+
+
+async def get(address: t.Any, target: str) -> bytes:
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address[:2])
+    writer.write(f"GET {target} HTTP/1.0\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_exporter(tmp_path: t.Any) -> None:
+    metrics = Metrics()
+    conductor = Conductor(instruments=[metrics])
+    exporter = conductor.add(metrics.exporter(port=0, interval=0.001))
+    conductor.add(A)
+    await conductor.setup()
+    await asyncio.sleep(0.01)
+    try:
+        response = await get(exporter.address, "/metrics")
+        head, body = response.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.0 200 OK")
+        assert b"Content-Type: text/plain; version=0.0.4" in head
+        assert b"aioconductor_setup_seconds_count" in body
+        assert metrics.loop_lag.count > 0
+
+        response = await get(exporter.address, "/unknown")
+        assert response.startswith(b"HTTP/1.0 404 Not Found")
+        sampler = exporter.sampler
+        assert sampler is not None
+    finally:
+        await conductor.shutdown()
+    assert exporter.sampler is None
+    assert sampler.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_exporter_unbound(tmp_path: t.Any) -> None:
+    path = str(tmp_path / "metrics.sock")
+
+    class Unbound(Exporter):
+        __address__ = ("", None, path)
+
+    conductor = Conductor()
+    exporter = conductor.add(Unbound)
+    await conductor.setup()
+    try:
+        assert exporter.sampler is None
+        response = await get(path, "/metrics")
+        assert response.startswith(b"HTTP/1.0 404 Not Found")
+    finally:
+        await conductor.shutdown()
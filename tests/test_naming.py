@@ -7,3 +7,5 @@ def test_camelcase_to_underscore() -> None:
     assert camelcase_to_underscore("CoolXMLParser") == "cool_xml_parser"
     assert camelcase_to_underscore("MessageQueue") == "message_queue"
     assert camelcase_to_underscore("RSA512Crypt") == "rsa_512_crypt"
+    assert camelcase_to_underscore("Lower2case_Name") == "lower_2_case__name"
+    assert camelcase_to_underscore("") == ""
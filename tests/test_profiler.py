@@ -0,0 +1,94 @@
+import asyncio
+import json
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, Profiler, Event
+
+
+class A(Component):
+    async def on_setup(self) -> None:
+        await asyncio.sleep(0.02)
+
+    async def on_shutdown(self) -> None:
+        await asyncio.sleep(0.01)
+
+
+class B(Component):
+    a: A
+
+    async def on_setup(self) -> None:
+        await asyncio.sleep(0.01)
+
+    async def on_shutdown(self) -> None:
+        await asyncio.sleep(0.02)
+
+
+class C(Component):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_profiler(tmp_path: t.Any) -> None:
+    profiler = Profiler()
+    conductor = Conductor(instruments=[profiler])
+    b = conductor.add(B)
+    c = conductor.add(C)
+    a = conductor.add(A)
+
+    assert profiler.critical_path() == []
+    assert profiler.report() == ""
+    assert profiler.trace()["traceEvents"] == []
+
+    await conductor.setup()
+
+    assert list(profiler.timestamps[a]) == [
+        Event.ACQUIRING,
+        Event.SETTING_UP,
+        Event.ACTIVE,
+    ]
+    assert profiler.dependencies == {a: (), b: (a,), c: ()}
+    assert profiler.critical_path() == [a, b]
+    assert profiler.critical_path(shutdown=True) == []
+    assert profiler.durations(a)["setup"] >= 0.015
+    assert profiler.durations(b)["waiting"] >= 0.015
+    assert set(profiler.durations(c)) == {"waiting", "setup"}
+
+    await conductor.shutdown()
+
+    assert profiler.critical_path(shutdown=True) == [b, a]
+    assert profiler.durations(a)["releasing"] >= 0.015
+    assert profiler.durations(b)["shutdown"] >= 0.015
+
+    report = profiler.report().splitlines()
+    assert report[0].startswith("Setup critical path: ")
+    assert report[1:3] == [
+        f"    {a!r}  waiting {profiler.durations(a)['waiting'] * 1000:.3f} ms"
+        f"  setup {profiler.durations(a)['setup'] * 1000:.3f} ms",
+        f"    {b!r}  waiting {profiler.durations(b)['waiting'] * 1000:.3f} ms"
+        f"  setup {profiler.durations(b)['setup'] * 1000:.3f} ms",
+    ]
+    assert report[3] == "Setup by component:"
+    assert [line.split()[0] for line in report[4:7]] == [repr(a), repr(b), repr(c)]
+    assert report[7].startswith("Shutdown critical path: ")
+    assert [line.split()[0] for line in report[8:10]] == [repr(b), repr(a)]
+    assert report[10] == "Shutdown by component:"
+    assert [line.split()[0] for line in report[11:14]] == [repr(b), repr(a), repr(c)]
+
+    path = tmp_path / "trace.json"
+    profiler.dump(str(path))
+    with open(str(path)) as f:
+        trace = json.load(f)
+    assert trace == json.loads(json.dumps(profiler.trace()))
+    events = trace["traceEvents"]
+    assert len(events) == 3 * 5
+    assert events[0]["ph"] == "M"
+    assert events[0]["args"] == {"name": repr(a)}
+    assert [event["name"] for event in events[1:5]] == [
+        "waiting",
+        "setup",
+        "releasing",
+        "shutdown",
+    ]
+    assert min(event.get("ts", 1) for event in events) == 0
@@ -0,0 +1,174 @@
+import asyncio
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, BoundedScheduler
+from aioconductor.scheduler import PrioritySemaphore, PrioritySlot
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore() -> None:
+    log = []
+    semaphore = PrioritySemaphore(1)
+
+    async def worker(name: str, priority: int) -> None:
+        await semaphore.acquire(priority)
+        log.append(name)
+        await asyncio.sleep(0)
+        semaphore.release()
+
+    await semaphore.acquire()
+    assert semaphore.locked()
+    tasks = [
+        asyncio.ensure_future(worker(name, priority))
+        for name, priority in (("a", 1), ("b", 3), ("c", 2), ("d", 3))
+    ]
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.gather(*tasks)
+
+    assert log == ["b", "d", "c", "a"]
+    assert not semaphore.locked()
+
+    with pytest.raises(ValueError):
+        PrioritySemaphore(0)
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_cancellation() -> None:
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire()
+
+    waiter = asyncio.ensure_future(semaphore.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    semaphore.release()
+    assert not semaphore.locked()
+
+    await semaphore.acquire()
+    waiter = asyncio.ensure_future(semaphore.acquire())
+    await asyncio.sleep(0)
+    semaphore.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_bounded_scheduler() -> None:
+    running: t.Set[Component] = set()
+    log: t.List[t.Tuple[str, int, int]] = []
+
+    class Hooks(Component):
+        async def on_setup(self) -> None:
+            await self.run("setup")
+
+        async def on_shutdown(self) -> None:
+            await self.run("shutdown")
+
+        async def run(self, hook: str) -> None:
+            running.add(self)
+            db = sum(1 for component in running if "db" in component.__tags__)
+            log.append((hook, len(running), db))
+            await asyncio.sleep(0.001)
+            running.remove(self)
+
+    class DB1(Hooks):
+        __tags__ = ("db",)
+
+    class DB2(Hooks):
+        __tags__ = ("db",)
+
+    class DB3(Hooks):
+        __tags__ = ("db", "unknown")
+
+    class Cache(Hooks):
+        pass
+
+    class API(Hooks):
+        db1: DB1
+        db2: DB2
+        db3: DB3
+        cache: Cache
+
+    conductor = Conductor(scheduler=BoundedScheduler(limit=2, tags={"db": 1}))
+    conductor.add(API)
+    await conductor.setup()
+    await conductor.shutdown()
+
+    assert len(log) == 10
+    assert all(total <= 2 and db <= 1 for _, total, db in log)
+
+
+@pytest.mark.asyncio
+async def test_bounded_scheduler_priority() -> None:
+    log = []
+
+    class Hooks(Component):
+        async def on_setup(self) -> None:
+            log.append(("setup", self.__class__.__name__))
+            await asyncio.sleep(0)
+
+        async def on_shutdown(self) -> None:
+            log.append(("shutdown", self.__class__.__name__))
+            await asyncio.sleep(0)
+
+    class Short(Hooks):
+        pass
+
+    class Long1(Hooks):
+        pass
+
+    class Long2(Hooks):
+        long: Long1
+
+    class Long3(Hooks):
+        long: Long2
+
+    conductor = Conductor(scheduler=BoundedScheduler(limit=1))
+    conductor.add(Short)
+    conductor.add(Long3)
+    await conductor.setup()
+    await conductor.shutdown()
+
+    assert log == [
+        ("setup", "Long1"),  # it blocks the longest chain, so it goes first
+        ("setup", "Short"),  # Long2 is still waiting for Long1 to be active
+        ("setup", "Long2"),
+        ("setup", "Long3"),
+        ("shutdown", "Long3"),
+        ("shutdown", "Short"),  # Long2 is still waiting for release by Long3
+        ("shutdown", "Long2"),
+        ("shutdown", "Long1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bounded_scheduler_unprepared() -> None:
+    class A(Component):
+        pass
+
+    a = A(config={}, logger=Conductor().logger, loop=asyncio.get_event_loop())
+    scheduler = BoundedScheduler(limit=1)
+    await a._setup({}, scheduler)
+    await a._shutdown(scheduler)
+    assert not a._state.active
+
+
+@pytest.mark.asyncio
+async def test_priority_slot_cancellation() -> None:
+    tag = PrioritySemaphore(1)
+    limit = PrioritySemaphore(1)
+    await limit.acquire()
+
+    waiter = asyncio.ensure_future(PrioritySlot([tag, limit], 0).__aenter__())
+    await asyncio.sleep(0)
+    assert tag.locked()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert not tag.locked()
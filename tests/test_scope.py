@@ -0,0 +1,197 @@
+import asyncio
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import (
+    Conductor,
+    Component,
+    ComponentError,
+    CircularDependencyError,
+    Lazy,
+)
+
+
+log: t.List[t.Tuple[str, str]] = []
+
+
+class Logged(Component):
+    async def on_setup(self) -> None:
+        log.append(("setup", self.__class__.__name__))
+
+    async def on_shutdown(self) -> None:
+        log.append(("shutdown", self.__class__.__name__))
+
+
+class Database(Logged):
+    pass
+
+
+class Cache(Logged):
+    __lazy__ = True
+
+
+class Transaction(Logged):
+    __scoped__ = True
+
+    db: Database
+
+
+class UnitOfWork(Logged):
+    __scoped__ = True
+
+    tx: Transaction
+    db: Database
+    cache: Cache
+
+
+class Handler(Component):
+    uow: UnitOfWork
+    tx: Transaction
+
+
+@pytest.fixture(autouse=True)
+def reset() -> None:
+    log.clear()
+
+
+@pytest.mark.asyncio
+async def test_scope() -> None:
+    conductor = Conductor()
+    db = conductor.add(Database)
+    await conductor.setup()
+    scope = conductor.scope(Handler)
+    assert conductor.scope(Handler) is scope
+    assert repr(scope) == "<Scope tests.test_scope.Handler>"
+    assert scope.roots == (Handler,)
+    assert list(conductor.components.values()) == [db]
+
+    log.clear()
+    async with scope() as components:
+        handler = components[Handler]
+        uow = components[UnitOfWork]
+        tx = components[Transaction]
+        assert handler.uow is uow
+        assert handler.tx is tx is uow.tx
+        assert tx.db is db is uow.db
+        assert isinstance(uow.cache, Lazy)
+        assert uow._state.active
+        assert uow.config is conductor.config_policy(UnitOfWork)
+        assert uow.logger is conductor.logging_policy(UnitOfWork)
+        assert uow.executor is conductor.executor is not None
+        assert db._state.refs == 0
+    assert log == [
+        ("setup", "Transaction"),
+        ("setup", "UnitOfWork"),
+        ("shutdown", "UnitOfWork"),
+        ("shutdown", "Transaction"),
+    ]
+    assert not uow._state.active
+
+    # Entries are independent
+    async with scope() as first, scope() as second:
+        assert first[Handler] is not second[Handler]
+        assert first[Transaction].db is second[Transaction].db
+
+    await conductor.shutdown()
+    with pytest.raises(ComponentError):
+        async with scope():
+            pass  # pragma: no cover
+
+
+@pytest.mark.asyncio
+async def test_scope_patch() -> None:
+    class FakeTransaction(Transaction):
+        pass
+
+    conductor = Conductor()
+    conductor.add(Database)
+    await conductor.setup()
+    scope = conductor.scope(UnitOfWork)
+    conductor.patch(Transaction, FakeTransaction)
+    assert conductor.scope(UnitOfWork) is not scope
+    scope = conductor.scope(Transaction, UnitOfWork)
+    async with scope() as components:
+        assert isinstance(components[Transaction], FakeTransaction)
+        assert components[FakeTransaction] is components[UnitOfWork].tx
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scope_errors(caplog: t.Any) -> None:
+    class Failing(Logged):
+        __scoped__ = True
+
+        tx: Transaction
+
+        async def on_setup(self) -> None:
+            raise ConnectionError()
+
+    class Spawning(Logged):
+        __scoped__ = True
+
+        async def on_setup(self) -> None:
+            tasks.append(self.spawn(asyncio.sleep(10)))
+            raise ConnectionError()
+
+    class Sloppy(Logged):
+        __scoped__ = True
+
+        async def on_shutdown(self) -> None:
+            raise ValueError()
+
+    conductor = Conductor()
+    conductor.add(Database)
+    await conductor.setup()
+
+    log.clear()
+    with pytest.raises(ConnectionError):
+        async with conductor.scope(Failing)():
+            pass  # pragma: no cover
+    assert log == [("setup", "Transaction"), ("shutdown", "Transaction")]
+
+    tasks: t.List[asyncio.Future] = []
+    with pytest.raises(ConnectionError):
+        async with conductor.scope(Spawning)():
+            pass  # pragma: no cover
+    assert tasks[0].cancelled()
+
+    async with conductor.scope(Sloppy)():
+        pass
+    assert "Sloppy()>: Unexpected error during shutdown" in caplog.text
+
+    class A(Component):
+        __scoped__ = True
+
+        b: "B"
+
+    class B(Component):
+        __scoped__ = True
+
+        a: A
+
+    A.__depends_on__["b"] = B
+    with pytest.raises(CircularDependencyError) as info:
+        conductor.scope(A)
+    assert info.value.args == (A, B, A)
+    await conductor.shutdown()
+
+
+def test_scope_not_added() -> None:
+    class Repository(Component):
+        db: Database
+
+    conductor = Conductor()
+    with pytest.raises(ComponentError) as info:
+        conductor.scope(UnitOfWork)
+    assert str(info.value) == (
+        "tests.test_scope.Database: Component is not added to conductor"
+    )
+    assert not conductor.components
+
+    # Dependencies of added components are added with them
+    repository = conductor.add(Repository)
+    scope = conductor.scope(UnitOfWork)
+    db = conductor.components[Database]
+    assert list(conductor.components.values()) == [repository, db]
+    assert scope._parents == (db,)
@@ -0,0 +1,208 @@
+import asyncio
+import os
+import typing as t
+from types import MappingProxyType
+
+import pytest  # type: ignore
+
+from aioconductor import (
+    Conductor,
+    Component,
+    SnapshotStore,
+    SimpleConfigPolicy,
+)
+
+
+builds: t.List[Component] = []
+
+
+class Table(Component):
+    __snapshot__ = True
+
+    table: bytes
+
+    async def on_setup(self) -> None:
+        if not hasattr(self, "table"):
+            builds.append(self)
+            self.table = b"expensive " + str(self.config["size"]).encode()
+
+    def dump_snapshot(self) -> bytes:
+        return self.table
+
+    def load_snapshot(self, data: memoryview) -> None:
+        if not data.tobytes().startswith(b"expensive"):
+            raise ValueError("Invalid snapshot")
+        self.table = data.tobytes()
+
+
+class Plain(Component):
+    pass
+
+
+async def start(store: SnapshotStore, config: t.Any) -> Table:
+    conductor = Conductor(
+        config_policy=SimpleConfigPolicy(config),
+        snapshots=store,
+    )
+    table = conductor.add(Table)
+    conductor.add(Plain)
+    await conductor.setup()
+    await conductor.shutdown()
+    return table
+
+
+@pytest.fixture
+def store(tmp_path: t.Any) -> SnapshotStore:
+    builds.clear()
+    return SnapshotStore(str(tmp_path / "snapshots"), version="1")
+
+
+def files(store: SnapshotStore) -> t.List[str]:
+    return sorted(os.listdir(store.directory))
+
+
+@pytest.mark.asyncio
+async def test_snapshot(store: SnapshotStore) -> None:
+    cold = await start(store, {"size": 1})
+    assert builds == [cold]
+    [name] = files(store)
+    assert name.startswith("tests.test_snapshot.Table-")
+
+    warm = await start(store, {"size": 1})
+    assert builds == [cold]
+    assert warm.table == b"expensive 1"
+    assert files(store) == [name]
+
+    # Change of config makes snapshot stale
+    other = await start(store, {"size": 2})
+    assert builds == [cold, other]
+    assert other.table == b"expensive 2"
+    assert len(files(store)) == 1
+    assert files(store) != [name]
+
+    # So does change of version
+    store.version = "2"
+    await start(store, {"size": 2})
+    assert len(builds) == 3
+
+
+@pytest.mark.asyncio
+async def test_invalid_snapshot(store: SnapshotStore, caplog: t.Any) -> None:
+    table = await start(store, {"size": 1})
+    path = store.path(table)
+
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"X")
+    await start(store, {"size": 1})
+    assert len(builds) == 2
+
+    with open(path, "wb") as f:
+        f.write(b"short")
+    await start(store, {"size": 1})
+    assert len(builds) == 3
+
+    with open(path, "r+b") as f:
+        f.write(b"BADMAGIC")
+    await start(store, {"size": 1})
+    assert len(builds) == 4
+
+    data = b"garbage"
+    store.save(table, data)
+    await start(store, {"size": 1})
+    assert len(builds) == 5
+    assert "Snapshot is not restored" in caplog.text
+
+    await start(store, {"size": 1})
+    assert len(builds) == 5
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot(store: SnapshotStore) -> None:
+    table = await start(store, {"size": 1})
+    store.max_age = 60
+    await start(store, {"size": 1})
+    assert len(builds) == 1
+
+    os.utime(store.path(table), (0, 0))
+    await start(store, {"size": 1})
+    assert len(builds) == 2
+
+
+@pytest.mark.asyncio
+async def test_unsaved_snapshot(store: SnapshotStore, caplog: t.Any) -> None:
+    class Broken(Table):
+        def dump_snapshot(self) -> bytes:
+            raise RuntimeError("Not supported")
+
+    conductor = Conductor(
+        config_policy=SimpleConfigPolicy({"size": 1}), snapshots=store
+    )
+    conductor.add(Broken)
+    await conductor.setup()
+    await conductor.shutdown()
+    assert "Snapshot is not saved" in caplog.text
+    assert not os.path.exists(store.directory)
+
+
+@pytest.mark.asyncio
+async def test_keyed_snapshots(store: SnapshotStore) -> None:
+    class Tables(Component):
+        tables: t.Mapping[int, Table] = Table.pool(range(3))
+
+    async def start_keyed() -> t.Mapping[int, Table]:
+        conductor = Conductor(
+            config_policy=SimpleConfigPolicy({"size": 1}),
+            snapshots=store,
+        )
+        owner = conductor.add(Tables)
+        await conductor.setup()
+        await conductor.shutdown()
+        return owner.tables
+
+    await start_keyed()
+    assert len(builds) == 3
+    assert [name.split("-")[0] for name in files(store)] == [
+        "tests.test_snapshot.Table[0]",
+        "tests.test_snapshot.Table[1]",
+        "tests.test_snapshot.Table[2]",
+    ]
+    tables = await start_keyed()
+    assert len(builds) == 3
+    assert all(table.table == b"expensive 1" for table in tables.values())
+
+
+@pytest.mark.asyncio
+async def test_unserializable_config(store: SnapshotStore, caplog: t.Any) -> None:
+    await start(store, {"size": 1, "client": object()})
+    await start(store, {"size": 1, "client": object()})
+    assert len(builds) == 2
+    assert "Snapshot is not restored" in caplog.text
+    assert "Snapshot is not saved" in caplog.text
+    assert files(store) == []
+
+
+def test_store(store: SnapshotStore, tmp_path: t.Any) -> None:
+    loop = asyncio.new_event_loop()
+    config = {"a": MappingProxyType({"b": 1}), "c": [1, "2"]}
+    table = Table(config=config, logger=None, loop=loop)  # type: ignore
+    assert store.load(table) is None
+    store.discard(table)
+
+    store.save(table, b"")
+    data = store.load(table)
+    assert data is not None and data.tobytes() == b""
+
+    with pytest.raises(TypeError):
+        store.save(table, None)  # type: ignore
+    assert files(store) == [os.path.basename(store.path(table))]
+    loop.close()
+
+    table.config = {"c": object()}
+    with pytest.raises(TypeError):
+        store.path(table)
+
+    with pytest.raises(NotImplementedError):
+        Component.dump_snapshot(table)
+    with pytest.raises(NotImplementedError):
+        Component.load_snapshot(table, memoryview(b""))
@@ -0,0 +1,254 @@
+import asyncio
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, Supervisor, Strategy, SetupError
+
+
+events: t.List[str] = []
+failures: t.Dict[str, int] = {}
+
+
+class Logged(Component):
+    async def on_setup(self) -> None:
+        name = self.__class__.__name__
+        if failures.get(name):
+            failures[name] -= 1
+            raise ConnectionError(name)
+        events.append(f"setup {name}")
+
+    async def on_shutdown(self) -> None:
+        events.append(f"shutdown {self.__class__.__name__}")
+
+
+class A(Logged):
+    pass
+
+
+class B(Logged):
+    a: A
+
+
+class C(Logged):
+    b: B
+
+
+class D(Logged):
+    pass
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset() -> None:
+    events.clear()
+    failures.clear()
+
+
+async def settle(conductor: Conductor) -> None:
+    while conductor._restarts:
+        await asyncio.sleep(0)
+
+
+def test_restart_intensity() -> None:
+    clock = Clock()
+    supervisor = Supervisor(
+        max_restarts=3,
+        period=10.0,
+        backoff=0.5,
+        factor=2.0,
+        max_backoff=1.5,
+        clock=clock,
+    )
+    a, b = t.cast(Component, object()), t.cast(Component, object())
+    assert supervisor.restart(a) == 0.5
+    clock.now = 5.0
+    assert supervisor.restart(b) == 0.5
+    clock.now = 6.0
+    assert supervisor.restart(a) == 1.0
+    assert supervisor.restart(a) is None
+    clock.now = 10.0  # the first restart is out of period
+    assert supervisor.restart(a) == 1.0
+    clock.now = 20.0
+    assert supervisor.restart(a) == 0.5
+    supervisor = Supervisor(backoff=1.0, factor=10.0, max_backoff=5.0, max_restarts=5)
+    assert [supervisor.restart(a) for _ in range(3)] == [1.0, 5.0, 5.0]
+    assert Supervisor(strategy="rest_for_one").strategy is Strategy.REST_FOR_ONE  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_affected() -> None:
+    conductor = Conductor()
+    conductor.add(C)
+    conductor.add(D)
+    graph = conductor.graph
+    a, b, c, d = (conductor.components[cls] for cls in (A, B, C, D))
+
+    one_for_one = Supervisor(Strategy.ONE_FOR_ONE)
+    assert one_for_one.affected(graph, a) == [a, b, c]
+    assert one_for_one.affected(graph, b) == [b, c]
+    assert one_for_one.affected(graph, d) == [d]
+
+    rest_for_one = Supervisor(Strategy.REST_FOR_ONE)
+    order = graph.order
+    assert rest_for_one.affected(graph, b) == order[order.index(b) :]
+    assert rest_for_one.affected(graph, order[0]) == order
+
+
+@pytest.mark.asyncio
+async def test_setup_retry(caplog: t.Any) -> None:
+    failures["B"] = 2
+    conductor = Conductor(supervisor=Supervisor(backoff=0.001))
+    conductor.add(C)
+    await conductor.setup()
+    assert events == ["setup A", "setup B", "setup C"]
+    assert caplog.text.count("Setup failed, retrying") == 2
+    assert conductor.health.ready
+    await conductor.shutdown()
+    assert events[3:] == ["shutdown C", "shutdown B", "shutdown A"]
+
+    # Failed setup releases acquired dependencies
+    failures["B"] = 3
+    conductor = Conductor(supervisor=Supervisor(backoff=0.001, max_restarts=2))
+    conductor.add(B)
+    with pytest.raises(SetupError) as info:
+        await conductor.setup()
+    assert isinstance(info.value.__cause__, ConnectionError)
+    assert conductor.components[A]._state.refs == 0
+    await conductor.shutdown()
+
+    failures["A"] = 1
+    conductor = Conductor()
+    conductor.add(A)
+    with pytest.raises(SetupError):
+        await conductor.setup()
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_fail(caplog: t.Any) -> None:
+    conductor = Conductor(supervisor=Supervisor(backoff=0.001))
+    conductor.add(C)
+    conductor.add(D)
+    await conductor.setup()
+    a, b, d = (conductor.components[cls] for cls in (A, B, D))
+
+    events.clear()
+    b.fail(ConnectionError("B"))
+    b.fail(ConnectionError("B"))  # ignored, since restart is in progress
+    await settle(conductor)
+    assert events == ["shutdown C", "shutdown B", "setup B", "setup C"]
+    assert a._state.refs == 1
+    assert conductor.health.ready
+    assert "B()>: Failed" in caplog.text
+    assert "B()>: Restarting in 0.001s..." in caplog.text
+
+    conductor.supervisor = Supervisor(Strategy.REST_FOR_ONE, backoff=0.001)
+    order = conductor.graph.order
+    events.clear()
+    d.fail(ConnectionError("D"))
+    await settle(conductor)
+    assert events[-1] == "setup " + order[-1].__class__.__name__
+    assert len(events) == 2 * len(order[order.index(d) :])
+
+    await conductor.shutdown()
+    events.clear()
+    a.fail(ConnectionError("A"))  # ignored, since it is inactive
+    assert not conductor._restarts
+
+
+@pytest.mark.asyncio
+async def test_fail_inactive_rest() -> None:
+    class E(Logged):
+        pass
+
+    conductor = Conductor(supervisor=Supervisor(Strategy.REST_FOR_ONE, backoff=0.001))
+    d = conductor.add(D)
+    await conductor.setup()
+    e = conductor.add(E)  # not set up
+    assert conductor.graph.order == [d, e]
+
+    events.clear()
+    d.fail(ConnectionError("D"))
+    await settle(conductor)
+    assert events == ["shutdown D", "setup D"]
+    assert not e._state.active
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_fail_unsupervised(caplog: t.Any) -> None:
+    conductor = Conductor()
+    a = conductor.add(A)
+    await conductor.setup()
+    a.fail(ConnectionError("A"))
+    assert "A()>: Failed" in caplog.text
+    assert not conductor._restarts
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_fail_escalation(caplog: t.Any) -> None:
+    drained: t.List[bool] = []
+    conductor = Conductor(supervisor=Supervisor(max_restarts=1, backoff=0.001))
+    conductor._drain = lambda: drained.append(True)  # type: ignore
+    a = conductor.add(A)
+    await conductor.setup()
+
+    # Setup fails on restart and supervisor gives up
+    failures["A"] = 1
+    a.fail(ConnectionError("A"))
+    await settle(conductor)
+    assert drained == [True]
+    assert "A()>: Restart failed, stopping..." in caplog.text
+
+    assert a not in conductor._setups
+    await conductor.shutdown()
+
+    conductor = Conductor(supervisor=Supervisor(max_restarts=0))
+    conductor._drain = lambda: drained.append(True)  # type: ignore
+    a = conductor.add(A)
+    await conductor.setup()
+    a.fail(ConnectionError("A"))
+    await settle(conductor)
+    assert drained == [True, True]
+    assert "A()>: Restart intensity is exceeded, stopping..." in caplog.text
+
+    # Failure during draining is ignored
+    conductor.health.draining = True
+    a.fail(ConnectionError("A"))
+    assert not conductor._restarts
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_restart() -> None:
+    conductor = Conductor(supervisor=Supervisor(backoff=10.0))
+    a = conductor.add(A)
+    await conductor.setup()
+    a.fail(ConnectionError("A"))
+    await asyncio.sleep(0.01)
+    assert conductor._restarts
+    await conductor.shutdown()
+    assert not conductor._restarts
+    assert not conductor._restarting
+    assert events == ["setup A", "shutdown A"]
+
+    # Restart is cancelled while setup is waiting for retry
+    events.clear()
+    conductor = Conductor(supervisor=Supervisor(backoff=0.001, factor=10000.0))
+    a = conductor.add(A)
+    await conductor.setup()
+    failures["A"] = 1
+    a.fail(ConnectionError("A"))
+    await asyncio.sleep(0.05)
+    await conductor.shutdown()
+    assert not conductor._restarts
+    assert events == ["setup A", "shutdown A"]
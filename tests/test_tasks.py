@@ -0,0 +1,176 @@
+import asyncio
+import typing as t
+
+import pytest  # type: ignore
+
+from aioconductor import (
+    Conductor,
+    Component,
+    Metrics,
+    Profiler,
+    SetupError,
+    Supervisor,
+    TaskGroup,
+)
+from aioconductor.tasks import _Timed
+
+
+log: t.List[str] = []
+
+
+async def forever(name: str) -> None:
+    try:
+        await asyncio.sleep(3600)
+    except asyncio.CancelledError:
+        log.append(f"cancelled {name}")
+        raise
+
+
+async def busy() -> None:
+    total = 0
+    for i in range(200000):
+        total += i
+    await asyncio.sleep(3600)
+
+
+class Poller(Component):
+    async def on_setup(self) -> None:
+        self.spawn(forever("poller"), name="poller")
+        self.spawn(busy())
+
+    async def on_shutdown(self) -> None:
+        log.append(f"shutdown, live {self.task_group.live}")
+
+
+class Consumer(Component):
+    poller: Poller
+
+    async def on_setup(self) -> None:
+        log.append("setup consumer")
+        self.spawn(self.consume())
+
+    async def consume(self) -> None:
+        await asyncio.sleep(0.01)
+        raise ConnectionError()
+
+
+@pytest.fixture(autouse=True)
+def reset() -> None:
+    log.clear()
+
+
+@pytest.mark.asyncio
+async def test_tasks() -> None:
+    profiler = Profiler()
+    metrics = Metrics()
+    conductor = Conductor(instruments=[profiler, metrics])
+    poller = conductor.add(Poller)
+    await conductor.setup()
+    await asyncio.sleep(0)
+
+    tasks = poller.task_group
+    assert poller.task_group is tasks
+    assert tasks.live == tasks.spawned == 2
+    assert "poller" in {task.get_name() for task in tasks.tasks}
+    # Spawned coroutines are visible for introspection
+    task = next(task for task in tasks.tasks if task.get_name() == "poller")
+    assert "coro=<forever() running at " in repr(task)
+    assert task.get_stack()[0].f_code.co_name == "forever"
+    assert tasks.cpu_time > 0
+    assert "aioconductor_tasks{" in metrics.render()
+    assert "aioconductor_task_cpu_seconds_total{" in metrics.render()
+
+    await conductor.shutdown()
+    assert log == ["cancelled poller", "shutdown, live 0"]
+    assert tasks.stats() == {
+        "live": 0,
+        "spawned": 2,
+        "failed": 0,
+        "cpu_time": tasks.cpu_time,
+    }
+    assert list(profiler.tasks()) == [poller]
+    assert "Tasks by component:" in profiler.report()
+    assert f"{poller!r}  cpu " in profiler.report()
+
+
+@pytest.mark.asyncio
+async def test_task_failure(caplog: t.Any) -> None:
+    conductor = Conductor(supervisor=Supervisor(backoff=0.001))
+    consumer = conductor.add(Consumer)
+    await conductor.setup()
+    failed = consumer.task_group
+    while consumer.task_group is failed and not failed.failed:
+        await asyncio.sleep(0.005)
+    assert failed.failed == 1
+    assert "Consumer()>: Failed" in caplog.text
+    while conductor._restarts:
+        await asyncio.sleep(0.001)
+    assert log == ["setup consumer", "setup consumer"]
+    await conductor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_setup_failure_cancels_tasks() -> None:
+    class Failing(Component):
+        async def on_setup(self) -> None:
+            self.spawn(forever("failing"))
+            await asyncio.sleep(0)
+            raise ConnectionError()
+
+    conductor = Conductor()
+    failing = conductor.add(Failing)
+    with pytest.raises(SetupError):
+        await conductor.setup()
+    assert log == ["cancelled failing"]
+    assert failing.task_group.live == 0
+
+
+@pytest.mark.asyncio
+async def test_scoped_tasks() -> None:
+    class Job(Component):
+        async def on_setup(self) -> None:
+            self.spawn(forever("job"))
+
+    conductor = Conductor()
+    async with conductor.scope(Job)():
+        await asyncio.sleep(0)
+    assert log == ["cancelled job"]
+
+
+@pytest.mark.asyncio
+async def test_timed(event_loop: asyncio.AbstractEventLoop) -> None:
+    async def answer() -> int:
+        return 42
+
+    group = TaskGroup(event_loop)
+    assert await _Timed(answer(), group) == 42
+    coro = answer()
+    timed = _Timed(coro, group)
+    assert timed.__qualname__ == "test_timed.<locals>.answer"
+    with pytest.raises(AttributeError):
+        timed.gi_frame
+    timed.close()
+    with pytest.raises(RuntimeError):
+        coro.send(None)
+
+
+@pytest.mark.asyncio
+async def test_tasks_attribute() -> None:
+    # Names used by components for their own attributes are not taken
+    class Tasks(Component):
+        pass
+
+    class Legacy(Component):
+        tasks: Tasks
+
+    class HandRolled(Component):
+        async def on_setup(self) -> None:
+            self.tasks: t.List[asyncio.Future] = []
+
+    conductor = Conductor()
+    legacy = conductor.add(Legacy)
+    hand_rolled = conductor.add(HandRolled)
+    await conductor.setup()
+    assert isinstance(legacy.tasks, Tasks)
+    assert hand_rolled.tasks == []
+    await conductor.shutdown()
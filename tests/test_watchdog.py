@@ -0,0 +1,78 @@
+import asyncio
+import json
+import sys
+import time
+import typing as t
+from logging import getLogger
+
+import pytest  # type: ignore
+
+from aioconductor import Conductor, Component, Event, Watchdog
+from aioconductor.watchdog import UNKNOWN, Monitor
+
+
+class Blocker(Component):
+    def block(self, duration: float) -> None:
+        time.sleep(duration)
+
+
+class Other(Component):
+    pass
+
+
+def stall(duration: float) -> None:
+    time.sleep(duration)
+
+
+@pytest.mark.asyncio
+async def test_watchdog(tmp_path: t.Any, caplog: t.Any) -> None:
+    caplog.set_level("INFO")
+    path = str(tmp_path / "blocked.json")
+    watchdog = Watchdog(threshold=0.02, interval=0.005, path=path)
+    conductor = Conductor(instruments=[watchdog])
+    monitor = conductor.add(watchdog.monitor())
+    blocker = conductor.add(Blocker)
+    conductor.add(Other)
+    await conductor.setup()
+    await asyncio.sleep(0.02)
+
+    blocker.block(0.15)
+    await asyncio.sleep(0.02)
+    stall(0.1)
+    await asyncio.sleep(0.02)
+
+    # Blocked time is accounted with precision of the interval,
+    # upper bounds depend on load of the machine and are not checked
+    blocked = watchdog.blocked()
+    assert list(blocked)[:2] == ["tests.test_watchdog.Blocker", "tests.test_watchdog"]
+    assert blocked["tests.test_watchdog.Blocker"] > 0.1
+    assert blocked["tests.test_watchdog"] > 0.05
+    assert watchdog.max_lag >= 0.1
+    report = watchdog.report()
+    assert "Blocked by component:\n    tests.test_watchdog.Blocker  " in report
+
+    await conductor.shutdown()
+    assert monitor.thread is None
+    assert "Blocked by component:" in caplog.text
+    with open(path) as f:
+        dump = json.load(f)
+    assert set(dump["blocked_ms"]) == set(blocked)
+
+
+def test_owner(event_loop: asyncio.AbstractEventLoop) -> None:
+    watchdog = Watchdog()
+    assert watchdog.interval == 0.025
+    assert watchdog._owner(sys._getframe()) == UNKNOWN
+    watchdog(Blocker(config={}, logger=getLogger(), loop=event_loop), Event.ACQUIRING)
+    assert watchdog._owner(sys._getframe()) == "tests.test_watchdog.Blocker"
+    watchdog._check(time.perf_counter() + 1)  # the loop is not watched yet
+    assert watchdog.blocked() == {}
+
+
+@pytest.mark.asyncio
+async def test_unbound_monitor() -> None:
+    conductor = Conductor()
+    monitor = conductor.add(Monitor)
+    await conductor.setup()
+    await conductor.shutdown()
+    assert monitor.thread is None